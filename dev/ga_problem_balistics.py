@@ -2,7 +2,7 @@ import random
 import math
 import numpy as np
 from numpy.typing import NDArray
-from typing import Tuple, List
+from typing import Tuple
 
 from PySide6.QtCore import Qt, Slot, QPointF, QSize, QRectF
 from PySide6.QtGui import QImage, QPainter, QPainterPath, QColor, QPen, QBrush
@@ -11,9 +11,11 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, \
 
 from ga_strategy_multi_mutation import MultiMutationStrategy
 from physics_sim import PhysSim
+from umath import IntervalIndex
 from uqtwidgets import QImageViewer, create_scroll_int_value, create_radio_button_group
 from gaapp import QSolutionToSolvePanel
-from gacvm import ProblemDefinition, Domains, Parameters, GeneticAlgorithm
+from gacvm import ProblemDefinition, Parameters, GeneticAlgorithm
+from gaproblems import ballistic_problem
 
 
 from __feature__ import snake_case, true_property
@@ -62,6 +64,8 @@ class QBalisticProblem(QSolutionToSolvePanel):
         self._nb_proteges = 2
         self._batiments = []
         self._proteges = []
+        self._batiments_index = IntervalIndex(self._batiments)
+        self._proteges_index = IntervalIndex(self._proteges)
         self._width = width
         self._height = height
         self._longueur_batiment = longueur_bat
@@ -202,51 +206,9 @@ class QBalisticProblem(QSolutionToSolvePanel):
 
     @property
     def problem_definition(self) -> ProblemDefinition:
-        dimensions_values = [[0., 150.],
-                             # Force impulsion initiale (valeur arbitraire)
-                             [0., 100.],
-                             # % de la trajectoire parcouru avant la detonation (donne le temps de detonation
-                             [0., 360.],  # angle de propulsion (en degre)
-                             [0., 50.],
-                             # La force d'explosion est un % de la propulsion initiale (valeur arbitraire)
-                             [0., 180.]]  # angle de separation du spray
-
-        domains = Domains(np.array(dimensions_values), ('Force de propulsion',
-                                                                'Trajectoire parcourue en pourcentage avant la détonation',
-                                                                'Angle de propulsion',
-                                                                "Force de séparation en pourcentage de la force initiale",
-                                                                'Angle de sepération'))
-
-        def objective_fonction(chromosome: NDArray) -> float:
-            force_init = chromosome[0]
-            force_split = force_init * (chromosome[3] / 100.)
-            impacts = self._translate_from_chromosome(chromosome, False)
-            nb_target = 0
-            nb_protected = 0
-            temp = self._batiments.copy()
-            for impact in impacts[1]:
-                if self.is_pos_in_ranges(impact, self._proteges,
-                                         self._height - QBalisticProblem._building_height):
-                    nb_protected += 1
-                elif self.is_pos_in_ranges(impact, temp,
-                                           self._height - QBalisticProblem._building_height):
-                    nb_target += 1
-                    temp.pop(self.index_batiment(impact[0], temp))
-            if nb_target == 0 or nb_protected > 0:
-                return 0
-            else:
-                return (nb_target * 1000) + ((150 + (150 * 50 / 100)) - (
-                        force_init + force_split))
-
-        return ProblemDefinition(domains, objective_fonction)
-
-    @staticmethod
-    def index_batiment(posX: float, temp: List[Tuple[int, int]]) -> int:
-        i = 0
-        for batiment in temp:
-            if batiment[0] <= posX <= batiment[1]:
-                return i
-            i += 1
+        # la fonction objective évalue toute la génération à la fois (voir gaproblems.ballistic_fitness)
+        return ballistic_problem(self._batiments_index, self._proteges_index, (self._posX, self._posY), self._height,
+                                 self._gravity, self._cible_finale_y, QBalisticProblem._building_height)
 
     @property
     def default_parameters(self) -> Parameters:
@@ -265,7 +227,7 @@ class QBalisticProblem(QSolutionToSolvePanel):
         temps_split = (PhysSim.time_at_yf(
             chromo[0] * math.sin(math.radians(chromo[2])),
             self._gravity,
-            self._positionY_scroll_bar.value, 0) * chromo[1] / 100.0)
+            self._posY, 0) * chromo[1] / 100.0)
         angle_init = chromo[2]
         force_split = force_init * chromo[3] / 100.
         angle_split = chromo[4]
@@ -287,17 +249,6 @@ class QBalisticProblem(QSolutionToSolvePanel):
                                                                  angle_split,
                                                                  3, self._cible_finale_y)
 
-    @staticmethod
-    def is_pos_in_ranges(point: tuple[float, float], batiments: List[Tuple[int, int]], height: int) -> bool:
-        temp = False
-        for batiment in batiments:
-            if batiment[0] <= point[0] <= batiment[1]:
-                if point[1] > height:
-                    temp = False
-                else:
-                    temp = True
-        return temp
-
     @staticmethod
     def _draw_rectangle(painter: QPainter, rectangle: QRectF, radius: int = 0,
                         pen: QPen = Qt.NoPen,
@@ -316,6 +267,9 @@ class QBalisticProblem(QSolutionToSolvePanel):
         liste_batiments = segments[:self._nb_batiments]
 
         self._batiments, self._proteges = liste_batiments, liste_zones_protege
+        # index de recherche des bâtiments touchés, reconstruits seulement ici
+        self._batiments_index = IntervalIndex(self._batiments)
+        self._proteges_index = IntervalIndex(self._proteges)
 
     def _find_path_for_trajectory(self, traj) -> Tuple[QPainterPath, QPainterPath, QPainterPath]:
         arc_path = QPainterPath()
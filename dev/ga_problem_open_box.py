@@ -3,6 +3,7 @@ from numpy.typing import NDArray
 
 from gacvm import Domains, ProblemDefinition, Parameters, GeneticAlgorithm
 from gaapp import QSolutionToSolvePanel
+from gaproblems import open_box_volume
 
 from uqtwidgets import QImageViewer, create_scroll_real_value
 
@@ -32,6 +33,10 @@ class QOpenBoxProblemPanel(QSolutionToSolvePanel):
         # create scroll bars and layouting
         self._width_scroll_bar, width_layout = create_scroll_real_value(0.1, width, 10., 1, value_suffix = ' m')
         self._height_scroll_bar, height_layout = create_scroll_real_value(0.1, height, 10., 1, value_suffix = ' m')
+        # copies des valeurs des barres de défilement : la fonction objective 
+        # est évaluée hors du fil d'exécution de l'interface graphique
+        self._width = self._width_scroll_bar.get_real_value()
+        self._height = self._height_scroll_bar.get_real_value()
 
         param_group_box = QGroupBox('Parameters')
         param_layout = QFormLayout(param_group_box)
@@ -94,17 +99,17 @@ Fonction objective :
     @property
     def width(self) -> int:
         """Retourne la largeur de la surface rectangulaire."""
-        return self._width_scroll_bar.get_real_value()
+        return self._width
 
     @property
     def height(self) -> int:
         """Retourne la hauteur de la surface rectangulaire."""
-        return self._height_scroll_bar.get_real_value()
+        return self._height
     
     @property
     def maximum_cutout_size(self) -> float:
         """Retourne la taille maximale de la découpe."""
-        return np.minimum(self.width, self.height) / 2. # to do : très lent pour self.width et self.height, devrait être stocké dans des variables privées
+        return np.minimum(self._width, self._height) / 2.
 
     # Voici un exemple de méthode transformant un objet de cette classe en 
     # 'callable'. Ainsi, l'instance de cette classe peut être exécutée comme
@@ -113,17 +118,15 @@ Fonction objective :
     # On remarque que la méthode __call__ prend en argument le 'self' et est 
     # utilisé ainsi lors de son usage. 
     # panel = QOpenBoxProblemPanel()
-    # panel(solution)  # <<< appel de la méthode __call__ avec 'panel' en tant 
-    #                        que 'self'
-    def __call__(self, chromosome : NDArray) -> float:
-        """Retourne le volume de la boîte obtenue en fonction de la taille de la découpe."""
-        
-        cutout_size = chromosome[0]
-        
-        if not (0.0 < cutout_size < self.maximum_cutout_size): 
-            return 0.0 # la valeur recherchée est hors de la plage de recherche, elle n'est pas intéressante
-        
-        return (self.width - 2. * cutout_size) * (self.height - 2. * cutout_size) * cutout_size
+    # panel(population)  # <<< appel de la méthode __call__ avec 'panel' en 
+    #                          tant que 'self'
+    #
+    # La fonction objective est évaluée pour toute la population à la fois
+    # (FitnessMode.BY_POPULATION) : chaque opération porte sur la colonne
+    # complète des découpes plutôt que sur un seul chromosome.
+    def __call__(self, population : NDArray) -> NDArray:
+        """Retourne le volume de la boîte obtenue en fonction de la taille de la découpe, pour chaque chromosome de la population."""
+        return open_box_volume(population, self._width, self._height)
 
     @property
     def problem_definition(self) -> ProblemDefinition:
@@ -132,7 +135,7 @@ Fonction objective :
         La définition du problème inclu les domaines des chromosomes et la fonction objective.
         """
         domains = Domains(np.array([[0., self.maximum_cutout_size]]), ('Size of cutout',))
-        return ProblemDefinition(domains, self)
+        return ProblemDefinition(domains, self, ProblemDefinition.FitnessMode.BY_POPULATION)
 
     @property
     def default_parameters(self) -> Parameters:
@@ -266,5 +269,7 @@ Fonction objective :
     @Slot()
     def _update_from_configuration(self):
         """Met à jour la visualisation de la boîte en fonction de la configuration."""
+        self._width = self._width_scroll_bar.get_real_value()
+        self._height = self._height_scroll_bar.get_real_value()
         self._update_from_simulation(None)
     
\ No newline at end of file
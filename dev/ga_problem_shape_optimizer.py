@@ -1,15 +1,15 @@
-import random
 import math
 import numpy as np
 from numpy.typing import NDArray
 
 from ga_strategy_multi_mutation import MultiMutationStrategy
 from gaapp import QSolutionToSolvePanel
-from gacvm import ProblemDefinition, Domains, Parameters, GeneticAlgorithm
-from uqtgui import process_area
+from gacvm import ProblemDefinition, Parameters, GeneticAlgorithm
+from gaproblems import SHAPE_OPTIMIZER_SHAPES, ShapeDescriptor, shape_optimizer_problem
+from umath import PointGrid
 from uqtwidgets import QImageViewer, create_scroll_int_value
 
-from PySide6.QtCore import Qt, Slot, QPointF, QSize, QRectF, QRect
+from PySide6.QtCore import Qt, Slot, QPointF, QSize
 from PySide6.QtGui import QPolygonF, QTransform, QImage, QPainter, QColor, \
     QPen
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, \
@@ -25,39 +25,21 @@ class QShapeOptimizerProblemPanel(QSolutionToSolvePanel):
     _obstacle_length = 5
 
     def __init__(self, width: int = 500, height: int = 250,
-                 max_obst: int = 100,
+                 max_obst: int = 5000,
                  parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.__initialized = False
         self.__width = width
         self.__height = height
-        self.__points_list = []
         self.__current_shape = None
 
-        self.__triangle_center = QPointF(0.5, - 0.334)
-        self.__etoile_center = QPointF(0.5, - 0.5)
-        self.__u_center = QPointF(0.5, (52 / 125))
-        self.__shapes = {
-            'Triangle': QPolygonF((QPointF(0, 0) - self.__triangle_center,
-                                   QPointF(0.5, -1) - self.__triangle_center,
-                                   QPointF(1, 0) - self.__triangle_center)),
-            'Etoile': QPolygonF((QPointF(0, -0.5) - self.__etoile_center,
-                                 QPointF(0.4, -0.4) - self.__etoile_center,
-                                 QPointF(0.5, 0) - self.__etoile_center,
-                                 QPointF(0.6, -0.4) - self.__etoile_center,
-                                 QPointF(1, -0.5) - self.__etoile_center,
-                                 QPointF(0.6, -0.6) - self.__etoile_center,
-                                 QPointF(0.5, -1) - self.__etoile_center,
-                                 QPointF(0.4, -0.6) - self.__etoile_center)),
-            'The U': QPolygonF((QPointF(0, 0) - self.__u_center,
-                                QPointF(0, 1) - self.__u_center,
-                                QPointF(1, 1) - self.__u_center,
-                                QPointF(1, 0) - self.__u_center,
-                                QPointF((5 / 6), 0) - self.__u_center,
-                                QPointF((5 / 6), (5 / 6)) - self.__u_center,
-                                QPointF((1 / 6), (5 / 6)) - self.__u_center,
-                                QPointF((1 / 6), 0) - self.__u_center)),
-            }
+        self.__rng = np.random.default_rng()
+        self.__obstacles = np.empty((0, 2))
+        self.__obstacles_grid = PointGrid(self.__obstacles)
+        self.__current_shape_descriptor = None
+        # formes de base : sommets NumPy pour l'évaluation, QPolygonF pour l'affichage
+        self.__shapes = {name : QPolygonF([QPointF(x, y) for x, y in points])
+                         for name, points in SHAPE_OPTIMIZER_SHAPES.items()}
 
         # Création des widgets et du layout global
         self._canvas_value = QLabel(f"{self.__width} x {self.__height}")
@@ -95,16 +77,17 @@ class QShapeOptimizerProblemPanel(QSolutionToSolvePanel):
 
     @Slot()
     def __set_obstacle_count(self, count: int) -> None:
-        self.__points_list.clear()
-        for _ in range(count):
-            self.__points_list.append(self.get_random_2D_point(self.__width,
-                                                               self.__height))
+        self.__obstacles = self.__rng.integers((0, 0), (self.__width, self.__height), (count, 2), endpoint=True).astype(np.float64)
+        # index spatial des obstacles, reconstruit seulement lorsque les obstacles changent
+        self.__obstacles_grid = PointGrid(self.__obstacles)
         if self.__initialized:
             self._update_from_simulation(None)
 
     @Slot()
     def __set_current_shape(self, choice: str) -> None:
         self.__current_shape = self.__shapes[choice]
+        # invariants de la forme (sommets, aire, rayon englobant), calculés une seule fois par forme choisie
+        self.__current_shape_descriptor = ShapeDescriptor(SHAPE_OPTIMIZER_SHAPES[choice])
         if self.__initialized:
             self._update_from_simulation(None)
 
@@ -122,7 +105,7 @@ class QShapeOptimizerProblemPanel(QSolutionToSolvePanel):
 
 Données initiales du problème :
 -	Zone de recherche : donnée à même le constructeur par les arguments ‘width’ et ‘height
--	La quantité d’obstacles, déterminée par une barre de défilement allant de 1 à 100
+-	La quantité d’obstacles, déterminée par une barre de défilement allant de 1 à 5000
 -	La forme de base, déterminée par une liste déroulante avec les choix suivants : triangle, étoile à quatre points et lettre U.
 Dimensions du problème :
 -	D = 4
@@ -141,39 +124,8 @@ Rétroaction proposée :
 
     @property
     def problem_definition(self) -> ProblemDefinition:
-        dimensions_values = [[0, self.__width],
-                             [0, self.__height],
-                             [0, 360],
-                             [1.0, min(self.__width, self.__height)]]
-        domains = Domains(np.array(dimensions_values), (
-            'Translation en X', 'Translation en Y', 'Rotation', 'Homéothétie'))
-
-        def objective_fonction(chromosome: NDArray) -> float:
-            evolved_shape = self.transform_shape(self.__current_shape,
-                                                 chromosome)
-
-            if self.contains(evolved_shape, self.__points_list):
-                return 0
-            elif self.contains(QRectF(0, 0, self.__width, self.__height),
-                               [evolved_shape.bounding_rect()]):
-                return process_area(
-                    evolved_shape) / self.__width * self.__height * 10000
-            else:
-                return 0
-
-        return ProblemDefinition(domains, objective_fonction)
-
-    @staticmethod
-    def contains(container: QPolygonF | QRectF,
-                 contained: list[QPointF | QRect]) -> bool:
-        if isinstance(container, QPolygonF):
-            for c in contained:
-                if container.contains_point(c, Qt.OddEvenFill):
-                    return True
-        else:
-            if container.contains(contained[0]):
-                return True
-        return False
+        # la fonction objective évalue toute la population à la fois, sans objet Qt (voir gaproblems.shape_optimizer_fitness)
+        return shape_optimizer_problem(self.__current_shape_descriptor, self.__obstacles_grid, self.__width, self.__height)
 
     @property
     def default_parameters(self) -> Parameters:
@@ -184,15 +136,9 @@ Rétroaction proposée :
         engine_parameters.population_size = 50
         engine_parameters.elitism_rate = 0.2
         engine_parameters.mutation_rate = 0.30
+        engine_parameters.fitness_cache_size = 1000
         return engine_parameters
 
-    @staticmethod
-    def get_random_2D_point(max_x: int, max_y: int, min_x: int = 0,
-                            min_y: int = 0) -> QPointF:
-        x = random.randint(min_x, max_x)
-        y = random.randint(min_y, max_y)
-        return QPointF(x, y)
-
     @staticmethod
     def transform_shape(shape: QPolygonF,
                         transformations: NDArray) -> QPolygonF:
@@ -217,8 +163,8 @@ Rétroaction proposée :
         painter.save()
         painter.set_pen(Qt.NoPen)
         painter.set_brush(QShapeOptimizerProblemPanel._obstacle_color)
-        for obstacle in self.__points_list:
-            painter.draw_ellipse(obstacle.x(), obstacle.y(),
+        for x, y in self.__obstacles:
+            painter.draw_ellipse(x, y,
                                  QShapeOptimizerProblemPanel._obstacle_length,
                                  QShapeOptimizerProblemPanel._obstacle_length)
         painter.restore()
@@ -3,6 +3,7 @@ from numpy.typing import NDArray
 
 from gacvm import Domains, ProblemDefinition, Parameters, GeneticAlgorithm
 from gaapp import QSolutionToSolvePanel
+from gaproblems import unknown_number_distance
 
 from uqtwidgets import QImageViewer, create_scroll_real_value
 from umath import clamp
@@ -145,24 +146,19 @@ Fonction objective :
         # variables locales d'un contexte pour les utiliser ultérieurement et,
         # dans ce cas-ci, dans une fonction imbriquée. C'est un sujet plus 
         # avancé qui sera abordé à la prochaine session.
-        def objective_fonction(chromosome : NDArray) -> float: # fonction objective
-            """Évalue un chromosome. 
+        def objective_fonction(population : NDArray) -> NDArray: # fonction objective
+            """Évalue toute la population à la fois. 
             
-            La fonction de fitness est la distance entre la valeur recherchée et le
-            chromosome. Puisque la fonction objective doit être maximisée, vers le 
-            maximum, la distance est inversée en fonction de ladistance maximale 
-            possible.
+            La fonction de fitness est la distance entre la valeur recherchée et 
+            chaque chromosome. Puisque la fonction objective doit être maximisée, 
+            vers le maximum, la distance est inversée en fonction de la distance 
+            maximale possible.
             """
-            unknown_value = self.unknown_value
-            if not (self._min_value <= unknown_value <= self._max_value):
-                return 0.0 # la valeur recherchée est hors de la plage de recherche, elle n'est pas intéressante
-            
-            maximum_distance = max(abs(self._min_value - unknown_value), abs(self._max_value - unknown_value))
-            current_value_estimation = chromosome[0]
-            return max(0., maximum_distance - abs(unknown_value - current_value_estimation))        
+            return unknown_number_distance(population, self._min_value, unknown_value, self._max_value)
         
+        unknown_value = self.unknown_value # capturée par la fermeture, lue une seule fois dans le fil d'exécution de l'interface graphique
         domains = Domains(np.array([[self._min_value, self._max_value]]), ('Valeur recherchée',))
-        return ProblemDefinition(domains, objective_fonction)
+        return ProblemDefinition(domains, objective_fonction, ProblemDefinition.FitnessMode.BY_POPULATION)
 
     @property
     def default_parameters(self) -> Parameters: # note : override
@@ -1,4 +1,3 @@
-
 import numpy as np
 from numpy.typing import NDArray
 
@@ -15,8 +14,5 @@ class GenesMutationStrategy(MutationStrategy):
         super().__init__('Mutate All Genes')
 
     def mutate(self, offsprings : NDArray, mutation_rate : float, domains : Domains) -> None:
-        def do_mutation(offspring, mutation_rate, domains):
-            if self._rng.random() <= mutation_rate:
-                offspring[:] = domains.random_values()
-        
-        np.apply_along_axis(do_mutation, 1, offsprings, mutation_rate, domains)
\ No newline at end of file
+        mutated = np.flatnonzero(self._rng.random(offsprings.shape[0]) <= mutation_rate)
+        offsprings[mutated] = domains.random_population(mutated.size, self._rng)
\ No newline at end of file
@@ -1,5 +1,4 @@
 import numpy as np
-import random
 
 from gacvm import MutationStrategy, Domains
 
@@ -42,14 +41,17 @@ class MultiMutationStrategy(MutationStrategy):
 
     def mutate(self, offsprings: np.ndarray, mutation_rate: float,
                domains: Domains) -> None:
-        def do_mutation(offspring, mutation_rate, domains):
-            if self._rng.random() <= mutation_rate:
-                nb_index = random.randint(1, domains.dimension)
-                mutation_mask = np.zeros(domains.dimension, dtype=bool)
-                mutation_indices = self._rng.choice(domains.dimension,
-                                                    nb_index, replace=False)
-                mutation_mask[mutation_indices] = True
-                new_values = domains.random_values()
-                offspring[mutation_mask] = new_values[mutation_mask]
-
-        np.apply_along_axis(do_mutation, 1, offsprings, mutation_rate, domains)
+        mutated = np.flatnonzero(
+            self._rng.random(offsprings.shape[0]) <= mutation_rate)
+        # Pour chaque progéniture mutée, on tire le nombre de gènes à muter
+        # (1 à n) puis une permutation aléatoire des gènes : les gènes dont le
+        # rang est inférieur à ce nombre sont mutés.
+        nb_index = self._rng.integers(1, domains.dimension, mutated.size,
+                                      endpoint=True)
+        ranks = np.argsort(np.argsort(
+            self._rng.random((mutated.size, domains.dimension)), axis=1),
+            axis=1)
+        mutation_mask = ranks < nb_index[:, np.newaxis]
+        new_values = domains.random_population(mutated.size, self._rng)
+        offsprings[mutated] = np.where(mutation_mask, new_values,
+                                       offsprings[mutated])
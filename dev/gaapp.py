@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from gacvm import GeneticAlgorithm, Observer, ProblemDefinition, Parameters
 from gacvm import SelectionStrategy, CrossoverStrategy, MutationStrategy
 from gacvm import RouletteWheelSelectionStrategy, WeightedAverageCrossoverStrategy, GeneMutationStrategy
@@ -7,8 +9,8 @@ from gacvm import RouletteWheelSelectionStrategy, WeightedAverageCrossoverStrate
 import uqtwidgets
 
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
-from PySide6.QtCore import Qt, QObject, Signal, Slot, QPointF, QMargins, QSignalBlocker
-from PySide6.QtWidgets import  (QApplication, QMainWindow, QWidget,
+from PySide6.QtCore import Qt, QObject, QThread, QTimer, QElapsedTimer, Signal, Slot, QPointF, QMargins, QSignalBlocker
+from PySide6.QtWidgets import  (QMainWindow, QWidget,
                                 QLabel, QComboBox, QPushButton, QPlainTextEdit, QCheckBox,
                                 QGroupBox, QSplitter, QTabWidget,
                                 QGridLayout, QHBoxLayout, QVBoxLayout, QFormLayout, QSizePolicy,
@@ -118,6 +120,8 @@ class QSolutionToSolvePanel(QWidget): # to do : should inherit from ABC : see ht
     def _update_from_simulation(self, ga : GeneticAlgorithm | None) -> None:
         '''
         Fonction utilitaire permettant de donner du 'feedback' pour chaque pas de simulation. Il faut gérer le cas où ga est None. Lorsque ga est None, on donne un feedback d'initialisation sans aucune évolution.
+
+        Pendant l'évolution, ga est un instantané de la dernière époque (voir QGAAdapter.Snapshot) offrant les mêmes propriétés de lecture que GeneticAlgorithm (population, population_fitness, history, current_epoch, ...).
         '''
         raise NotImplementedError()
 
@@ -176,21 +180,38 @@ class QGAAdapter(QObject):
         reseted: Signal émis lors de la réinitialisation de l'algorithme avec de nouveaux paramètres ou une nouvelle définition de problème.
 
     Propriétés:
-        parameters: Accès en lecture/écriture aux paramètres de l'algorithme génétique.
-        problem_definition: Accès en lecture/écriture à la définition du problème pour l'algorithme génétique.
+        parameters: Accès en lecture/écriture aux paramètres de l'algorithme génétique (écriture refusée pendant l'évolution).
+        problem_definition: Accès en lecture/écriture à la définition du problème pour l'algorithme génétique (écriture refusée pendant l'évolution).
         state: Accès en lecture à l'état courant de l'algorithme génétique.
+        is_stopping: Accès en lecture à l'indicateur d'arrêt demandé mais pas encore terminé par le fil d'exécution de travail.
+        snapshot: Accès en lecture à l'instantané de la dernière époque évoluée (None avant la première époque).
+        refresh_rate: Accès en lecture et écriture au nombre maximal de rafraîchissements par seconde (0 : à chaque époque).
         has_evolved: Accès en lecture à l'indicateur de progression de l'algorithme génétique.
 
     Méthodes Publiques:
-        evolve(): Lance le processus d'évolution de l'algorithme génétique.
+        evolve(): Lance le processus d'évolution de l'algorithme génétique dans un fil d'exécution de travail (non bloquant).
         evolve_one_step(): Effectue une seule itération d'évolution de l'algorithme génétique.
         stop(): Arrête l'exécution de l'algorithme génétique.
         pause(): Met en pause l'exécution de l'algorithme génétique.
         resume(): Reprend l'exécution de l'algorithme génétique après une pause.
+        shutdown(): Arrête l'évolution et termine le fil d'exécution de travail.
         reset(default_parameters, problem_definition): Réinitialise l'algorithme avec de nouveaux paramètres et une nouvelle définition du problème.
 
     Sous-classes:
+        Snapshot: Copie de la population et de l'état d'une époque, lisible sans risque par l'interface graphique.
         _SignalEmitter: Classe interne servant de pont entre les mises à jour de l'algorithme génétique et les signaux Qt.
+        _Worker: Classe interne exécutant l'évolution dans le fil d'exécution de travail.
+
+    L'évolution est exécutée dans un QThread dédié afin de ne jamais bloquer l'interface graphique. 
+    Tous les signaux publics sont émis dans le fil d'exécution de l'interface graphique. Les 
+    matrices de population du moteur sont réutilisées et réordonnées à chaque époque par le fil 
+    de travail : l'interface lit plutôt l'instantané copié à la fin de chaque époque. L'évolution 
+    n'est terminée (et une nouvelle évolution ou un changement de configuration n'est permis) 
+    qu'une fois le signal 'ended' émis, même après un arrêt.
+
+    Le signal 'evolved' est limité à 'refresh_rate' émissions par seconde : les époques 
+    intermédiaires sont regroupées et l'instantané affiché date d'au plus un intervalle de 
+    rafraîchissement. Une dernière émission a lieu à la fin de l'évolution.
     """
 
     started = Signal()
@@ -198,27 +219,85 @@ class QGAAdapter(QObject):
     evolved = Signal()
     reseted = Signal()
 
+    _evolve_requested = Signal()
+    _epoch_evolved = Signal()
+
+    class Snapshot:
+        # Copie, faite par le fil d'exécution de l'évolution à la fin d'une époque, de ce que 
+        # l'interface graphique lit du moteur. L'historique est figé aux époques déjà écrites.
+        def __init__(self, engine):
+            self.population = engine.population.copy()
+            self.population_fitness = engine.population_fitness.copy()
+            self.current_epoch = engine.current_epoch
+            self.history = engine.history._frozen()
+            self.parameters = engine.parameters
+            self.problem_definition = engine.problem_definition
+
     class _SignalEmitter(Observer):
+        # Appelé à chaque époque par le fil d'exécution de l'évolution. Le 
+        # signal est transmis au fil de l'interface graphique par une 
+        # connexion en file (Qt.QueuedConnection). Une seule notification, 
+        # et donc un seul instantané, est en attente à la fois : l'instantané 
+        # n'est construit que lorsque l'interface a affiché le précédent, ce 
+        # qui limite aussi les copies au taux de rafraîchissement.
         def __init__(self, adapter):
             super().__init__()
             self._adapter = adapter
 
         def update(self, engine):
-            if self._adapter.state != GeneticAlgorithm.State.PAUSED: # prevent useless update if paused
-                self._adapter.evolved.emit()
-            QApplication.process_events() # monothread simplification -> should be multithreaded or, at least, managed with Qt's signal
+            if self._adapter._stop_requested:
+                engine.stop()
+            if not self._adapter._epoch_pending:
+                self._adapter._snapshot = QGAAdapter.Snapshot(engine)
+                self._adapter._epoch_pending = True
+                self._adapter._epoch_evolved.emit()
+
+    class _Worker(QObject):
+        # Exécute l'évolution dans le fil d'exécution auquel il est associé.
+        finished = Signal()
+
+        def __init__(self, genetic_algorithm):
+            super().__init__()
+            self._genetic_algorithm = genetic_algorithm
+
+        @Slot()
+        def run(self):
+            try:
+                self._genetic_algorithm.evolve()
+            finally:
+                self.finished.emit()
 
     def __init__(self) -> None:
         super().__init__()
         self.genetic_algorithm = GeneticAlgorithm()
         self.genetic_algorithm.add_observer(QGAAdapter._SignalEmitter(self))
 
+        self._evolving = False
+        self._stop_requested = False
+        self._epoch_pending = False
+        self._snapshot = None
+
+        self._refresh_rate = 30
+        self._refresh_elapsed = QElapsedTimer()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.single_shot = True
+        self._refresh_timer.timeout.connect(self._refresh)
+
+        self._thread = QThread()
+        self._worker = QGAAdapter._Worker(self.genetic_algorithm)
+        self._worker.move_to_thread(self._thread)
+        self._evolve_requested.connect(self._worker.run, Qt.QueuedConnection)
+        self._worker.finished.connect(self._evolution_finished, Qt.QueuedConnection)
+        self._epoch_evolved.connect(self._evolution_updated, Qt.QueuedConnection)
+        self._thread.start()
+
     @property
     def parameters(self) -> Parameters:
         return self.genetic_algorithm.parameters
 
     @parameters.setter
     def parameters(self, value : Parameters) -> None:
+        self._ensure_not_evolving('parameters')
         self.genetic_algorithm.parameters = value
 
     @property
@@ -227,25 +306,69 @@ class QGAAdapter(QObject):
 
     @problem_definition.setter
     def problem_definition(self, value : ProblemDefinition) -> None:
+        self._ensure_not_evolving('problem_definition')
         self.genetic_algorithm.problem_definition = value
 
+    def _ensure_not_evolving(self, name : str) -> None:
+        # le moteur (et ses matrices) est utilisé par le fil d'exécution de travail jusqu'au signal 'ended'
+        if self._evolving:
+            raise RuntimeError(f'Invalid operation in QGAAdapter.{name} : the evolution is still running.')
+
     @property
     def state(self) -> GeneticAlgorithm.State:
-        return self.genetic_algorithm.state
+        state = self.genetic_algorithm.state
+        if self._evolving and not self._stop_requested and state is GeneticAlgorithm.State.IDLE:
+            return GeneticAlgorithm.State.RUNNING # l'évolution est demandée mais le fil d'exécution ne l'a pas encore démarrée
+        return state
+
+    @property
+    def is_stopping(self) -> bool:
+        # l'arrêt est demandé (l'état est IDLE) mais le fil d'exécution termine encore son époque
+        return self._evolving and self._stop_requested
+
+    @property
+    def snapshot(self) -> 'QGAAdapter.Snapshot | None':
+        return self._snapshot
     
     @property
     def has_evolved(self) -> bool:
         return self.genetic_algorithm.has_evolved
 
+    @property
+    def refresh_rate(self) -> int:
+        return self._refresh_rate
+
+    @refresh_rate.setter
+    def refresh_rate(self, value : int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise ValueError('Invalid input parameters in QGAAdapter.refresh_rate : value must be a non negative integer.')
+        self._refresh_rate = value
+
+    @property
+    def is_evolving(self) -> bool:
+        return self._evolving
+
     def evolve(self) -> None:
+        """Lance l'évolution dans le fil d'exécution de travail et retourne immédiatement.
+        
+        Le signal 'ended' est émis lorsque l'évolution est terminée."""
+        if self._evolving:
+            return
+        self._evolving = True
+        self._stop_requested = False
+        self._epoch_pending = False
+        self._snapshot = None
         self.started.emit()
-        self.genetic_algorithm.evolve()
-        self.ended.emit()
+        self._evolve_requested.emit()
         
     def evolve_one_step(self) -> None:
+        if self._evolving:
+            return
         self.genetic_algorithm.evolve_one()
 
     def stop(self) -> None:
+        if self._evolving:
+            self._stop_requested = True
         self.genetic_algorithm.stop()
 
     def pause(self) -> None:
@@ -254,10 +377,53 @@ class QGAAdapter(QObject):
     def resume(self) -> None:
         self.genetic_algorithm.resume()
 
+    def shutdown(self) -> None:
+        """Arrête l'évolution en cours et termine le fil d'exécution de travail."""
+        self.stop()
+        self._thread.quit()
+        self._thread.wait()
+
+    @Slot()
+    def _evolution_updated(self) -> None:
+        # L'instantané reçu reste en attente (_epoch_pending) jusqu'à son affichage : d'ici là, le 
+        # fil de travail n'en construit pas d'autre.
+        if self.genetic_algorithm.state is GeneticAlgorithm.State.PAUSED: # prevent useless update if paused
+            self._epoch_pending = False
+            return
+        if self._refresh_rate == 0:
+            self._epoch_pending = False
+            self.evolved.emit()
+            return
+        interval = 1000 // self._refresh_rate
+        elapsed = self._refresh_elapsed.elapsed() if self._refresh_elapsed.is_valid() else interval
+        if elapsed >= interval:
+            self._refresh()
+        else:
+            self._refresh_timer.start(interval - elapsed)
+
+    @Slot()
+    def _refresh(self) -> None:
+        self._epoch_pending = False
+        self._refresh_elapsed.start()
+        self.evolved.emit()
+
+    @Slot()
+    def _evolution_finished(self) -> None:
+        self._refresh_timer.stop()
+        self._refresh_elapsed.invalidate()
+        self._evolving = False
+        self._stop_requested = False
+        if self.genetic_algorithm.current_epoch > 0: # le fil de travail a terminé : le moteur peut être lu directement
+            self._snapshot = QGAAdapter.Snapshot(self.genetic_algorithm)
+        self.evolved.emit() # dernière mise à jour : l'interface affiche la dernière époque
+        self.ended.emit()
+
     def reset(self, default_parameters : Parameters, problem_definition : ProblemDefinition) -> None:
+        self._ensure_not_evolving('reset')
         self.parameters = default_parameters
         self.problem_definition = problem_definition
         self.genetic_algorithm.reset()
+        self._snapshot = None
         self.reseted.emit()
 
 
@@ -310,6 +476,9 @@ class QGAControlWidget(QGroupBox):
         self._current_state_label.alignment = Qt.AlignCenter
         self._current_epoch_label = QLabel()
         self._current_epoch_label.alignment = Qt.AlignCenter
+        self._refresh_rate_widget, refresh_rate_layout = uqtwidgets.create_scroll_int_value(0, self._ga_adapter.refresh_rate, 120, value_suffix=' Hz')
+        refresh_rate_title = QLabel('Refresh rate')
+        refresh_rate_title.tool_tip = 'Maximum number of display refreshes per second during the evolution.\nThe latest epoch is always shown. A value of 0 refreshes the display at each epoch.'
 
         button_layout = QHBoxLayout()
         button_layout.add_widget(self._start_stop_button)
@@ -320,10 +489,14 @@ class QGAControlWidget(QGroupBox):
         layout.add_layout(button_layout)
         layout.add_widget(self._current_state_label)
         layout.add_widget(self._current_epoch_label)
+        refresh_layout = QFormLayout()
+        refresh_layout.add_row(refresh_rate_title, refresh_rate_layout)
+        layout.add_layout(refresh_layout)
 
         self._start_stop_button.clicked.connect(self._next_start_stop_state)
         self._pause_resume_button.clicked.connect(self._next_pause_resume_state)
         self._single_step_button.clicked.connect(self._single_step_simulation)
+        self._refresh_rate_widget.valueChanged.connect(lambda value : setattr(self._ga_adapter, 'refresh_rate', value))
 
         self._ga_adapter.started.connect(self._update_since_evolution)
         self._ga_adapter.ended.connect(self._update_since_evolution_ended)
@@ -333,21 +506,24 @@ class QGAControlWidget(QGroupBox):
 
     def _update_gui(self):
         state_info = self._state_machine_info[self._ga_adapter.state]
-        self._start_stop_button.enabled = state_info[1]
+        self._start_stop_button.enabled = state_info[1] and not self._ga_adapter.is_stopping # Start attend la fin du fil de travail
         self._pause_resume_button.enabled = state_info[2]
         self._single_step_button.enabled = False # not state_info[2] and not self._ga_adapter.has_evolved
         self._start_stop_button.text = state_info[3]
         self._pause_resume_button.text = state_info[4]
         self._single_step_button.text = 'Single step'
 
-        self._current_state_label.text = state_info[7]
+        self._current_state_label.text = 'Stopping' if self._ga_adapter.is_stopping else state_info[7]
 
         epoch_prefix = 'Current epoch : '
-        epoch_detail = f'{ "-na-" if self._ga_adapter.state is GeneticAlgorithm.State.IDLE else self._ga_adapter.genetic_algorithm.current_epoch }'
+        snapshot = self._ga_adapter.snapshot
+        epoch_detail = f'{ "-na-" if self._ga_adapter.state is GeneticAlgorithm.State.IDLE or snapshot is None else snapshot.current_epoch }'
         self._current_epoch_label.text = f'{epoch_prefix}{epoch_detail}'
 
     @Slot()
     def _next_start_stop_state(self):
+        if self._ga_adapter.is_stopping:
+            return
         if self._ga_adapter.state is not GeneticAlgorithm.State.IDLE:
             self._ga_adapter.stop()
             self.stopped.emit()
@@ -428,18 +604,85 @@ class QHistoryGraph(QChartView):
         self.set_render_hint(QPainter.TextAntialiasing)
         self.set_chart(self.chart)
 
+        # état de l'affichage incrémental
+        self._series = (self.series_best, self.series_worst, self.series_average)
+        self._stride = 1            # nombre d'époques regroupées par colonne de pixels
+        self._plotted_count = 0     # nombre d'époques représentées par des colonnes complètes
+        self._tail_points = 0       # nombre de points de la dernière colonne, incomplète
+        self._maximum = 0.
+
+        self._ga_adapter.started.connect(self._clear_chart)
+
+    def _clear_chart(self):
+        """Vide les séries : la prochaine mise à jour reconstruit le graphique."""
+        for series in self._series:
+            series.clear()
+        self._stride = 1
+        self._plotted_count = 0
+        self._tail_points = 0
+        self._maximum = 0.
+
+    def _desired_stride(self, count):
+        """Retourne le nombre d'époques par colonne afin de ne pas dépasser une colonne de pixels par colonne de données.
+        
+        Le pas est une puissance de 2 pour que les colonnes déjà affichées restent valides lorsque l'historique s'allonge.
+        """
+        columns = max(int(self.chart.plot_area.width()), 1)
+        if count <= columns:
+            return 1
+        return 1 << int(np.ceil(np.log2(count / columns)))
+
+    @staticmethod
+    def _decimate(values, start, stride):
+        """Retourne les abscisses et ordonnées des points représentant 'values' par colonnes de 'stride' époques.
+        
+        Chaque colonne est représentée par son minimum et son maximum, dans l'ordre des époques, 
+        ce qui conserve l'enveloppe de la courbe (décimation min/max).
+        """
+        if stride == 1:
+            return np.arange(start, start + values.size), values
+        full = values.size // stride * stride
+        buckets = [values[:full].reshape(-1, stride)]
+        if full < values.size:
+            buckets.append(values[full:].reshape(1, -1))
+        x, y = [], []
+        offset = start
+        for bucket in buckets:
+            rows = np.arange(bucket.shape[0])
+            index_min = bucket.argmin(axis=1)
+            index_max = bucket.argmax(axis=1)
+            index = np.sort(np.stack((index_min, index_max), axis=1), axis=1)
+            x.append((offset + rows[:, None] * bucket.shape[1] + index).ravel())
+            y.append(bucket[rows[:, None], index].ravel())
+            offset += bucket.size
+        return np.concatenate(x), np.concatenate(y)
+
     def _update_chart(self):
-        data_series_best = [QPointF(x, y) for x, y in enumerate(self._ga_adapter.genetic_algorithm.history.history[:,0])] # best
-        data_series_worst = [QPointF(x, y) for x, y in enumerate(self._ga_adapter.genetic_algorithm.history.history[:,1])] # worst
-        data_series_average = [QPointF(x, y) for x, y in enumerate(self._ga_adapter.genetic_algorithm.history.history[:,2])] # average
-        self.series_best.replace(data_series_best)
-        self.series_worst.replace(data_series_worst)
-        self.series_average.replace(data_series_average)
+        snapshot = self._ga_adapter.snapshot
+        history = snapshot.history.history if snapshot is not None else np.empty((0, 5))
+        count = history.shape[0]
+
+        stride = self._desired_stride(count)
+        if count < self._plotted_count or stride != self._stride: # nouvelle évolution ou changement d'échelle
+            self._clear_chart()
+            self._stride = stride
+
+        # retire les points de la dernière colonne incomplète, puis ajoute les nouvelles époques
+        start = self._plotted_count
+        for column, series in enumerate(self._series):
+            if self._tail_points:
+                series.remove_points(series.count() - self._tail_points, self._tail_points)
+            x, y = QHistoryGraph._decimate(history[start:count, column], start, self._stride)
+            series.append([QPointF(xi, yi) for xi, yi in zip(x.tolist(), y.tolist())])
         
-        maximum = self._ga_adapter.genetic_algorithm.history.history[:,0].max()
+        self._plotted_count = start + (count - start) // self._stride * self._stride
+        remaining = count - self._plotted_count
+        self._tail_points = 0 if remaining == 0 else (remaining if self._stride == 1 else 2)
+        if count > start:
+            self._maximum = max(self._maximum, history[start:count, 0].max())
         
-        self.axisX.set_range(0, self._ga_adapter.genetic_algorithm.history.history.shape[0])
-        self.axisY.set_range(0, maximum * 1.05)
+        self.axisX.set_range(0, count)
+        self.axisY.set_range(0, self._maximum * 1.05)
         
         self.update()
 
@@ -478,21 +721,22 @@ class QEvolutionInfoWidget(QGroupBox):
 
     @Slot()
     def update(self):
-        if self._ga_adapter.genetic_algorithm.current_epoch == 0:
+        snapshot = self._ga_adapter.snapshot
+        if snapshot is None or snapshot.current_epoch == 0:
             self._info_widget.plain_text = ''
         else:
             solution_info = 'Solution : '
-            for i in range(self._ga_adapter.problem_definition.domains.dimension):
-                solution_info += f'\n    - {self._ga_adapter.problem_definition.domains.names[i]} : {self._ga_adapter.genetic_algorithm.history.best_solution[i]}'
+            for i in range(snapshot.problem_definition.domains.dimension):
+                solution_info += f'\n    - {snapshot.problem_definition.domains.names[i]} : {snapshot.history.best_solution[i]}'
 
-            self._info_widget.plain_text = f'''Current epoch : {self._ga_adapter.genetic_algorithm.current_epoch}
-Problem dimension : {self._ga_adapter.genetic_algorithm.problem_definition.domains.dimension}
+            self._info_widget.plain_text = f'''Current epoch : {snapshot.current_epoch}
+Problem dimension : {snapshot.problem_definition.domains.dimension}
 Fitness : 
-    - best    : {self._ga_adapter.genetic_algorithm.history.best_fitness:>16.6f}
-    - worst   : {self._ga_adapter.genetic_algorithm.history.worst_fitness:>16.6f}
-    - average : {self._ga_adapter.genetic_algorithm.history.average_fitness:>16.6f}
-    - std dev : {self._ga_adapter.genetic_algorithm.history.standard_deviation_fitness:>16.6f}
-    - median  : {self._ga_adapter.genetic_algorithm.history.median_fitness:>16.6f}
+    - best    : {snapshot.history.best_fitness:>16.6f}
+    - worst   : {snapshot.history.worst_fitness:>16.6f}
+    - average : {snapshot.history.average_fitness:>16.6f}
+    - std dev : {snapshot.history.standard_deviation_fitness:>16.6f}
+    - median  : {snapshot.history.median_fitness:>16.6f}
 {solution_info}'''
 
 
@@ -765,7 +1009,7 @@ class QGAApp(QMainWindow):
         self._ga.ended.connect(lambda : setattr(self._solution_panels, 'enabled', True))
         self._ga.evolved.connect(self._history_graph_widget.update_history)
         self._ga.evolved.connect(self._evolution_info_widget.update)
-        self._ga.evolved.connect(lambda:self._solution_panels.update(self._ga.genetic_algorithm))
+        self._ga.evolved.connect(lambda:self._solution_panels.update(self._ga.snapshot))
 
         self._ga.reseted.connect(self._history_graph_widget.update_history)
         self._ga.reseted.connect(self._evolution_info_widget.update)
@@ -799,6 +1043,10 @@ class QGAApp(QMainWindow):
     def show_event(self, event):
         self.__main_splitter.set_sizes([70, 30])
 
+    def close_event(self, event):
+        self._ga.shutdown()
+        super().close_event(event)
+
     def add_solution_panel(self, solution_panel):
         self._solution_panels.add_solution_panel(solution_panel)
         self.enabled = True
@@ -0,0 +1,646 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+from numpy.typing import NDArray
+
+from gacvm import (Domains, GeneMutationStrategy, GeneticAlgorithm, Parameters, ProblemDefinition, RouletteWheelSelectionStrategy,
+                   SerialEvaluator, WeightedAverageCrossoverStrategy, rank_fitness)
+from ga_strategy_genes_mutation import GenesMutationStrategy
+from ga_strategy_multi_mutation import MultiMutationStrategy
+from gaensemble import EnsembleGeneticAlgorithm
+from gaproblems import (ballistic_domains, ballistic_chromosome_fitness, ballistic_fitness, ballistic_problem, open_box_problem,
+                        shape_optimizer_problem, unknown_number_problem)
+from umath import IntervalIndex, PointGrid
+
+
+
+# Petit banc d'essai de performance pour la bibliothèque gacvm.
+#
+# Chaque fonction 'bench_...' mesure une partie du moteur et retourne une liste
+# de dictionnaires (une ligne par configuration mesurée). La fonction main
+# permet de lancer les mesures depuis la ligne de commande :
+#
+#   python gabench.py selection --sizes 100 1000 10000
+#   python gabench.py ballistic --sizes 100 1000 --layouts 20
+#   python gabench.py ranking --sizes 1000 100000 1000000
+#   python gabench.py ensemble --runs 10 50 --epochs 200
+#   python gabench.py grid --sizes 25 1000 10000 --check 2000
+#
+# La suite complète mesure chaque stratégie, la fitness de chaque problème et des
+# évolutions complètes, pour plusieurs tailles de population et dimensions. Les
+# résultats peuvent être écrits dans un fichier JSON et comparés à ceux d'une
+# exécution précédente (référence) afin de détecter les régressions :
+#
+#   python gabench.py suite --output current.json [--baseline baseline.json] [--tolerance 0.15]
+#   python gabench.py compare baseline.json current.json [--tolerance 0.15]
+#
+# Avec une référence, le code de sortie est 1 si au moins une mesure est plus
+# lente que la référence au-delà de la tolérance.
+
+
+
+#     ___        _   _ _     
+#    / _ \ _   _| |_(_) |___ 
+#   | | | | | | | __| | / __|
+#   | |_| | |_| | |_| | \__ \
+#    \___/ \__,_|\__|_|_|___/
+#                            
+def _best_time(function, repeat : int) -> float:
+    """Retourne le meilleur temps d'exécution (en secondes) parmi 'repeat' appels à 'function'."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _random_fitness_data(size : int, rng : np.random.Generator) -> NDArray:
+    """Produit une table de performance triée identique à celle maintenue par GeneticAlgorithm."""
+    ga = GeneticAlgorithm()
+    fitness_data = np.empty(size, dtype=ga._fit_type)
+    fitness_data['index'] = np.arange(size)
+    fitness_data['value'] = rng.random(size)
+    fitness_data[::-1].sort(order='value')
+    fitness_data['cumul'] = np.cumsum(fitness_data['value']) / np.sum(fitness_data['value'])
+    return fitness_data
+
+def _print_table(rows : list[dict]) -> None:
+    """Affiche une liste de résultats sous forme de tableau."""
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = [max(len(column), *(len(_format_cell(row[column])) for row in rows)) for column in columns]
+    print('  '.join(column.rjust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print('  '.join(_format_cell(row[column]).rjust(width) for column, width in zip(columns, widths)))
+
+def _format_cell(value) -> str:
+    if isinstance(value, float):
+        return f'{value:.6g}'
+    return str(value)
+
+
+
+#    ____       _           _   _             
+#   / ___|  ___| | ___  ___| |_(_) ___  _ __  
+#   \___ \ / _ \ |/ _ \/ __| __| |/ _ \| '_ \ 
+#    ___) |  __/ |  __/ (__| |_| | (_) | | | |
+#   |____/ \___|_|\___|\___|\__|_|\___/|_| |_|
+#                                             
+def _legacy_roulette_select_indices(fitness_data : NDArray, random_select : NDArray) -> NDArray:
+    """Implémentation de référence (historique) de la roulette : un filtrage complet par géniteur sélectionné."""
+    def select_each(rnd_val, fitness_data):
+        return fitness_data[np.argmax(fitness_data[fitness_data['cumul'] <= max(fitness_data[0]['cumul'], rnd_val)]['cumul'])]['index']
+
+    return np.apply_along_axis(select_each, 1, random_select[:,np.newaxis], fitness_data)
+
+def bench_selection(population_sizes : tuple[int] = (100, 1000, 10000), selection_rate : float = 0.75, repeat : int = 3) -> list[dict]:
+    """
+    Compare la sélection par roulette historique (un filtrage par géniteur) à la sélection par recherche triée.
+
+    Les deux implémentations reçoivent exactement les mêmes tirages aléatoires, ce qui permet aussi de 
+    valider qu'elles produisent les mêmes index.
+
+    Args:
+        population_sizes (tuple of int): Les tailles de population à mesurer.
+        selection_rate (float): Le taux de sélection utilisé pour pondérer les tirages.
+        repeat (int): Le nombre de répétitions de chaque mesure (le meilleur temps est retenu).
+
+    Returns:
+        list of dict: Une ligne par taille de population.
+    """
+    rng = np.random.default_rng(0)
+    rows = []
+    for size in population_sizes:
+        fitness_data = _random_fitness_data(size, rng)
+        random_select = rng.random(size) * selection_rate
+
+        legacy = _best_time(lambda: _legacy_roulette_select_indices(fitness_data, random_select), repeat)
+        batched = _best_time(lambda: RouletteWheelSelectionStrategy._select_indices(fitness_data, random_select), repeat)
+        identical = np.array_equal(_legacy_roulette_select_indices(fitness_data, random_select),
+                                   RouletteWheelSelectionStrategy._select_indices(fitness_data, random_select))
+
+        rows.append({'population' : size,
+                     'legacy (s)' : legacy,
+                     'batched (s)' : batched,
+                     'speedup' : legacy / batched,
+                     'identical' : identical})
+    return rows
+
+
+
+#    ____        _ _ _     _   _      
+#   | __ )  __ _| | (_)___| |_(_) ___ 
+#   |  _ \ / _` | | | / __| __| |/ __|
+#   | |_) | (_| | | | \__ \ |_| | (__ 
+#   |____/ \__,_|_|_|_|___/\__|_|\___|
+#                                     
+def _random_ballistic_layout(rng : np.random.Generator, width : int = 500, building_width : int = 20) -> tuple[IntervalIndex, IntervalIndex]:
+    """Produit une disposition aléatoire de bâtiments et de zones protégées, comme QBalisticProblem.generate_batiments."""
+    segments = [(x, x + building_width) for x in range(0, width, building_width)]
+    order = rng.permutation(len(segments))
+    nb_batiments = int(rng.integers(1, len(segments) + 1))
+    nb_proteges = int(rng.integers(0, nb_batiments))
+    batiments = [segments[i] for i in order[:nb_batiments]]
+    proteges = [segments[i] for i in order[:nb_proteges]]
+    return IntervalIndex(batiments), IntervalIndex(proteges)
+
+def bench_ballistic(population_sizes : tuple[int] = (100, 1000), layouts : int = 20, repeat : int = 3) -> list[dict]:
+    """
+    Compare la fitness balistique évaluée chromosome par chromosome (simulation scalaire) à la fitness 
+    évaluée pour toute la population à la fois.
+
+    Pour chaque taille, les deux évaluations sont comparées sur 'layouts' dispositions aléatoires de 
+    bâtiments ; 'identical' indique que toutes les valeurs de fitness sont exactement égales.
+
+    Args:
+        population_sizes (tuple of int): Les tailles de population à mesurer.
+        layouts (int): Le nombre de dispositions de bâtiments comparées.
+        repeat (int): Le nombre de répétitions de chaque mesure (le meilleur temps est retenu).
+
+    Returns:
+        list of dict: Une ligne par taille de population.
+    """
+    rng = np.random.default_rng(0)
+    domains = ballistic_domains()
+    rows = []
+    for size in population_sizes:
+        population = domains.random_population(size, rng)
+        identical = True
+        nonzero = 0
+        for _ in range(layouts):
+            arguments = dict(zip(('batiments', 'proteges'), _random_ballistic_layout(rng)),
+                             launch_position=(25., 25.), height=250., gravity=-9.81, final_y=0., building_height=10.)
+            scalar = np.array([ballistic_chromosome_fitness(chromosome, **arguments) for chromosome in population])
+            vectorized = ballistic_fitness(population, **arguments)
+            identical &= np.array_equal(scalar, vectorized)
+            nonzero += np.count_nonzero(scalar)
+
+        by_chromosome = _best_time(lambda: [ballistic_chromosome_fitness(chromosome, **arguments) for chromosome in population], repeat)
+        by_population = _best_time(lambda: ballistic_fitness(population, **arguments), repeat)
+
+        rows.append({'population' : size,
+                     'by chromosome (s)' : by_chromosome,
+                     'by population (s)' : by_population,
+                     'speedup' : by_chromosome / by_population,
+                     'non zero' : nonzero,
+                     'identical' : identical})
+    return rows
+
+
+
+#    ____             _    _             
+#   |  _ \ __ _ _ __ | | _(_)_ __   __ _ 
+#   | |_) / _` | '_ \| |/ / | '_ \ / _` |
+#   |  _ < (_| | | | |   <| | | | | (_| |
+#   |_| \_\__,_|_| |_|_|\_\_|_| |_|\__, |
+#                                  |___/ 
+def _legacy_rank_fitness(fitness_data : NDArray) -> NDArray:
+    """Implémentation de référence (historique) du classement : tri du tableau structuré puis statistiques séparées."""
+    fitness_data[::-1].sort(order='value')
+    fitness_data['cumul'] = np.cumsum(fitness_data['value']) / np.sum(fitness_data['value'])
+    return np.array((fitness_data[0]['value'], fitness_data[-1]['value'], np.average(fitness_data['value']),
+                     np.std(fitness_data['value']), np.median(fitness_data['value'])))
+
+def _rank_fitness(fitness_data : NDArray, values : NDArray, ranked : NDArray) -> NDArray:
+    """Classement tel que fait par GeneticAlgorithm._process_fitness avec rank_fitness."""
+    _, ranked, statistics = rank_fitness(values, ranked)
+    fitness_data['value'] = ranked
+    fitness_data['cumul'] = np.cumsum(ranked) / np.sum(fitness_data['value'])
+    return statistics
+
+def bench_ranking(population_sizes : tuple[int] = (1000, 100000, 1000000), repeat : int = 3) -> list[dict]:
+    """
+    Compare le classement historique des fitness (tri du tableau structuré et statistiques calculées 
+    séparément) au classement par argsort sur un tableau de réels (rank_fitness).
+
+    Les valeurs contiennent volontairement des égalités. 'identical' indique que les deux classements 
+    produisent la même table de performance ; 'statistics error' est l'écart relatif maximal entre 
+    les statistiques (l'écart type peut différer au dernier bit près).
+
+    Args:
+        population_sizes (tuple of int): Les tailles de population à mesurer.
+        repeat (int): Le nombre de répétitions de chaque mesure (le meilleur temps est retenu).
+
+    Returns:
+        list of dict: Une ligne par taille de population.
+    """
+    rng = np.random.default_rng(0)
+    fit_type = GeneticAlgorithm()._fit_type
+    rows = []
+    for size in population_sizes:
+        values = 1. + np.round(rng.random(size), 4)
+        ranked = np.empty(size)
+
+        def legacy_data():
+            fitness_data = np.empty(size, dtype=fit_type)
+            fitness_data['index'] = np.arange(size)
+            fitness_data['value'] = values
+            return fitness_data
+        legacy_fitness, fitness = legacy_data(), np.empty(size, dtype=fit_type)
+        legacy_statistics = _legacy_rank_fitness(legacy_fitness)
+        statistics = _rank_fitness(fitness, values, ranked)
+        identical = (np.array_equal(legacy_fitness['value'], fitness['value']) and
+                     np.array_equal(legacy_fitness['cumul'], fitness['cumul']) and
+                     np.array_equal(legacy_fitness['index'], rank_fitness(values)[0]))
+
+        legacy = _best_time(lambda: _legacy_rank_fitness(legacy_data()), repeat)
+        plain = _best_time(lambda: _rank_fitness(fitness, values, ranked), repeat)
+
+        rows.append({'population' : size,
+                     'structured sort (s)' : legacy,
+                     'argsort (s)' : plain,
+                     'speedup' : legacy / plain,
+                     'statistics error' : float(np.max(np.abs(statistics - legacy_statistics) / np.abs(legacy_statistics))),
+                     'identical' : identical})
+    return rows
+
+
+
+#     ____      _     _ 
+#    / ___|_ __(_) __| |
+#   | |  _| '__| |/ _` |
+#   | |_| | |  | | (_| |
+#    \____|_|  |_|\__,_|
+#                       
+def _random_obstacles(count : int, rng : np.random.Generator, width : float = 500., height : float = 250.) -> NDArray:
+    """Tire des obstacles comme shape_optimizer_problem, en ajoutant les deux coins du canevas (les bords de la grille)."""
+    obstacles = rng.integers((0, 0), (int(width), int(height)), (count, 2), endpoint=True).astype(np.float64)
+    obstacles[0] = 0.
+    obstacles[-1] = width, height
+    return obstacles
+
+def _random_boxes(count : int, rng : np.random.Generator, width : float = 500., height : float = 250.) -> tuple[NDArray, NDArray]:
+    """Tire des boîtes de taille comparable aux formes, débordant parfois du canevas, plus les boîtes des quatre coins."""
+    minimum = rng.uniform((-20., -20.), (width, height), (count, 2))
+    maximum = minimum + rng.uniform(0., 100., (count, 2))
+    corners = np.array(((0., 0.), (width - 10., 0.), (0., height - 10.), (width - 10., height - 10.)))
+    return np.vstack((minimum, corners)), np.vstack((maximum, corners + 10.))
+
+def _dense_query(obstacles : NDArray, minimum : NDArray, maximum : NDArray) -> tuple[NDArray, NDArray]:
+    """Implémentation de référence de PointGrid.query : chaque obstacle est testé dans chaque boîte."""
+    inside = np.all((obstacles[np.newaxis] >= minimum[:, np.newaxis]) & (obstacles[np.newaxis] <= maximum[:, np.newaxis]), axis=2)
+    return np.nonzero(inside)
+
+def _same_pairs(first : tuple[NDArray, NDArray], second : tuple[NDArray, NDArray]) -> bool:
+    return np.array_equal(np.unique(np.column_stack(first), axis=0), np.unique(np.column_stack(second), axis=0))
+
+def check_grid(obstacle_counts : range = range(1, 2001), boxes : int = 100) -> list[int]:
+    """
+    Valide PointGrid.query par comparaison au test exhaustif de chaque obstacle dans chaque boîte, pour 
+    chaque nombre d'obstacles (la forme de la grille dépend du nombre d'obstacles).
+
+    Returns:
+        list of int: Les nombres d'obstacles pour lesquels la grille ne trouve pas exactement les mêmes obstacles.
+    """
+    rng = np.random.default_rng(0)
+    failures = []
+    for count in obstacle_counts:
+        obstacles = _random_obstacles(count, rng)
+        minimum, maximum = _random_boxes(boxes, rng)
+        if not _same_pairs(PointGrid(obstacles).query(minimum, maximum), _dense_query(obstacles, minimum, maximum)):
+            failures.append(count)
+    return failures
+
+def bench_grid(obstacle_counts : tuple[int] = (25, 1000, 10000), boxes : int = 1000, repeat : int = 3) -> list[dict]:
+    """
+    Compare la recherche des obstacles contenus dans des boîtes par la grille (PointGrid) au test 
+    exhaustif de chaque obstacle dans chaque boîte. 'identical' indique que les deux trouvent les 
+    mêmes paires (boîte, obstacle).
+
+    Args:
+        obstacle_counts (tuple of int): Les nombres d'obstacles à mesurer.
+        boxes (int): Le nombre de boîtes (une par forme) de chaque recherche.
+        repeat (int): Le nombre de répétitions de chaque mesure (le meilleur temps est retenu).
+
+    Returns:
+        list of dict: Une ligne par nombre d'obstacles.
+    """
+    rng = np.random.default_rng(0)
+    rows = []
+    for count in obstacle_counts:
+        obstacles = _random_obstacles(count, rng)
+        minimum, maximum = _random_boxes(boxes, rng)
+        grid = PointGrid(obstacles)
+
+        dense = _best_time(lambda: _dense_query(obstacles, minimum, maximum), repeat)
+        indexed = _best_time(lambda: grid.query(minimum, maximum), repeat)
+
+        rows.append({'obstacles' : count,
+                     'dense (s)' : dense,
+                     'grid (s)' : indexed,
+                     'speedup' : dense / indexed,
+                     'identical' : _same_pairs(grid.query(minimum, maximum), _dense_query(obstacles, minimum, maximum))})
+    return rows
+
+
+
+#    _____                          _     _      
+#   | ____|_ __  ___  ___ _ __ ___ | |__ | | ___ 
+#   |  _| | '_ \/ __|/ _ \ '_ ` _ \| '_ \| |/ _ \
+#   | |___| | | \__ \  __/ | | | | | |_) | |  __/
+#   |_____|_| |_|___/\___|_| |_| |_|_.__/|_|\___|
+#                                                
+def bench_ensemble(run_counts : tuple[int] = (10, 50), population_size : int = 50, maximum_epoch : int = 200) -> list[dict]:
+    """
+    Compare K exécutions séparées de GeneticAlgorithm (germes 0 à K - 1) à un ensemble de K exécutions 
+    évoluées ensemble (EnsembleGeneticAlgorithm), pour la boîte ouverte et l'optimiseur de forme.
+
+    Les tirages aléatoires n'étant pas les mêmes, les deux approches sont comparées par la moyenne et 
+    l'écart type des meilleures fitness finales des K exécutions.
+
+    Args:
+        run_counts (tuple of int): Les nombres d'exécutions K à mesurer.
+        population_size (int): La taille de population de chaque exécution.
+        maximum_epoch (int): Le nombre d'époques de chaque exécution.
+
+    Returns:
+        list of dict: Une ligne par problème et nombre d'exécutions.
+    """
+    problems = {'open box' : open_box_problem(10., 5.), 'shape optimizer' : shape_optimizer_problem(seed=0)}
+    rows = []
+    for name, problem_definition in problems.items():
+        for run_count in run_counts:
+            parameters = Parameters()
+            parameters.population_size = population_size
+            parameters.maximum_epoch = maximum_epoch
+
+            start = time.perf_counter()
+            separate_best = []
+            for seed in range(run_count):
+                parameters.seed = seed
+                ga = GeneticAlgorithm(problem_definition, parameters)
+                ga.evolve()
+                separate_best.append(ga.history.best_fitness)
+            separate = time.perf_counter() - start
+
+            parameters.seed = 0
+            start = time.perf_counter()
+            ensemble = EnsembleGeneticAlgorithm(problem_definition, parameters, run_count)
+            ensemble.evolve()
+            batched = time.perf_counter() - start
+
+            rows.append({'problem' : name,
+                         'runs' : run_count,
+                         'separate (s)' : separate,
+                         'ensemble (s)' : batched,
+                         'speedup' : separate / batched,
+                         'separate best' : float(np.mean(separate_best)),
+                         'separate std' : float(np.std(separate_best)),
+                         'ensemble best' : float(np.mean(ensemble.best_fitness)),
+                         'ensemble std' : float(np.std(ensemble.best_fitness))})
+    return rows
+
+
+
+#    ____        _ _       
+#   / ___| _   _(_) |_ ___ 
+#   \___ \| | | | | __/ _ \
+#    ___) | |_| | | ||  __/
+#   |____/ \__,_|_|\__\___|
+#                          
+def _sphere_problem(dimension : int) -> ProblemDefinition:
+    """Problème synthétique de dimension quelconque (maximum au centre de [-5, 5] ** dimension), évalué par population."""
+    domains = Domains(np.tile([[-5., 5.]], (dimension, 1)), tuple(f'x{i}' for i in range(dimension)))
+    return ProblemDefinition(domains, _sphere_fitness, ProblemDefinition.FitnessMode.BY_POPULATION)
+
+def _sphere_fitness(population : NDArray) -> NDArray:
+    return 1. / (1. + np.einsum('ij,ij->i', population, population))
+
+def _suite_problems(rng : np.random.Generator) -> dict[str, ProblemDefinition]:
+    """Les problèmes fournis avec l'application (la disposition des bâtiments du problème balistique est tirée au hasard)."""
+    batiments, proteges = _random_ballistic_layout(rng)
+    return {'open box' : open_box_problem(10., 5.),
+            'unknown number' : unknown_number_problem(-1., 0.25, 1.),
+            'shape optimizer' : shape_optimizer_problem(seed=0),
+            'ballistic' : ballistic_problem(batiments, proteges)}
+
+def _measure(group : str, name : str, population : int, dimension : int, function, repeat : int) -> dict:
+    seconds = _best_time(function, repeat)
+    return {'group' : group,
+            'name' : name,
+            'population' : population,
+            'dimension' : dimension,
+            'time (s)' : seconds,
+            'per chromosome (us)' : seconds * 1e6 / population}
+
+def bench_strategies(population_sizes : tuple[int] = (100, 1000, 10000), dimensions : tuple[int] = (2, 16, 64), repeat : int = 5) -> list[dict]:
+    """
+    Mesure chaque stratégie (sélection, croisement et toutes les stratégies de mutation) seule, pour 
+    chaque taille de population et dimension.
+
+    Args:
+        population_sizes (tuple of int): Les tailles de population à mesurer.
+        dimensions (tuple of int): Les dimensions (nombre de gènes) à mesurer.
+        repeat (int): Le nombre de répétitions de chaque mesure (le meilleur temps est retenu).
+
+    Returns:
+        list of dict: Une ligne par stratégie, taille de population et dimension.
+    """
+    rng = np.random.default_rng(0)
+    selection = RouletteWheelSelectionStrategy()
+    crossover = WeightedAverageCrossoverStrategy()
+    mutations = (GeneMutationStrategy(), GenesMutationStrategy(), MultiMutationStrategy())
+    for strategy in (selection, crossover, *mutations):
+        strategy._rng = np.random.default_rng(0)
+
+    rows = []
+    for dimension in dimensions:
+        domains = _sphere_problem(dimension).domains
+        for size in population_sizes:
+            fitness_data = _random_fitness_data(size, rng)
+            genitors_1 = domains.random_population(size, rng)
+            genitors_2 = domains.random_population(size, rng)
+            offsprings = np.empty_like(genitors_1)
+            rows.append(_measure('strategy', selection.name, size, dimension, lambda: selection.select_indices(fitness_data, 0.6, size), repeat))
+            rows.append(_measure('strategy', crossover.name, size, dimension, lambda: crossover.breed(genitors_1, genitors_2, offsprings), repeat))
+            for mutation in mutations:
+                rows.append(_measure('strategy', mutation.name, size, dimension, lambda: mutation.mutate(offsprings, 0.2, domains), repeat))
+    return rows
+
+def bench_fitness(population_sizes : tuple[int] = (100, 1000, 10000), repeat : int = 5) -> list[dict]:
+    """
+    Mesure l'évaluation de la fitness de chaque problème fourni (évaluateur en série), pour chaque taille de population.
+
+    Args:
+        population_sizes (tuple of int): Les tailles de population à mesurer.
+        repeat (int): Le nombre de répétitions de chaque mesure (le meilleur temps est retenu).
+
+    Returns:
+        list of dict: Une ligne par problème et taille de population.
+    """
+    rng = np.random.default_rng(0)
+    evaluator = SerialEvaluator()
+    rows = []
+    for name, problem_definition in _suite_problems(rng).items():
+        for size in population_sizes:
+            population = problem_definition.domains.random_population(size, rng)
+            rows.append(_measure('fitness', name, size, problem_definition.dimension, lambda: evaluator.evaluate(problem_definition, population), repeat))
+    return rows
+
+def bench_evolve(population_sizes : tuple[int] = (100, 1000), dimensions : tuple[int] = (2, 16, 64), maximum_epoch : int = 50, repeat : int = 3) -> list[dict]:
+    """
+    Mesure des évolutions complètes (GeneticAlgorithm.evolve, paramètres par défaut et germe fixe) de 
+    chaque problème fourni et du problème synthétique 'sphere' pour chaque dimension, pour chaque taille 
+    de population. Le temps par chromosome est celui d'une époque.
+
+    Args:
+        population_sizes (tuple of int): Les tailles de population à mesurer.
+        dimensions (tuple of int): Les dimensions du problème synthétique.
+        maximum_epoch (int): Le nombre d'époques de chaque évolution.
+        repeat (int): Le nombre de répétitions de chaque mesure (le meilleur temps est retenu).
+
+    Returns:
+        list of dict: Une ligne par problème, dimension et taille de population.
+    """
+    rng = np.random.default_rng(0)
+    problems = list(_suite_problems(rng).items()) + [('sphere', _sphere_problem(dimension)) for dimension in dimensions]
+    rows = []
+    for name, problem_definition in problems:
+        for size in population_sizes:
+            parameters = Parameters()
+            parameters.population_size = size
+            parameters.maximum_epoch = maximum_epoch
+            parameters.seed = 0
+            ga = GeneticAlgorithm(problem_definition, parameters)
+            row = _measure('evolve', name, size, problem_definition.dimension, ga.evolve, repeat)
+            row['per chromosome (us)'] /= maximum_epoch
+            rows.append(row)
+    return rows
+
+def _result_key(row : dict) -> tuple:
+    return row['group'], row['name'], row['population'], row['dimension']
+
+def compare_results(baseline : list[dict], current : list[dict], tolerance : float = 0.15) -> list[dict]:
+    """
+    Compare des mesures à celles d'une référence. Une mesure est une régression si elle est plus lente 
+    que la référence d'un facteur supérieur à 1 + tolerance, une amélioration si elle est plus rapide 
+    d'un facteur supérieur à 1 + tolerance.
+
+    Returns:
+        list of dict: Une ligne par mesure (courante ou de référence), avec les temps, le rapport courant / référence et le statut.
+    """
+    baseline_times = {_result_key(row) : row['time (s)'] for row in baseline}
+    current_times = {_result_key(row) : row['time (s)'] for row in current}
+    rows = []
+    for key in list(current_times) + [key for key in baseline_times if key not in current_times]:
+        before, after = baseline_times.get(key), current_times.get(key)
+        if before is None:
+            ratio, status = None, 'new'
+        elif after is None:
+            ratio, status = None, 'missing'
+        else:
+            ratio = after / before
+            status = 'regression' if ratio > 1. + tolerance else 'improvement' if ratio < 1. / (1. + tolerance) else 'ok'
+        rows.append({'group' : key[0], 'name' : key[1], 'population' : key[2], 'dimension' : key[3],
+                     'baseline (s)' : before, 'current (s)' : after, 'ratio' : ratio, 'status' : status})
+    return rows
+
+def save_results(rows : list[dict], file) -> None:
+    """Écrit les mesures et la description de la machine dans un fichier JSON."""
+    metadata = {'date' : datetime.datetime.now().isoformat(timespec='seconds'),
+                'python' : platform.python_version(),
+                'numpy' : np.__version__,
+                'platform' : platform.platform(),
+                'processor' : platform.processor(),
+                'cpu count' : os.cpu_count()}
+    with open(file, 'w', encoding='utf-8') as stream:
+        json.dump({'metadata' : metadata, 'results' : rows}, stream, indent=2)
+
+def load_results(file) -> list[dict]:
+    """Lit les mesures d'un fichier écrit par save_results."""
+    with open(file, encoding='utf-8') as stream:
+        return json.load(stream)['results']
+
+def _report_comparison(rows : list[dict]) -> int:
+    _print_table(rows)
+    regressions = sum(row['status'] == 'regression' for row in rows)
+    print(f'{regressions} regression(s) out of {len(rows)} measures.')
+    return 1 if regressions else 0
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Banc d\'essai de performance de gacvm.')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    selection_parser = subparsers.add_parser('selection', help='sélection par roulette : historique vs recherche triée')
+    selection_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help='tailles de population')
+    selection_parser.add_argument('--rate', type=float, default=0.75, help='taux de sélection')
+    selection_parser.add_argument('--repeat', type=int, default=3, help='nombre de répétitions par mesure')
+
+    ballistic_parser = subparsers.add_parser('ballistic', help='fitness balistique : par chromosome vs par population')
+    ballistic_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000], help='tailles de population')
+    ballistic_parser.add_argument('--layouts', type=int, default=20, help='nombre de dispositions de bâtiments comparées')
+    ballistic_parser.add_argument('--repeat', type=int, default=3, help='nombre de répétitions par mesure')
+
+    ranking_parser = subparsers.add_parser('ranking', help='classement des fitness : tri du tableau structuré vs argsort')
+    ranking_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000], help='tailles de population')
+    ranking_parser.add_argument('--repeat', type=int, default=3, help='nombre de répétitions par mesure')
+
+    ensemble_parser = subparsers.add_parser('ensemble', help='K exécutions : séparées vs évoluées ensemble')
+    ensemble_parser.add_argument('--runs', type=int, nargs='+', default=[10, 50], help='nombres d\'exécutions')
+    ensemble_parser.add_argument('--population', type=int, default=50, help='taille de population de chaque exécution')
+    ensemble_parser.add_argument('--epochs', type=int, default=200, help='nombre d\'époques de chaque exécution')
+
+    grid_parser = subparsers.add_parser('grid', help='obstacles contenus dans des boîtes : test exhaustif vs grille')
+    grid_parser.add_argument('--sizes', type=int, nargs='+', default=[25, 1000, 10000], help='nombres d\'obstacles')
+    grid_parser.add_argument('--boxes', type=int, default=1000, help='nombre de boîtes par recherche')
+    grid_parser.add_argument('--check', type=int, default=2000, help='valide la grille pour chaque nombre d\'obstacles de 1 à CHECK')
+    grid_parser.add_argument('--repeat', type=int, default=3, help='nombre de répétitions par mesure')
+
+    suite_parser = subparsers.add_parser('suite', help='suite complète : stratégies, fitness des problèmes et évolutions complètes')
+    suite_parser.add_argument('--groups', nargs='+', choices=['strategy', 'fitness', 'evolve'], default=['strategy', 'fitness', 'evolve'], help='groupes de mesures')
+    suite_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000], help='tailles de population')
+    suite_parser.add_argument('--dimensions', type=int, nargs='+', default=[2, 16, 64], help='dimensions (stratégies et problème synthétique)')
+    suite_parser.add_argument('--epochs', type=int, default=50, help='nombre d\'époques des évolutions complètes')
+    suite_parser.add_argument('--repeat', type=int, default=5, help='nombre de répétitions par mesure')
+    suite_parser.add_argument('-o', '--output', help='fichier JSON où écrire les mesures')
+    suite_parser.add_argument('-b', '--baseline', help='fichier JSON de référence auquel comparer les mesures')
+    suite_parser.add_argument('-t', '--tolerance', type=float, default=0.15, help='ralentissement toléré par rapport à la référence (0.15 : 15 %%)')
+
+    compare_parser = subparsers.add_parser('compare', help='compare deux fichiers de mesures de la suite')
+    compare_parser.add_argument('baseline', help='fichier JSON de référence')
+    compare_parser.add_argument('current', help='fichier JSON à comparer')
+    compare_parser.add_argument('-t', '--tolerance', type=float, default=0.15, help='ralentissement toléré par rapport à la référence (0.15 : 15 %%)')
+
+    arguments = parser.parse_args()
+
+    if arguments.benchmark == 'selection':
+        _print_table(bench_selection(tuple(arguments.sizes), arguments.rate, arguments.repeat))
+    elif arguments.benchmark == 'ballistic':
+        _print_table(bench_ballistic(tuple(arguments.sizes), arguments.layouts, arguments.repeat))
+    elif arguments.benchmark == 'ranking':
+        _print_table(bench_ranking(tuple(arguments.sizes), arguments.repeat))
+    elif arguments.benchmark == 'ensemble':
+        _print_table(bench_ensemble(tuple(arguments.runs), arguments.population, arguments.epochs))
+    elif arguments.benchmark == 'grid':
+        _print_table(bench_grid(tuple(arguments.sizes), arguments.boxes, arguments.repeat))
+        failures = check_grid(range(1, arguments.check + 1))
+        print(f'PointGrid : {arguments.check} obstacle counts checked, {len(failures)} mismatch(es) {failures}')
+        if failures:
+            sys.exit(1)
+    elif arguments.benchmark == 'suite':
+        rows = []
+        if 'strategy' in arguments.groups:
+            rows += bench_strategies(tuple(arguments.sizes), tuple(arguments.dimensions), arguments.repeat)
+        if 'fitness' in arguments.groups:
+            rows += bench_fitness(tuple(arguments.sizes), arguments.repeat)
+        if 'evolve' in arguments.groups:
+            rows += bench_evolve(tuple(arguments.sizes), tuple(arguments.dimensions), arguments.epochs, max(1, arguments.repeat // 2))
+        _print_table(rows)
+        if arguments.output:
+            save_results(rows, arguments.output)
+        if arguments.baseline:
+            sys.exit(_report_comparison(compare_results(load_results(arguments.baseline), rows, arguments.tolerance)))
+    elif arguments.benchmark == 'compare':
+        sys.exit(_report_comparison(compare_results(load_results(arguments.baseline), load_results(arguments.current), arguments.tolerance)))
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,13 @@
+import functools
+import multiprocessing
+import os
+import pickle
+import struct
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
 from typing import Callable
 
@@ -91,17 +100,33 @@ class Domains:
         """
         return self._scale_normalized(self._rng.random(self._ranges.shape[0]))
 
-    def random_population(self, size : int) -> np.ndarray:
+    def random_population(self, size : int, rng : np.random.Generator | None = None) -> np.ndarray:
         """
         Génère une population de vecteurs aléatoires pour les dimensions spécifiées.
 
         Parameters:
             size (int): Le nombre de vecteurs aléatoires à générer.
+            rng (numpy.random.Generator, optionnel): Le générateur à utiliser. Par défaut, celui du domaine.
 
         Returns:
             numpy.ndarray: Un tableau 2D contenant la population aléatoire.
-        """ 
-        return self._scale_normalized(self._rng.random((size, self._ranges.shape[0])))
+        """
+        rng = self._rng if rng is None else rng
+        return self._scale_normalized(rng.random((size, self._ranges.shape[0])))
+
+    def random_genes(self, indices : np.ndarray, rng : np.random.Generator | None = None) -> np.ndarray:
+        """
+        Génère une valeur aléatoire pour chacune des dimensions données, toutes à la fois.
+
+        Parameters:
+            indices (numpy.ndarray): Les indices de dimension (n'importe quelle forme) pour lesquels générer une valeur.
+            rng (numpy.random.Generator, optionnel): Le générateur à utiliser. Par défaut, celui du domaine.
+
+        Returns:
+            numpy.ndarray: Un tableau de même forme que `indices` contenant une valeur aléatoire dans l'intervalle de chaque dimension.
+        """
+        rng = self._rng if rng is None else rng
+        return rng.random(np.shape(indices)) * (self._ranges[indices,1] - self._ranges[indices,0]) + self._ranges[indices,0]
 
     @property
     def ranges_span(self) -> np.ndarray:
@@ -173,17 +198,26 @@ class ProblemDefinition:
         - la 'fitness' : 
             - une fonction prenant 1 seul paramètre, le chromosome qui est un ndarray 1d de float
             - la fonction doit réaliser l'évaluation de la performance relative de la solution donnée (le chromosome)
+
+    Le mode d'évaluation (fitness_mode) détermine ce que reçoit la fonction de fitness :
+        - FitnessMode.BY_CHROMOSOME : un seul chromosome (ndarray 1d de d gènes) et retourne un float
+        - FitnessMode.BY_POPULATION : toute la population (ndarray 2d de n chromosomes x d gènes) et retourne 
+          un ndarray 1d de n fitness, dans le même ordre que les chromosomes reçus
+    Le mode BY_POPULATION permet une implémentation vectorisée de la fonction objective et évite le coût 
+    d'un appel Python par chromosome.
     '''
 
     class FitnessMode(Enum):
         BY_CHROMOSOME = 0 # one chromosome at a time
         BY_POPULATION = 1 # all chromosome at a time
 
-    def __init__(self, domains : Domains, fitness : Callable[[NDArray], float], fitness_mode=FitnessMode.BY_CHROMOSOME):
+    def __init__(self, domains : Domains, fitness : Callable[[NDArray], float] | Callable[[NDArray], NDArray], fitness_mode=FitnessMode.BY_CHROMOSOME):
         if not isinstance(domains, Domains):
             raise ValueError('Invalid input parameters in ProblemDefinition : domains must be an Domains object.')
         if not callable(fitness): # to do : validate function signature detection?!
             raise ValueError('Invalid input parameters in ProblemDefinition : fitness must be callable.')
+        if not isinstance(fitness_mode, ProblemDefinition.FitnessMode):
+            raise ValueError('Invalid input parameters in ProblemDefinition : fitness_mode must be a ProblemDefinition.FitnessMode value.')
 
         self._domains = domains
         self._fitness = fitness
@@ -242,7 +276,8 @@ class SelectionStrategy(Strategy):
         '''
         Doit produire une liste de géniteurs sélectionnés.
         
-        ATTENTION, l'ordre de genitor est indéterminé alors que fitness_data est trié en ordre de performance (du plus perf au moins perf)
+        Les géniteurs sont physiquement triés en ordre de performance (du plus perf au moins perf), 
+        dans le même ordre que fitness_data : fitness_data['index'][i] vaut toujours i.
         
         Args:
             genitors (NDArray): Les géniteurs disponibles :
@@ -261,6 +296,24 @@ class SelectionStrategy(Strategy):
         '''
         raise NotImplementedError()
 
+    def select_indices(self, fitness_data : NDArray, selection_rate : float, selection_size : int) -> NDArray | None:
+        '''
+        Peut produire les index des géniteurs sélectionnés plutôt qu'une copie des géniteurs.
+        
+        Le moteur copie alors lui-même les géniteurs sélectionnés dans des matrices préallouées, 
+        sans nouvelle allocation à chaque époque. Par défaut, retourne None : le moteur utilise 
+        alors la méthode select.
+        
+        Args:
+            fitness_data (NDArray): Les informations de performance triées (voir select).
+            selection_rate (float): Taux de sélection en pourcentage (0.0 à 1.0)
+            selection_size (int): Taille de sélection.
+            
+        Returns:
+            NDArray | None: Les selection_size index des géniteurs sélectionnés, ou None si la stratégie ne les produit pas.
+        '''
+        return None
+
 
 class CrossoverStrategy(Strategy):
     """Représente l'algorithme à utiliser pour le croisement entre des pairs de géniteurs permettant de produire des progénitures."""    
@@ -329,12 +382,35 @@ class RouletteWheelSelectionStrategy(SelectionStrategy):
         super().__init__('Roulette Wheel')
 
     def select(self, genitor : NDArray, fitness_data : NDArray, selection_rate : float, selection_size : int) -> NDArray:
-        def select_each(rnd_val, fitness_data):
-            return fitness_data[np.argmax(fitness_data[fitness_data['cumul'] <= max(fitness_data[0]['cumul'], rnd_val)]['cumul'])]['index']
+        return genitor[self.select_indices(fitness_data, selection_rate, selection_size)]
 
+    def select_indices(self, fitness_data : NDArray, selection_rate : float, selection_size : int) -> NDArray:
         random_select = self._rng.random(selection_size) * selection_rate
-        indices = np.apply_along_axis(select_each, 1, random_select[:,np.newaxis], fitness_data)
-        return genitor[indices]
+        return RouletteWheelSelectionStrategy._select_indices(fitness_data, random_select)
+
+    @staticmethod
+    def _select_indices(fitness_data : NDArray, random_select : NDArray) -> NDArray:
+        '''
+        Détermine l'index du géniteur associé à chaque tirage, tous les tirages à la fois.
+
+        Pour chaque tirage, on retient la dernière entrée dont la somme cumulative est inférieure ou
+        égale au tirage (au minimum la première entrée). Puisque la colonne 'cumul' est croissante,
+        cette recherche se fait par une seule recherche triée (np.searchsorted) pour l'ensemble des
+        tirages. En cas d'égalité des sommes cumulatives (performances nulles), la première entrée
+        égale est retenue, comme le ferait np.argmax.
+
+        Args:
+            fitness_data (NDArray): Les informations de performance triées (voir SelectionStrategy.select).
+            random_select (NDArray): Les tirages aléatoires, déjà pondérés par le taux de sélection.
+
+        Returns:
+            NDArray: L'index du géniteur sélectionné pour chaque tirage.
+        '''
+        cumul = fitness_data['cumul']
+        threshold = np.maximum(cumul[0], random_select)
+        last = np.searchsorted(cumul, threshold, side='right') - 1
+        first = np.searchsorted(cumul, cumul[last], side='left')
+        return fitness_data['index'][first]
 
 class WeightedAverageCrossoverStrategy(CrossoverStrategy):
     '''
@@ -357,12 +433,281 @@ class GeneMutationStrategy(MutationStrategy):
         super().__init__('Mutate Single Gene')
 
     def mutate(self, offsprings : NDArray, mutation_rate : float, domains : Domains) -> None:
-        def do_mutation(offspring, mutation_rate, domains):
-            if self._rng.random() <= mutation_rate:
-                index = self._rng.integers(0, offsprings.shape[1])
-                offspring[index] = domains.random_value(index)
+        mutated = np.flatnonzero(self._rng.random(offsprings.shape[0]) <= mutation_rate)
+        genes = self._rng.integers(0, offsprings.shape[1], mutated.size)
+        offsprings[mutated, genes] = domains.random_genes(genes, self._rng)
+
+
+
+
+#    _____            _             _                 
+#   | ____|_   ____ _| |_   _  __ _| |_ ___  _ __ ___ 
+#   |  _| \ \ / / _` | | | | |/ _` | __/ _ \| '__/ __|
+#   | |___ \ V / (_| | | |_| | (_| | || (_) | |  \__ \
+#   |_____| \_/ \__,_|_|\__,_|\__,_|\__\___/|_|  |___/
+#                                                     
+def _evaluate_fitness(fitness : Callable, fitness_mode : ProblemDefinition.FitnessMode, population : NDArray) -> NDArray:
+    '''
+    Évalue la fonction de fitness sur une population (ou une portion de population) selon le mode d'évaluation.
+
+    Cette fonction est définie au niveau du module afin d'être utilisable par les processus de travail.
+
+    Returns:
+        NDArray: Un vecteur de fitness, une valeur par chromosome et dans le même ordre.
+    '''
+    if fitness_mode == ProblemDefinition.FitnessMode.BY_CHROMOSOME:
+        return np.asarray(np.apply_along_axis(fitness, 1, population), dtype=np.float64)
+    
+    values = np.asarray(fitness(population), dtype=np.float64)
+    if values.shape != (population.shape[0],):
+        raise ValueError(f'Invalid fitness. A fitness function in BY_POPULATION mode must return one value per chromosome : expected shape {(population.shape[0],)}, got {values.shape}.')
+    return values
+
+# Fonction de fitness des processus de travail de ProcessPoolEvaluator. Elle 
+# est transmise une seule fois, à la création du processus, plutôt qu'à 
+# chaque portion de population évaluée.
+_worker_fitness = None
+
+def _initialize_worker(fitness : Callable, fitness_mode : ProblemDefinition.FitnessMode) -> None:
+    global _worker_fitness
+    _worker_fitness = (fitness, fitness_mode)
+
+def _evaluate_worker_chunk(chunk : NDArray) -> NDArray:
+    return _evaluate_fitness(_worker_fitness[0], _worker_fitness[1], chunk)
+
+
+class Evaluator(ABC):
+    '''
+    Représente la manière d'évaluer la fitness d'une population (en série, en parallèle, ...).
+    
+    Peu importe l'évaluateur utilisé, les fitness retournées doivent être identiques à celles d'une 
+    évaluation en série, dans le même ordre que les chromosomes reçus. Le choix de l'évaluateur n'a 
+    donc aucune influence sur le déroulement de l'évolution (pour une fonction de fitness déterministe).
+    '''
+    def __init__(self, name : str) -> None:
+        if not isinstance(name, str):
+            raise TypeError('Invalid input parameters in Evaluator : name must be a string.')
+        if len(name) < 3:
+            raise ValueError('Invalid input parameters in Evaluator : name must be at least 3 characters long.')
+
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        '''Le nom de l'évaluateur.'''
+        return self._name
+
+    @abstractmethod
+    def evaluate(self, problem_definition : ProblemDefinition, population : NDArray) -> NDArray:
+        '''
+        Évalue la fitness de chacun des chromosomes de la population.
+        
+        Args:
+            problem_definition (ProblemDefinition): Le problème (fonction de fitness et mode d'évaluation).
+            population (NDArray): Les chromosomes à évaluer (r lignes de chromosomes, c colonnes de gènes).
+            
+        Returns:
+            NDArray: Un vecteur de r fitness.
+        '''
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        '''Libère les ressources (threads, processus) de l'évaluateur. L'évaluateur demeure utilisable par la suite.'''
+        pass
+
+class SerialEvaluator(Evaluator):
+    '''
+    Évalue toute la population dans le fil d'exécution courant.
+    '''
+    def __init__(self):
+        super().__init__('Serial')
+
+    def evaluate(self, problem_definition : ProblemDefinition, population : NDArray) -> NDArray:
+        return _evaluate_fitness(problem_definition.fitness, problem_definition.fitness_mode, population)
+
+class _PoolEvaluator(Evaluator):
+    '''
+    Base commune aux évaluateurs parallèles.
+    
+    La population est découpée en portions contiguës (chunks_per_worker portions par travailleur) 
+    distribuées aux travailleurs d'un bassin persistant. Le bassin est créé au premier usage et 
+    réutilisé d'une époque à l'autre. Les résultats sont réassemblés dans l'ordre de la population.
+    '''
+    def __init__(self, name : str, max_workers : int | None, chunks_per_worker : int) -> None:
+        super().__init__(name)
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f'Invalid input parameters in {type(self).__name__} : max_workers must be at least 1.')
+        if chunks_per_worker < 1:
+            raise ValueError(f'Invalid input parameters in {type(self).__name__} : chunks_per_worker must be at least 1.')
         
-        np.apply_along_axis(do_mutation, 1, offsprings, mutation_rate, domains)
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunks_per_worker = chunks_per_worker
+        self._pool = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _split(self, population : NDArray) -> list[NDArray]:
+        chunk_count = max(1, min(population.shape[0], self._max_workers * self._chunks_per_worker))
+        return np.array_split(population, chunk_count)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __getstate__(self):
+        # le bassin n'est pas sérialisable : il sera recréé au premier usage
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        return state
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    '''
+    Évalue la population par portions dans un bassin de fils d'exécution (threads).
+    
+    Approprié lorsque la fonction de fitness libère le GIL (calculs NumPy importants) ou ne peut 
+    pas être transmise à un autre processus.
+    '''
+    def __init__(self, max_workers : int | None = None, chunks_per_worker : int = 4):
+        super().__init__('Thread Pool', max_workers, chunks_per_worker)
+
+    def evaluate(self, problem_definition : ProblemDefinition, population : NDArray) -> NDArray:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self._max_workers)
+        evaluate_chunk = functools.partial(_evaluate_fitness, problem_definition.fitness, problem_definition.fitness_mode)
+        return np.concatenate(list(self._pool.map(evaluate_chunk, self._split(population))))
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    '''
+    Évalue la population par portions dans un bassin de processus, ce qui permet d'exploiter tous les 
+    coeurs pour une fonction de fitness en Python pur.
+    
+    La fonction de fitness est transmise aux processus une seule fois, à la création du bassin ; le 
+    bassin est recréé seulement si la fonction de fitness change. À chaque époque, seules les portions 
+    de population et les fitness transitent entre les processus.
+    
+    Attention, lorsque les processus ne sont pas créés par 'fork', la fonction de fitness doit pouvoir 
+    être sérialisée (pickle) : fonction définie au niveau d'un module, functools.partial, objet simple, etc.
+    '''
+    def __init__(self, max_workers : int | None = None, chunks_per_worker : int = 4):
+        super().__init__('Process Pool', max_workers, chunks_per_worker)
+        self._pool_fitness = None
+
+    def _ensure_pool(self, problem_definition : ProblemDefinition) -> None:
+        fitness = (problem_definition.fitness, problem_definition.fitness_mode)
+        if self._pool is not None and self._pool_fitness[0] is fitness[0] and self._pool_fitness[1] == fitness[1]:
+            return
+
+        self.close()
+        if multiprocessing.get_start_method() != 'fork':
+            try:
+                pickle.dumps(fitness)
+            except Exception as error:
+                raise ValueError(f'Invalid fitness for ProcessPoolEvaluator : the fitness function cannot be sent to worker processes ({error}). Suggestion : use a module level function or a functools.partial, or use ThreadPoolEvaluator.') from error
+        self._pool = ProcessPoolExecutor(self._max_workers, initializer=_initialize_worker, initargs=fitness)
+        self._pool_fitness = fitness
+
+    def evaluate(self, problem_definition : ProblemDefinition, population : NDArray) -> NDArray:
+        self._ensure_pool(problem_definition)
+        return np.concatenate(list(self._pool.map(_evaluate_worker_chunk, self._split(population))))
+
+    def close(self) -> None:
+        super().close()
+        self._pool_fitness = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_pool_fitness'] = None
+        return state
+
+class FitnessCache:
+    '''
+    Cache borné des fitness déjà calculées, indexé par les octets du chromosome.
+    
+    Le cache est placé devant l'évaluateur : seuls les chromosomes absents du cache sont évalués. 
+    Lorsque la capacité est atteinte, les entrées les moins récemment utilisées sont évincées (LRU).
+    Typiquement, les chromosomes copiés par l'élitisme ne sont ainsi plus réévalués à chaque époque.
+    
+    Attention, le cache suppose que la fitness d'un chromosome ne dépend que de ce chromosome 
+    (et non du reste de la population). Une capacité nulle désactive le cache.
+    '''
+    def __init__(self, capacity : int = 0) -> None:
+        self._entries = OrderedDict()
+        self._capacity = 0
+        self.capacity = capacity
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def capacity(self) -> int:
+        '''Le nombre maximum de fitness conservées.'''
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value : int) -> None:
+        self._capacity = max(0, int(value))
+        self._evict()
+
+    @property
+    def size(self) -> int:
+        '''Le nombre de fitness actuellement conservées.'''
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        '''Le nombre de chromosomes dont la fitness a été trouvée dans le cache.'''
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        '''Le nombre de chromosomes dont la fitness a dû être évaluée.'''
+        return self._misses
+
+    def clear(self) -> None:
+        '''Invalide toutes les entrées et remet les compteurs à zéro.'''
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def evaluate(self, evaluator : Evaluator, problem_definition : ProblemDefinition, population : NDArray) -> NDArray:
+        '''
+        Retourne la fitness de chacun des chromosomes de la population en n'évaluant que ceux absents du cache.
+        
+        Les chromosomes absents sont évalués en un seul appel à l'évaluateur (un chromosome présent 
+        plusieurs fois dans la population n'est évalué qu'une fois).
+        '''
+        population = np.ascontiguousarray(population)
+        values = np.empty(population.shape[0], dtype=np.float64)
+        missing = {} # clé -> index des chromosomes à évaluer
+        for index, chromosome in enumerate(population):
+            key = chromosome.tobytes()
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                values[index] = value
+            else:
+                missing.setdefault(key, []).append(index)
+
+        missing_count = sum(len(indices) for indices in missing.values())
+        self._hits += population.shape[0] - missing_count
+        self._misses += missing_count
+
+        if missing:
+            first_indices = [indices[0] for indices in missing.values()]
+            missing_values = evaluator.evaluate(problem_definition, population[first_indices])
+            for (key, indices), value in zip(missing.items(), missing_values):
+                values[indices] = value
+                self._entries[key] = float(value)
+            self._evict()
+
+        return values
+
 
 
 
@@ -385,16 +730,22 @@ class Parameters:
         - selection_strategy : stratégie de sélection (algorithme ou méthode de sélection)
         - crossover_strategy : stratégie de croisement (algorithme ou méthode de croisement)
         - mutation_strategy : stratégie de mutation (algorithme ou méthode de mutation)
+        
+        - evaluator : évaluateur de la fitness (en série, bassin de threads ou bassin de processus)
+        - fitness_cache_size : nombre maximum de fitness mémorisées par chromosome (0 pour désactiver le cache)
+        - seed : germe des générateurs aléatoires (None pour une évolution non reproductible)
 
     Il est donc possible de définir tous ces paramètres avant de lancer une résolution de problème avec l'algorithme génétique.
     '''
-    def __init__(self, selection_strategy=RouletteWheelSelectionStrategy(), crossover_strategy=WeightedAverageCrossoverStrategy(), mutation_strategy=GeneMutationStrategy()):
+    def __init__(self, selection_strategy=RouletteWheelSelectionStrategy(), crossover_strategy=WeightedAverageCrossoverStrategy(), mutation_strategy=GeneMutationStrategy(), evaluator=SerialEvaluator()):
         if not isinstance(selection_strategy, SelectionStrategy):
             raise ValueError('Invalid input parameters in Parameters : selection_strategy must be an SelectionStrategy object.')
         if not isinstance(crossover_strategy, CrossoverStrategy):
             raise ValueError('Invalid input parameters in Parameters : crossover_strategy must be an CrossoverStrategy object.')
         if not isinstance(mutation_strategy, MutationStrategy):
             raise ValueError('Invalid input parameters in Parameters : mutation_strategy must be an MutationStrategy object.')
+        if not isinstance(evaluator, Evaluator):
+            raise ValueError('Invalid input parameters in Parameters : evaluator must be an Evaluator object.')
 
         self._maximum_epoch = 1000
 
@@ -406,6 +757,9 @@ class Parameters:
         self._selection_strategy = selection_strategy
         self._crossover_strategy = crossover_strategy
         self._mutation_strategy = mutation_strategy
+        self._evaluator = evaluator
+        self._fitness_cache_size = 0
+        self._seed = None
 
         self._epsilon_min_fitness = 1.e-12
 
@@ -487,6 +841,40 @@ class Parameters:
             raise ValueError('Invalid input parameters in Parameters : mutation_strategy must be an MutationStrategy object.')
         self._mutation_strategy = value
 
+    @property
+    def evaluator(self):
+        return self._evaluator
+
+    @evaluator.setter
+    def evaluator(self, value):
+        if not isinstance(value, Evaluator):
+            raise ValueError('Invalid input parameters in Parameters : evaluator must be an Evaluator object.')
+        self._evaluator = value
+
+    @property
+    def fitness_cache_size(self) -> int:
+        return self._fitness_cache_size
+
+    @fitness_cache_size.setter
+    def fitness_cache_size(self, value: int):
+        self._fitness_cache_size = max(0, int(value))
+
+    @property
+    def seed(self) -> int | None:
+        return self._seed
+
+    @seed.setter
+    def seed(self, value: int | None):
+        if value is not None and (not isinstance(value, (int, np.integer)) or value < 0):
+            raise ValueError('Invalid input parameters in Parameters : seed must be None or a positive integer.')
+        self._seed = value
+
+    def __getstate__(self):
+        # les moteurs associés ne font pas partie des paramètres sérialisés
+        state = self.__dict__.copy()
+        state['_engine_to_update'] = []
+        return state
+
 
 
 class Observer(ABC):
@@ -495,6 +883,36 @@ class Observer(ABC):
         raise NotImplementedError()
 
 
+class CheckpointObserver(Observer):
+    '''
+    Enregistre périodiquement l'état de l'évolution (voir GeneticAlgorithm.save_checkpoint).
+
+    Un point de reprise est enregistré toutes les 'period' époques, ou dès que 'interval' secondes 
+    se sont écoulées depuis le dernier enregistrement, ainsi qu'à la dernière époque.
+    '''
+    def __init__(self, file, period : int | None = 100, interval : float | None = None) -> None:
+        if period is not None and period < 1:
+            raise ValueError('Invalid input parameters in CheckpointObserver : period must be None or greater or equal than 1.')
+        if interval is not None and interval <= 0.:
+            raise ValueError('Invalid input parameters in CheckpointObserver : interval must be None or greater than 0.')
+        self._file = file
+        self._period = period
+        self._interval = interval
+        self._last_save = time.monotonic()
+
+    @property
+    def file(self):
+        return self._file
+
+    def update(self, engine):
+        now = time.monotonic()
+        if (engine.has_evolved 
+            or (self._period is not None and engine.current_epoch % self._period == 0)
+            or (self._interval is not None and now - self._last_save >= self._interval)):
+            engine.save_checkpoint(self._file)
+            self._last_save = now
+
+
 #    _   _ _     _                   
 #   | | | (_)___| |_ ___  _ __ _   _ 
 #   | |_| | / __| __/ _ \| '__| | | |
@@ -512,13 +930,43 @@ class History:
         self._epoch_ref = np.arange(maximum_epoch)
 
     def _log_history(self, best_solution, best_fitness, worst_fitness, average_fitness, std_dev_fitness, median_fitness):
-        self._last_epoch += 1
-        self._best_solution_history[self._last_epoch] = best_solution
-        self._fitness_history[self._last_epoch, 0] = best_fitness
-        self._fitness_history[self._last_epoch, 1] = worst_fitness
-        self._fitness_history[self._last_epoch, 2] = average_fitness
-        self._fitness_history[self._last_epoch, 3] = std_dev_fitness
-        self._fitness_history[self._last_epoch, 4] = median_fitness
+        slot = self._slot(self._last_epoch + 1)
+        self._best_solution_history[slot] = best_solution
+        self._fitness_history[slot, 0] = best_fitness
+        self._fitness_history[slot, 1] = worst_fitness
+        self._fitness_history[slot, 2] = average_fitness
+        self._fitness_history[slot, 3] = std_dev_fitness
+        self._fitness_history[slot, 4] = median_fitness
+        self._last_epoch += 1 # l'époque n'est comptée qu'une fois entièrement écrite (voir _frozen)
+
+    def _slot(self, epoch):
+        # ligne des tableaux en mémoire où est conservée l'époque
+        return epoch
+
+    @classmethod
+    def _from_arrays(cls, fitness_history, best_solution_history, count):
+        # historique de 'count' époques construit sur des tableaux existants, sans copie (voir gaensemble)
+        history = cls()
+        history._last_epoch = count - 1
+        history._fitness_history = fitness_history
+        history._best_solution_history = best_solution_history
+        history._epoch_ref = np.arange(fitness_history.shape[0])
+        return history
+
+    def _frozen(self):
+        # Historique des époques déjà écrites, qui ne suit plus l'évolution et peut être lu d'un 
+        # autre fil d'exécution (voir gaapp.QGAAdapter.Snapshot). Les lignes déjà écrites ne 
+        # changent plus : les tableaux sont partagés sans copie.
+        history = History()
+        history._last_epoch = self._last_epoch
+        history._fitness_history = self._fitness_history
+        history._best_solution_history = self._best_solution_history
+        history._epoch_ref = self._epoch_ref
+        return history
+
+    def _finalize(self):
+        # appelée lorsque l'évolution se termine (normalement, par arrêt ou par erreur)
+        pass
 
     @property
     def count(self):
@@ -526,27 +974,27 @@ class History:
 
     @property
     def best_solution(self):
-        return self._best_solution_history[self._last_epoch]
+        return self._best_solution_history[self._slot(self._last_epoch)]
 
     @property
     def best_fitness(self):
-        return self._fitness_history[self._last_epoch, 0]
+        return self._fitness_history[self._slot(self._last_epoch), 0]
 
     @property
     def worst_fitness(self):
-        return self._fitness_history[self._last_epoch, 1]
+        return self._fitness_history[self._slot(self._last_epoch), 1]
 
     @property
     def average_fitness(self):
-        return self._fitness_history[self._last_epoch, 2]
+        return self._fitness_history[self._slot(self._last_epoch), 2]
 
     @property
     def standard_deviation_fitness(self):
-        return self._fitness_history[self._last_epoch, 3]
+        return self._fitness_history[self._slot(self._last_epoch), 3]
 
     @property
     def median_fitness(self):
-        return self._fitness_history[self._last_epoch, 4]        
+        return self._fitness_history[self._slot(self._last_epoch), 4]        
 
     @property
     def history(self):
@@ -556,13 +1004,317 @@ class History:
     def epoch(self):
         return self._epoch_ref[:self._last_epoch]
 
+    def save(self, file) -> None:
+        '''
+        Enregistre l'historique complet dans un fichier NumPy compressé (.npz) contenant :
+            - epoch : le numéro de chaque époque
+            - fitness : les statistiques de fitness de chaque époque (colonnes : best, worst, average, std dev, median)
+            - best_solution : la meilleure solution de chaque époque
+        '''
+        np.savez_compressed(file,
+                            epoch=np.arange(self.count),
+                            fitness=self._fitness_history[:self.count],
+                            best_solution=self._best_solution_history[:self.count])
+
     @property
     def gradient(self, average_size = 5):
-        if self._last_epoch < average_size + 1:
+        history = self.history
+        if history.shape[0] < average_size + 1:
             return None
-        return np.average(self._fitness_history[self._last_epoch - average_size:self._last_epoch, 0] - self._fitness_history[self._last_epoch - average_size - 1:self._last_epoch - 1, 0])
+        return np.average(np.diff(history[-average_size - 1:, 0]))
 
 
+class StreamingHistory(History):
+    '''
+    Historique à mémoire bornée dont chaque époque est aussi écrite dans un fichier.
+
+    Seules les 'memory_size' dernières époques sont conservées en mémoire (tampon circulaire) : 
+    les propriétés 'history' et 'epoch' ne couvrent que ces époques. Les statistiques de fitness 
+    et la meilleure solution de chaque époque sont ajoutées à la fin d'un fichier NumPy (.npy) 
+    contenant un tableau structuré dont les champs sont :
+        - fitness : les statistiques de fitness (colonnes : best, worst, average, std dev, median)
+        - best_solution : la meilleure solution
+
+    L'en-tête du fichier est réécrit avec le nombre d'époques lorsque l'évolution se termine ; le 
+    fichier peut alors être lu par np.load. Si le processus est interrompu, StreamingHistory.load 
+    récupère toutes les époques complètes écrites jusque-là.
+    '''
+    def __init__(self, file, memory_size : int = 1000):
+        super().__init__()
+        if memory_size < 2:
+            raise ValueError('Invalid input parameters in StreamingHistory : memory_size must be greater or equal than 2.')
+        self._file_name = file
+        self._memory_size = memory_size
+        self._file = None
+
+    @property
+    def file(self):
+        return self._file_name
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    def _setup(self, maximum_epoch, problem_dimension):
+        self._finalize()
+        self._last_epoch = -1
+        self._best_solution_history = np.zeros((self._memory_size, problem_dimension), dtype=np.float64)
+        self._fitness_history = np.zeros((self._memory_size, 5), dtype=np.float64) # best, worst, average, std dev, median
+        self._record = np.zeros(1, dtype=StreamingHistory.record_type(problem_dimension))
+        self._data_offset = StreamingHistory._header_size(self._record.dtype)
+        self._file = open(self._file_name, 'wb')
+        self._write_header()
+
+    def _log_history(self, best_solution, best_fitness, worst_fitness, average_fitness, std_dev_fitness, median_fitness):
+        super()._log_history(best_solution, best_fitness, worst_fitness, average_fitness, std_dev_fitness, median_fitness)
+        slot = self._slot(self._last_epoch)
+        self._record['fitness'] = self._fitness_history[slot]
+        self._record['best_solution'] = self._best_solution_history[slot]
+        self._file.write(self._record.tobytes())
+
+    def _slot(self, epoch):
+        return epoch % self._memory_size
+
+    def _frozen(self):
+        # le tampon circulaire est réécrit à chaque époque : les époques en mémoire sont copiées
+        return History._from_arrays(self._window(self._fitness_history).copy(),
+                                    self._window(self._best_solution_history).copy(),
+                                    min(self.count, self._memory_size))
+
+    def __getstate__(self):
+        # Le fichier n'est pas sérialisé : il est vidé sur disque et sera rouvert
+        # à la reprise (voir __setstate__).
+        if self._file is not None:
+            self._file.flush()
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_streaming'] = self._file is not None
+        return state
+
+    def __setstate__(self, state):
+        # À la reprise d'un point de reprise, le fichier est rouvert et tronqué au 
+        # nombre d'époques enregistrées dans le point de reprise : les époques 
+        # écrites après celui-ci seront produites de nouveau.
+        streaming = state.pop('_streaming', False)
+        self.__dict__.update(state)
+        if streaming:
+            self._file = open(self._file_name, 'r+b')
+            self._file.truncate(self._data_offset + self.count * self._record.dtype.itemsize)
+            self._file.seek(0, os.SEEK_END)
+
+    def _finalize(self):
+        if self._file is not None:
+            self._write_header()
+            self._file.close()
+            self._file = None
+
+    def _write_header(self):
+        # En-tête .npy (version 1.0) de longueur fixe : seule la taille du tableau
+        # change d'une écriture à l'autre, les espaces de remplissage absorbant 
+        # la différence de longueur.
+        header = repr({'descr' : np.lib.format.dtype_to_descr(self._record.dtype), 'fortran_order' : False, 'shape' : (self.count,)})
+        header = header.ljust(self._data_offset - 11) + '\n'
+        position = self._file.tell()
+        self._file.seek(0)
+        self._file.write(np.lib.format.magic(1, 0) + struct.pack('<H', len(header)) + header.encode('latin1'))
+        if position:
+            self._file.seek(position)
+        self._file.flush()
+
+    def _window(self, data):
+        # époques en mémoire, en ordre chronologique
+        count = self.count
+        if count <= self._memory_size:
+            return data[:count]
+        start = count % self._memory_size
+        return np.concatenate((data[start:], data[:start]))
+
+    @property
+    def history(self):
+        return self._window(self._fitness_history)[:-1]
+
+    @property
+    def epoch(self):
+        return np.arange(max(0, self.count - self._memory_size), self.count)[:-1]
+
+    def save(self, file) -> None:
+        '''
+        Enregistre l'historique complet, relu du fichier, dans un fichier NumPy compressé (.npz) (voir History.save).
+        '''
+        if self._file is not None:
+            self._file.flush()
+        records = StreamingHistory.load(self._file_name, mmap_mode=None)
+        np.savez_compressed(file,
+                            epoch=np.arange(records.shape[0]),
+                            fitness=records['fitness'],
+                            best_solution=records['best_solution'])
+
+    @staticmethod
+    def record_type(problem_dimension : int) -> np.dtype:
+        '''Retourne le type des enregistrements du fichier pour un problème de dimension 'problem_dimension'.'''
+        return np.dtype([('fitness', np.float64, (5,)), ('best_solution', np.float64, (problem_dimension,))])
+
+    @staticmethod
+    def _header_size(dtype) -> int:
+        # longueur totale de l'en-tête pour le plus grand nombre d'époques possible, alignée sur 64 octets
+        header = repr({'descr' : np.lib.format.dtype_to_descr(dtype), 'fortran_order' : False, 'shape' : (2**63,)})
+        return (11 + len(header) + 63) // 64 * 64
+
+    @staticmethod
+    def load(file, mmap_mode : str | None = 'r') -> NDArray:
+        '''
+        Lit un fichier écrit par StreamingHistory.
+
+        Le nombre d'époques est déduit de la taille du fichier : un fichier dont l'écriture a été 
+        interrompue (l'en-tête n'ayant pas été réécrit, ou la dernière époque étant incomplète) est 
+        lu jusqu'à sa dernière époque complète.
+
+        Args:
+            file: Le nom du fichier.
+            mmap_mode (str, optional): Mode de projection en mémoire (voir np.memmap), ou None pour lire tout le fichier en mémoire.
+
+        Returns:
+            NDArray: Le tableau structuré des époques (champs 'fitness' et 'best_solution').
+        '''
+        with open(file, 'rb') as stream:
+            version = np.lib.format.read_magic(stream)
+            if version != (1, 0):
+                raise ValueError(f'Invalid input parameters in StreamingHistory.load : unsupported file format version {version}.')
+            _, _, dtype = np.lib.format.read_array_header_1_0(stream)
+            offset = stream.tell()
+            count = (os.fstat(stream.fileno()).st_size - offset) // dtype.itemsize
+            if mmap_mode is None or count == 0:
+                return np.fromfile(stream, dtype=dtype, count=count)
+        return np.memmap(file, dtype=dtype, mode=mmap_mode, offset=offset, shape=(count,))
+
+
+
+
+#    ____             __ _ _      
+#   |  _ \ _ __ ___  / _(_) | ___ 
+#   | |_) | '__/ _ \| |_| | |/ _ \
+#   |  __/| | | (_) |  _| | |  __/
+#   |_|   |_|  \___/|_| |_|_|\___|
+#                                 
+class Profile:
+    '''
+    Temps d'exécution de chaque phase de chaque époque de l'évolution, en nanosecondes (perf_counter_ns), 
+    et nombre de chromosomes évalués à chaque époque.
+
+    Les lignes correspondent aux époques de History, à partir de la première époque profilée (la 
+    ligne de l'époque 0 est l'initialisation, qui ne comprend que l'évaluation, le classement et 
+    l'historique ; une évolution reprise d'un point de reprise débute à l'époque suivant celle du 
+    point de reprise). Le profil est produit par GeneticAlgorithm lorsque la propriété profiling est 
+    activée ; désactivé, il ne coûte rien à l'évolution.
+    '''
+    PHASES = ('elitism', 'selection', 'crossover', 'mutation', 'evaluation', 'ranking', 'history', 'observers')
+
+    def __init__(self):
+        self._setup(0, None)
+
+    def _setup(self, maximum_epoch, parameters, first_epoch = 0):
+        self._times = np.zeros((maximum_epoch, len(Profile.PHASES)), dtype=np.int64)
+        self._evaluations = np.zeros(maximum_epoch, dtype=np.int64)
+        self._first_epoch = first_epoch
+        self._count = first_epoch
+        self._epoch_times = None # temps de l'époque en cours de mesure (voir _begin et _end)
+        self._strategies = {} if parameters is None else { 'selection' : parameters.selection_strategy.name,
+                                                           'crossover' : parameters.crossover_strategy.name,
+                                                           'mutation' : parameters.mutation_strategy.name,
+                                                           'evaluation' : parameters.evaluator.name }
+
+    @property
+    def first_epoch(self) -> int:
+        '''La première époque profilée.'''
+        return self._first_epoch
+
+    @property
+    def count(self) -> int:
+        '''Le nombre d'époques profilées.'''
+        return self._count - self._first_epoch
+
+    @property
+    def times(self) -> NDArray:
+        '''Les temps (époques profilées, phases) en nanosecondes, dans l'ordre de Profile.PHASES.'''
+        return self._times[self._first_epoch:self._count]
+
+    @property
+    def evaluations(self) -> NDArray:
+        '''Le nombre de chromosomes réellement évalués (hors cache de fitness) à chaque époque profilée.'''
+        return self._evaluations[self._first_epoch:self._count]
+
+    @property
+    def strategies(self) -> dict:
+        '''Le nom de la stratégie (ou de l'évaluateur) associée à chaque phase qui en dépend.'''
+        return self._strategies
+
+    def summary(self) -> list[dict]:
+        '''
+        Résume le profil : une ligne par phase avec la stratégie associée, le temps total (s), le temps 
+        moyen par époque (µs) et la part du temps total (%).
+        '''
+        totals = self.times.sum(axis=0)
+        overall = max(1, int(totals.sum()))
+        epochs = max(1, self.count)
+        return [{ 'phase' : phase,
+                  'strategy' : self._strategies.get(phase, ''),
+                  'total (s)' : float(totals[index]) * 1e-9,
+                  'per epoch (us)' : float(totals[index]) * 1e-3 / epochs,
+                  'share (%)' : 100. * float(totals[index]) / overall }
+                for index, phase in enumerate(Profile.PHASES)]
+
+    def _begin(self):
+        self._epoch_times = np.zeros(len(Profile.PHASES), dtype=np.int64)
+
+    def _end(self, epoch, evaluations):
+        self._times[epoch] = self._epoch_times
+        self._evaluations[epoch] = evaluations
+        self._count = epoch + 1
+        self._epoch_times = None
+
+    def _timed(self, index, method):
+        # Enveloppe une méthode de phase du moteur : son temps est ajouté à la phase 'index' de 
+        # l'époque en cours de mesure (une phase peut être appelée plusieurs fois par époque).
+        clock = time.perf_counter_ns
+        def timed(*args):
+            if self._epoch_times is None:
+                return method(*args)
+            start = clock()
+            result = method(*args)
+            self._epoch_times[index] += clock() - start
+            return result
+        return timed
+
+
+
+def rank_fitness(values : NDArray, ranked : NDArray | None = None) -> tuple[NDArray, NDArray, NDArray]:
+    '''
+    Classe des valeurs de fitness en ordre décroissant et calcule leurs statistiques.
+
+    Le classement utilise un simple tableau de réels (argsort stable) plutôt que le tri d'un 
+    tableau structuré. Les égalités sont départagées comme le faisait ce dernier : à valeur égale, 
+    l'index le plus grand est classé en premier. Les statistiques sont lues directement sur les 
+    valeurs classées : la meilleure, la pire et la médiane ne demandent aucun calcul supplémentaire.
+
+    Args:
+        values (NDArray): Les valeurs de fitness (N,).
+        ranked (NDArray, optional): Un tableau préalloué (N,) recevant les valeurs classées.
+
+    Returns:
+        tuple:
+            - NDArray: l'ordre de classement (N,), ranked[i] == values[order[i]]
+            - NDArray: les valeurs classées (N,)
+            - NDArray: les statistiques (5,) dans l'ordre de History : best, worst, average, std dev, median
+    '''
+    order = np.argsort(values, kind='stable')[::-1]
+    ranked = np.take(values, order, out=ranked)
+    size = ranked.size
+    average = np.sum(ranked) / size
+    deviation = ranked - average
+    middle = size // 2
+    median = ranked[middle] if size % 2 else (ranked[middle - 1] + ranked[middle]) / 2.
+    return order, ranked, np.array((ranked[0], ranked[-1], average, np.sqrt(np.dot(deviation, deviation) / size), median))
+
 
 
 #     ____                 _   _         _    _                  _ _   _               
@@ -574,6 +1326,9 @@ class History:
 
 class GeneticAlgorithm:
 
+    # méthode du moteur correspondant à chaque phase de Profile.PHASES
+    _PHASE_METHODS = ('_process_elitism', '_select', '_crossover', '_mutate', '_evaluate', '_rank_population', '_log_history', '_notify_observers')
+
     class State(Enum):
         IDLE    = 0 # (0, True, False, 'Start', 'Pause', 'RUNNING', 'IDLE', 'Idle')
         RUNNING = 1 # (1, True, True, 'Stop', 'Pause', 'IDLE', 'PAUSED', 'Running')
@@ -590,8 +1345,13 @@ class GeneticAlgorithm:
         self._observers = []
         
         self._state = GeneticAlgorithm.State.IDLE
+        self._state_condition = threading.Condition() # protège l'état lorsque l'évolution est exécutée dans un autre fil d'exécution
         self._current_epoch = 0
         self._history = History()
+        self._fitness_cache = FitnessCache()
+        self._resume_pending = False # un point de reprise a été chargé, voir load_checkpoint
+        self._profile = None # voir la propriété profiling
+        self._evaluated_count = 0
         
         self._problem_definition = problem_definition
         self._parameters = parameters
@@ -633,14 +1393,54 @@ class GeneticAlgorithm:
     def history(self):
         return self._history
 
+    @history.setter
+    def history(self, value):
+        if not isinstance(value, History):
+            raise ValueError('Invalid input value in GeneticAlgorithm.history property : value must be a History object.')
+        self._history._finalize()
+        self._history = value
+
     @property
     def population(self):
-        return self._genitors[self._genitors_fit['index']]
+        # la population est physiquement triée par performance : aucune copie n'est nécessaire
+        return self._genitors
 
     @property
     def population_fitness(self):
         return self._genitors_fit['value']
 
+    @property
+    def profiling(self) -> bool:
+        '''Indique si le temps de chaque phase de l'évolution est mesuré (voir Profile).'''
+        return self._profile is not None
+
+    @profiling.setter
+    def profiling(self, value : bool):
+        # Les méthodes de phase sont remplacées (pour ce moteur seulement) par des versions mesurées 
+        # lorsque le profilage est activé : le chemin habituel reste sans aucune mesure.
+        if value and self._profile is None:
+            self._profile = Profile()
+            self._profile._setup(self._parameters.maximum_epoch, self._parameters)
+            for index, name in enumerate(GeneticAlgorithm._PHASE_METHODS):
+                setattr(self, name, self._profile._timed(index, getattr(type(self), name).__get__(self)))
+        elif not value:
+            self._profile = None
+            for name in GeneticAlgorithm._PHASE_METHODS:
+                self.__dict__.pop(name, None)
+
+    @property
+    def profile(self) -> Profile | None:
+        '''Le profil de la dernière évolution (None si le profilage n'est pas activé).'''
+        return self._profile
+
+    @property
+    def fitness_cache_hits(self):
+        return self._fitness_cache.hits
+
+    @property
+    def fitness_cache_misses(self):
+        return self._fitness_cache.misses
+
     def add_observer(self, observer):
         if not isinstance(observer, Observer):
             raise ValueError('Observer must inherit from GAObserver.')
@@ -653,6 +1453,7 @@ class GeneticAlgorithm:
         if self._problem_definition is None:
             return
         
+        self._fitness_cache.clear() # le problème ou les paramètres ont changé, les fitness mémorisées ne sont plus valides
         self._current_epoch = 0
         self._population_1 = np.empty((self._parameters.population_size, self._problem_definition.dimension), dtype=np.float64)
         self._population_2 = np.empty((self._parameters.population_size, self._problem_definition.dimension), dtype=np.float64)
@@ -660,23 +1461,37 @@ class GeneticAlgorithm:
         self._genitors_fit_index = np.arange(self._parameters.population_size) 
         self._genitors = self._population_1
         self._offsprings = self._population_2
+        # matrices préallouées des parents sélectionnés (voir _breed), dimensionnées 
+        # pour la population entière puisque le taux d'élitisme peut changer en cours d'évolution
+        self._parents_1 = np.empty_like(self._population_1)
+        self._parents_2 = np.empty_like(self._parents_1)
+        self._ranked_fitness = np.empty(self._parameters.population_size, dtype=np.float64)
+        self._fitness_statistics = np.zeros(5, dtype=np.float64)
 
     def _log_history(self):
-        self._history._log_history( self._genitors[self._genitors_fit[0]['index']], # best solution
-                                    self._genitors_fit[0]['value'], # best fitness
-                                    self._genitors_fit[-1]['value'], # worst fitness
-                                    np.average(self._genitors_fit['value']), # average fitness
-                                    np.std(self._genitors_fit['value']), # standard deviation fitness
-                                    np.median(self._genitors_fit['value'])) # median fitness
+        # best solution, puis best, worst, average, std dev et median fitness (voir rank_fitness)
+        self._history._log_history(self._genitors[0], *self._fitness_statistics)
+
+    def _seed_generators(self, seed):
+        # Chaque générateur (moteur, domaines et stratégies) reçoit sa propre 
+        # séquence indépendante dérivée du même germe.
+        seed_sequences = np.random.SeedSequence(seed).spawn(5)
+        self._rng = np.random.default_rng(seed_sequences[0])
+        self._problem_definition.domains._rng = np.random.default_rng(seed_sequences[1])
+        self._parameters.selection_strategy._rng = np.random.default_rng(seed_sequences[2])
+        self._parameters.crossover_strategy._rng = np.random.default_rng(seed_sequences[3])
+        self._parameters.mutation_strategy._rng = np.random.default_rng(seed_sequences[4])
 
     def _initialize(self):
-        self._state = GeneticAlgorithm.State.RUNNING
+        self._set_state(GeneticAlgorithm.State.RUNNING)
         self._current_epoch = 0
+        if self._parameters.seed is not None:
+            self._seed_generators(self._parameters.seed)
+        self._fitness_cache.capacity = self._parameters.fitness_cache_size
         self._history._setup(self._parameters.maximum_epoch, self._problem_definition.dimension)
 
         self._randomize(self._genitors)
         self._process_fitness()
-
         self._log_history()
 
     def _randomized_population(self):
@@ -686,47 +1501,112 @@ class GeneticAlgorithm:
         population[:] = self._randomized_population()
 
     def _process_fitness(self):
-        self._genitors_fit['index'] = self._genitors_fit_index
-
-        if self._problem_definition._fitness_mode == ProblemDefinition.FitnessMode.BY_CHROMOSOME:
-            self._genitors_fit['value'] = np.apply_along_axis(self._problem_definition.fitness, 1, self._genitors)
-        else: # elif self._fitness_mode == ProblemDefinition.FitnessMode.BY_POPULATION:
-            self._genitors_fit['value'] = self._problem_definition.fitness(self._genitors.flatten())
-
-        if np.any(self._genitors_fit['value'] < 0.):
+        self._rank_population(self._evaluate(self._genitors))
+
+    def _evaluate(self, population):
+        if self._fitness_cache.capacity:
+            values = self._fitness_cache.evaluate(self._parameters.evaluator, self._problem_definition, population)
+        else:
+            values = self._parameters.evaluator.evaluate(self._problem_definition, population)
+            self._evaluated_count += population.shape[0]
+        return np.asarray(values, dtype=np.float64)
+
+    def _rank_population(self, values):
+        if np.any(values < 0.):
             raise ValueError('Invalid fitness. Negative value generated by fitness function. All fitness value must be positive. Suggestion : adjust the fitness function such as all return values are greather or equal than zero for the specified domain.')
-        if np.sum(self._genitors_fit['value']) <= self._parameters._epsilon_min_fitness:
+        if np.sum(values) <= self._parameters._epsilon_min_fitness:
             raise ValueError('Invalid fitness. All values are too close to zero. Suggestion : adjust the fitness function such as it returns some values greather than zero for the specified domain.')
-        if np.any(np.isnan(self._genitors_fit['value'])):
+        if np.any(np.isnan(values)):
             raise ValueError('Invalid fitness. Some fitness are NAN - Not A Number.')
 
-
-        self._genitors_fit[::-1].sort(order='value')
-        self._genitors_fit['cumul'] = np.cumsum(self._genitors_fit['value']) / np.sum(self._genitors_fit['value'])
+        order, ranked, self._fitness_statistics = rank_fitness(values, self._ranked_fitness)
+        self._genitors_fit['index'] = self._genitors_fit_index
+        self._genitors_fit['value'] = ranked
+        # la somme est faite sur la colonne de la table (comme auparavant) pour que les 
+        # poids cumulés, et donc les évolutions avec germe, restent identiques au bit près
+        self._genitors_fit['cumul'] = np.cumsum(ranked) / np.sum(self._genitors_fit['value'])
+
+        # Les géniteurs sont physiquement réordonnés par performance dans la 
+        # matrice libre (les progénitures de l'époque précédente), puis les deux
+        # matrices sont échangées : la ligne i correspond toujours à l'entrée i
+        # de la table de performance.
+        np.take(self._genitors, order, axis=0, out=self._offsprings)
+        self._genitors, self._offsprings = self._offsprings, self._genitors
 
 
     def _process_elitism(self):
         if self._parameters.elitism_size:
-            self._offsprings[0:self._parameters.elitism_size] = self._genitors[self._genitors_fit[0:self._parameters.elitism_size]['index']]
+            self._offsprings[0:self._parameters.elitism_size] = self._genitors[0:self._parameters.elitism_size]
 
     def _breed(self):
-        g1 = self._parameters.selection_strategy.select(self._genitors, self._genitors_fit, self._parameters.selection_rate, self._parameters.population_size - self._parameters.elitism_size)
-        g2 = self._parameters.selection_strategy.select(self._genitors, self._genitors_fit, self._parameters.selection_rate, self._parameters.population_size - self._parameters.elitism_size)
+        g1 = self._select(self._parents_1)
+        g2 = self._select(self._parents_2)
+        self._crossover(g1, g2)
+
+    def _crossover(self, g1, g2):
         self._parameters.crossover_strategy.breed(g1, g2, self._offsprings[self._parameters.elitism_size:])
 
+    def _select(self, parents):
+        # Si la stratégie produit des index, les géniteurs sélectionnés sont 
+        # copiés dans la matrice préallouée 'parents', sinon la copie produite 
+        # par la stratégie est utilisée.
+        selection_size = self._parameters.population_size - self._parameters.elitism_size
+        indices = self._parameters.selection_strategy.select_indices(self._genitors_fit, self._parameters.selection_rate, selection_size)
+        if indices is None:
+            return self._parameters.selection_strategy.select(self._genitors, self._genitors_fit, self._parameters.selection_rate, selection_size)
+        return np.take(self._genitors, indices, axis=0, out=parents[:selection_size])
+
     def _mutate(self):
         self._parameters.mutation_strategy.mutate(self._offsprings[self._parameters.elitism_size:], self._parameters.mutation_rate, self._problem_definition.domains)
 
-    def evolve_one(self): # to do : to restructure with new state
-        pass
-    #     if self.is_ready:
-    #         if self._current_epoch == 0:
-    #             self._initialize()
-    #
-    #         self._evolve_one()
-    #       
-    #         if self.has_evolved:
-    #             self._state = GeneticAlgorithm.State.IDLE
+    def evolve_one(self) -> None:
+        '''
+        Fait évoluer la population d'une seule époque.
+
+        Si aucune évolution n'est en cours, une nouvelle évolution est d'abord initialisée (ou 
+        reprise d'un point de reprise chargé). L'évolution se termine, comme avec evolve, lorsque 
+        le nombre maximum d'époques est atteint.
+        '''
+        if self.is_ready:
+            if self._state == GeneticAlgorithm.State.IDLE:
+                self._start()
+                if self.has_evolved:
+                    self._set_state(GeneticAlgorithm.State.IDLE)
+                    self._history._finalize()
+                    return
+
+            try:
+                if self._profile is None:
+                    self._evolve_one()
+                else:
+                    self._profiled(self._evolve_one)
+            except BaseException:
+                self._set_state(GeneticAlgorithm.State.IDLE)
+                self._history._finalize()
+                raise
+
+            if self.has_evolved:
+                self._set_state(GeneticAlgorithm.State.IDLE)
+                self._history._finalize()
+
+    def immigrate(self, chromosomes : NDArray) -> None:
+        '''
+        Remplace les pires géniteurs de la population courante par des chromosomes venus d'ailleurs 
+        (par exemple d'une autre population, voir gaislands) et classe de nouveau la population.
+
+        Seuls les chromosomes reçus sont évalués. Au plus population_size chromosomes sont retenus.
+
+        Args:
+            chromosomes (NDArray): Les chromosomes reçus (r lignes de chromosomes, c colonnes de gènes).
+        '''
+        chromosomes = np.asarray(chromosomes, dtype=np.float64).reshape(-1, self._problem_definition.dimension)
+        count = min(chromosomes.shape[0], self._parameters.population_size)
+        if count == 0:
+            return
+        values = self._genitors_fit['value'].copy()
+        self._genitors[-count:] = chromosomes[:count]
+        values[-count:] = self._evaluate(self._genitors[-count:])
+        self._rank_population(values)
 
     def _evolve_one(self):
         self._process_elitism()
@@ -739,42 +1619,138 @@ class GeneticAlgorithm:
 
         self._current_epoch += 1
         self._log_history()
-        
+        self._notify_observers()
+
+    def _notify_observers(self):
         for obs in self._observers:
             obs.update(self)
 
+    def _profiled(self, step):
+        # Exécute une étape (initialisation ou époque) en mesurant ses phases (voir la propriété profiling).
+        evaluations = self._evaluation_count()
+        self._profile._begin()
+        step()
+        self._profile._end(self._current_epoch, self._evaluation_count() - evaluations)
+
+    def _evaluation_count(self):
+        # nombre cumulatif de chromosomes réellement évalués (voir Profile.evaluations)
+        return self._fitness_cache.misses if self._fitness_cache.capacity else self._evaluated_count
+
     def evolve(self) -> None:
         if self.is_ready:
+            try:
+                self._start()
+
+                evolve_one = self._evolve_one if self._profile is None else functools.partial(self._profiled, self._evolve_one)
+                for i in range(self._current_epoch, self._parameters.maximum_epoch - 1): # -1 because initialization is first epoch
+                    evolve_one()
+
+                    if not self._wait_while_paused():
+                        return
+                    
+                self._set_state(GeneticAlgorithm.State.IDLE)
+            finally:
+                self._history._finalize()
+
+    def _start(self):
+        # Débute une nouvelle évolution, ou poursuit celle d'un point de reprise chargé (le profil 
+        # débute alors à l'époque suivant celle du point de reprise).
+        if self._resume_pending:
+            self._resume_pending = False
+            if self._profile is not None:
+                self._profile._setup(self._parameters.maximum_epoch, self._parameters, self._current_epoch + 1)
+            self._set_state(GeneticAlgorithm.State.RUNNING)
+        elif self._profile is None:
             self._initialize()
-
-            for i in range(self._parameters.maximum_epoch - 1): # -1 because initialization is first epoch
-                self._evolve_one()
-
-                while self._state == GeneticAlgorithm.State.PAUSED: # monothread simplification -> should be multithreaded or, at least, managed with Qt's signal --- this approach require resuming from an observer 
-                    for obs in self._observers:
-                        obs.update(self)
-
-                if self._state == GeneticAlgorithm.State.IDLE:
-                    return
-                
-            self._state = GeneticAlgorithm.State.IDLE
+        else:
+            self._profile._setup(self._parameters.maximum_epoch, self._parameters)
+            self._profiled(self._initialize)
+
+    def _wait_while_paused(self) -> bool:
+        # Attente bloquante (sans consommer de processeur) tant que l'évolution
+        # est en pause. Retourne False si l'évolution doit s'arrêter.
+        with self._state_condition:
+            while self._state == GeneticAlgorithm.State.PAUSED:
+                self._state_condition.wait()
+            return self._state != GeneticAlgorithm.State.IDLE
+
+    def _set_state(self, state):
+        with self._state_condition:
+            self._state = state
+            self._state_condition.notify_all()
             
     @property
     def has_evolved(self):
         return self._current_epoch >= self._parameters.maximum_epoch - 1
 
+    # Les fonctions stop, pause et resume peuvent être appelées à partir d'un
+    # autre fil d'exécution que celui qui exécute evolve.
     def stop(self):
-        self._state = GeneticAlgorithm.State.IDLE
+        self._set_state(GeneticAlgorithm.State.IDLE)
 
     def pause(self):
-        self._state = GeneticAlgorithm.State.PAUSED
+        self._set_state(GeneticAlgorithm.State.PAUSED)
 
     def resume(self):
-        self._state = GeneticAlgorithm.State.RUNNING
+        self._set_state(GeneticAlgorithm.State.RUNNING)
 
     def reset(self):
+        self._resume_pending = False
         self._history._setup(self._parameters.maximum_epoch, self._problem_definition.dimension)
 
+    def save_checkpoint(self, file) -> None:
+        '''
+        Enregistre l'état complet de l'évolution dans un fichier (pickle) : population, table de 
+        performance, époque courante, historique, paramètres (stratégies comprises) et l'état de 
+        tous les générateurs aléatoires (moteur, domaines et stratégies).
+
+        Le fichier est d'abord écrit sous un nom temporaire puis renommé : un point de reprise 
+        existant n'est jamais laissé à moitié écrit, même si le processus est interrompu.
+
+        La définition du problème n'est pas enregistrée (sa fonction de fitness n'est pas toujours 
+        sérialisable) : le point de reprise doit être chargé dans un moteur du même problème.
+        '''
+        state = { 'version' : 1,
+                  'dimension' : self._problem_definition.dimension,
+                  'epoch' : self._current_epoch,
+                  'genitors' : self._genitors,
+                  'genitors_fit' : self._genitors_fit,
+                  'history' : self._history,
+                  'parameters' : self._parameters,
+                  'rng' : self._rng,
+                  'domains_rng' : self._problem_definition.domains._rng }
+        temporary_file = f'{os.fspath(file)}.tmp'
+        with open(temporary_file, 'wb') as stream:
+            pickle.dump(state, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, file)
+
+    def load_checkpoint(self, file) -> None:
+        '''
+        Restaure l'état enregistré par save_checkpoint. Le prochain appel à evolve poursuit 
+        l'évolution à partir de l'époque suivante et produit exactement les mêmes résultats que 
+        l'évolution d'origine (pour une fonction de fitness déterministe).
+
+        Les paramètres du point de reprise remplacent ceux du moteur.
+        '''
+        if not self.is_ready:
+            raise ValueError('Invalid checkpoint : the genetic algorithm has no problem definition.')
+        with open(file, 'rb') as stream:
+            state = pickle.load(stream)
+        if not isinstance(state, dict) or state.get('version') != 1:
+            raise ValueError(f'Invalid checkpoint "{file}" : unsupported file format.')
+        if state['dimension'] != self._problem_definition.dimension:
+            raise ValueError(f'Invalid checkpoint "{file}" : the problem dimension ({state["dimension"]}) does not match the current problem ({self._problem_definition.dimension}).')
+
+        self.parameters = state['parameters']
+        self._genitors[:] = state['genitors']
+        self._genitors_fit[:] = state['genitors_fit']
+        self._current_epoch = state['epoch']
+        self._rng = state['rng']
+        self._problem_definition.domains._rng = state['domains_rng']
+        self._fitness_cache.capacity = self._parameters.fitness_cache_size
+        self.history = state['history']
+        self._resume_pending = True
+
     @property
     def state(self):
         return self._state
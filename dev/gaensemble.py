@@ -0,0 +1,249 @@
+import numpy as np
+from numpy.typing import NDArray
+
+from gacvm import (GeneMutationStrategy, History, Parameters, ProblemDefinition,
+                   RouletteWheelSelectionStrategy, WeightedAverageCrossoverStrategy)
+
+
+
+# Ensemble d'exécutions indépendantes d'un même problème, évoluées ensemble.
+#
+# Pour obtenir des statistiques, un même problème est résolu plusieurs dizaines
+# de fois avec des germes différents. Plutôt que d'exécuter K boucles
+# d'évolution (et de payer K fois le coût de Python à chaque époque), les K
+# populations sont conservées dans une seule matrice (K, population, dimension)
+# et chaque étape (sélection, croisement, mutation, fitness, classement) est
+# faite pour toutes les exécutions à la fois, par les mêmes appels NumPy.
+#
+# Les stratégies reproduites sont celles par défaut de gacvm : sélection par
+# roulette, croisement par moyenne pondérée et mutation d'un seul gène. Les
+# exécutions sont indépendantes et statistiquement équivalentes à K exécutions
+# de GeneticAlgorithm, mais les tirages aléatoires étant faits pour tout
+# l'ensemble, elles ne reproduisent pas les exécutions de GeneticAlgorithm
+# ayant les mêmes germes.
+#
+#   ensemble = EnsembleGeneticAlgorithm(gaproblems.open_box_problem(10., 5.), parameters, run_count=50)
+#   ensemble.evolve()
+#   best = [history.best_fitness for history in ensemble.histories]
+
+
+
+#    _____                          _     _      
+#   | ____|_ __  ___  ___ _ __ ___ | |__ | | ___ 
+#   |  _| | '_ \/ __|/ _ \ '_ ` _ \| '_ \| |/ _ \
+#   | |___| | | \__ \  __/ | | | | | |_) | |  __/
+#   |_____|_| |_|___/\___|_| |_| |_|_.__/|_|\___|
+#                                                
+def select_indices_batched(cumul : NDArray, random_select : NDArray) -> NDArray:
+    '''
+    Sélection par roulette pour plusieurs exécutions à la fois (voir RouletteWheelSelectionStrategy._select_indices).
+
+    Les sommes cumulatives de chaque exécution (toutes comprises entre 0 et 1) sont décalées de
+    2 * k pour l'exécution k : mises bout à bout, elles forment un seul vecteur croissant dans
+    lequel tous les tirages de toutes les exécutions sont recherchés par une seule recherche triée.
+
+    Args:
+        cumul (NDArray): Les sommes cumulatives normalisées (K, P) des performances triées de chaque exécution.
+        random_select (NDArray): Les tirages (K, S) de chaque exécution, déjà pondérés par le taux de sélection.
+
+    Returns:
+        NDArray: Les index (K * S,) des géniteurs sélectionnés dans la matrice des populations mises bout à bout (K * P, D).
+    '''
+    run_count, population_size = cumul.shape
+    offsets = 2. * np.arange(run_count)[:, np.newaxis]
+    flat_cumul = (cumul + offsets).ravel()
+    threshold = (np.maximum(cumul[:, :1], random_select) + offsets).ravel()
+    last = np.searchsorted(flat_cumul, threshold, side='right') - 1
+    return np.searchsorted(flat_cumul, flat_cumul[last], side='left')
+
+
+class EnsembleGeneticAlgorithm:
+    '''
+    Fait évoluer run_count exécutions indépendantes d'un même problème avec les mêmes paramètres,
+    toutes à la fois.
+
+    Les paramètres doivent utiliser les stratégies par défaut (RouletteWheelSelectionStrategy,
+    WeightedAverageCrossoverStrategy et GeneMutationStrategy) : ce sont elles qui sont reproduites
+    pour l'ensemble. L'évaluateur des paramètres évalue toutes les populations en un seul appel.
+    '''
+    def __init__(self, problem_definition : ProblemDefinition, parameters : Parameters = Parameters(), run_count : int = 30) -> None:
+        if not isinstance(problem_definition, ProblemDefinition):
+            raise ValueError('Invalid input parameters in EnsembleGeneticAlgorithm : problem_definition must be a ProblemDefinition object.')
+        if not isinstance(parameters, Parameters):
+            raise ValueError('Invalid input parameters in EnsembleGeneticAlgorithm : parameters must be a Parameters object.')
+        if (type(parameters.selection_strategy) is not RouletteWheelSelectionStrategy
+            or type(parameters.crossover_strategy) is not WeightedAverageCrossoverStrategy
+            or type(parameters.mutation_strategy) is not GeneMutationStrategy):
+            raise ValueError('Invalid input parameters in EnsembleGeneticAlgorithm : only the default strategies (roulette wheel selection, weighted average crossover and single gene mutation) can be evolved as an ensemble.')
+        if run_count < 1:
+            raise ValueError('Invalid input parameters in EnsembleGeneticAlgorithm : run_count must be greater or equal than 1.')
+
+        self._problem_definition = problem_definition
+        self._parameters = parameters
+        self._run_count = run_count
+        self._current_epoch = 0
+        self._last_epoch = -1
+        self._setup()
+
+    @property
+    def problem_definition(self) -> ProblemDefinition:
+        return self._problem_definition
+
+    @property
+    def parameters(self) -> Parameters:
+        return self._parameters
+
+    @property
+    def run_count(self) -> int:
+        return self._run_count
+
+    @property
+    def current_epoch(self) -> int:
+        return self._current_epoch
+
+    @property
+    def populations(self) -> NDArray:
+        '''Les populations (K, P, D) de chaque exécution, triées par performance.'''
+        return self._genitors
+
+    @property
+    def population_fitness(self) -> NDArray:
+        '''Les fitness (K, P) triées de chaque exécution.'''
+        return self._ranked_fitness
+
+    @property
+    def best_fitness(self) -> NDArray:
+        '''La meilleure fitness (K,) de chaque exécution à l'époque courante.'''
+        return self._ranked_fitness[:, 0]
+
+    @property
+    def best_solution(self) -> NDArray:
+        '''La meilleure solution (K, D) de chaque exécution à l'époque courante.'''
+        return self._genitors[:, 0]
+
+    @property
+    def histories(self) -> list[History]:
+        '''
+        L'historique de chaque exécution. Les historiques partagent les données de l'ensemble (sans
+        copie) mais leur nombre d'époques est celui du moment où ils sont obtenus.
+        '''
+        return [History._from_arrays(self._fitness_history[:, run], self._best_solution_history[:, run], self._last_epoch + 1)
+                for run in range(self._run_count)]
+
+    @property
+    def has_evolved(self) -> bool:
+        return self._current_epoch >= self._parameters.maximum_epoch - 1
+
+    def _setup(self):
+        shape = (self._run_count, self._parameters.population_size, self._problem_definition.dimension)
+        self._population_1 = np.empty(shape, dtype=np.float64)
+        self._population_2 = np.empty(shape, dtype=np.float64)
+        self._genitors = self._population_1
+        self._offsprings = self._population_2
+        self._parents_1 = np.empty((shape[0] * shape[1], shape[2]), dtype=np.float64)
+        self._parents_2 = np.empty_like(self._parents_1)
+        self._ranked_fitness = np.zeros(shape[:2], dtype=np.float64)
+        self._cumul = np.empty(shape[:2], dtype=np.float64)
+        self._row_offsets = np.arange(shape[0])[:, np.newaxis] * shape[1]
+        self._fitness_history = np.zeros((0, shape[0], 5), dtype=np.float64)
+        self._best_solution_history = np.zeros((0, shape[0], shape[2]), dtype=np.float64)
+
+    def _seed_generators(self):
+        # générateurs indépendants pour l'initialisation, la sélection, le croisement et la mutation (voir GeneticAlgorithm._seed_generators)
+        self._rng_population, self._rng_selection, self._rng_crossover, self._rng_mutation = (
+            np.random.default_rng(sequence) for sequence in np.random.SeedSequence(self._parameters.seed).spawn(4))
+
+    def _initialize(self):
+        if self._genitors.shape[1:] != (self._parameters.population_size, self._problem_definition.dimension):
+            self._setup()
+        self._seed_generators()
+        self._current_epoch = 0
+        self._last_epoch = -1
+        self._fitness_history = np.zeros((self._parameters.maximum_epoch, self._run_count, 5), dtype=np.float64) # best, worst, average, std dev, median
+        self._best_solution_history = np.zeros((self._parameters.maximum_epoch, self._run_count, self._problem_definition.dimension), dtype=np.float64)
+
+        population_size = self._parameters.population_size
+        self._genitors[:] = self._problem_definition.domains.random_population(self._run_count * population_size, self._rng_population).reshape(self._genitors.shape)
+        self._process_fitness()
+        self._log_history()
+
+    def _flat(self, populations):
+        # les populations mises bout à bout (K * P, D), sans copie
+        return populations.reshape(-1, populations.shape[2])
+
+    def _process_fitness(self):
+        values = self._parameters.evaluator.evaluate(self._problem_definition, self._flat(self._genitors))
+        values = np.asarray(values, dtype=np.float64).reshape(self._ranked_fitness.shape)
+
+        if np.any(values < 0.):
+            raise ValueError('Invalid fitness. Negative value generated by fitness function. All fitness value must be positive. Suggestion : adjust the fitness function such as all return values are greather or equal than zero for the specified domain.')
+        totals = np.sum(values, axis=1)
+        if np.any(totals <= self._parameters._epsilon_min_fitness):
+            raise ValueError('Invalid fitness. All values are too close to zero. Suggestion : adjust the fitness function such as it returns some values greather than zero for the specified domain.')
+        if np.any(np.isnan(values)):
+            raise ValueError('Invalid fitness. Some fitness are NAN - Not A Number.')
+
+        # classement décroissant de chaque exécution (mêmes égalités que rank_fitness)
+        order = np.argsort(values, axis=1, kind='stable')[:, ::-1]
+        self._ranked_fitness[:] = np.take_along_axis(values, order, axis=1)
+        np.cumsum(self._ranked_fitness, axis=1, out=self._cumul)
+        self._cumul /= totals[:, np.newaxis]
+
+        np.take(self._flat(self._genitors), (order + self._row_offsets).ravel(), axis=0, out=self._flat(self._offsprings))
+        self._genitors, self._offsprings = self._offsprings, self._genitors
+
+    def _log_history(self):
+        self._last_epoch += 1
+        ranked = self._ranked_fitness
+        population_size = ranked.shape[1]
+        average = np.sum(ranked, axis=1) / population_size
+        deviation = ranked - average[:, np.newaxis]
+        middle = population_size // 2
+        median = ranked[:, middle] if population_size % 2 else (ranked[:, middle - 1] + ranked[:, middle]) / 2.
+
+        statistics = self._fitness_history[self._last_epoch]
+        statistics[:, 0] = ranked[:, 0]
+        statistics[:, 1] = ranked[:, -1]
+        statistics[:, 2] = average
+        statistics[:, 3] = np.sqrt(np.einsum('ij,ij->i', deviation, deviation) / population_size)
+        statistics[:, 4] = median
+        self._best_solution_history[self._last_epoch] = self._genitors[:, 0]
+
+    def _evolve_one(self):
+        elitism_size = self._parameters.elitism_size
+        if elitism_size:
+            self._offsprings[:, :elitism_size] = self._genitors[:, :elitism_size]
+        if elitism_size != self._parameters.population_size:
+            self._breed(elitism_size)
+            self._mutate(elitism_size)
+
+        self._genitors, self._offsprings = self._offsprings, self._genitors
+        self._process_fitness()
+
+        self._current_epoch += 1
+        self._log_history()
+
+    def _breed(self, elitism_size):
+        run_count, population_size, dimension = self._genitors.shape
+        selection_size = population_size - elitism_size
+        parents = []
+        for buffer in (self._parents_1, self._parents_2):
+            random_select = self._rng_selection.random((run_count, selection_size)) * self._parameters.selection_rate
+            parents.append(np.take(self._flat(self._genitors), select_indices_batched(self._cumul, random_select), axis=0, out=buffer[:run_count * selection_size]))
+
+        weight = self._rng_crossover.random((run_count * selection_size, 1))
+        self._offsprings[:, elitism_size:] = (weight * parents[0] + (1. - weight) * parents[1]).reshape(run_count, selection_size, dimension)
+
+    def _mutate(self, elitism_size):
+        run_count, population_size, dimension = self._offsprings.shape
+        selection_size = population_size - elitism_size
+        mutated = np.flatnonzero(self._rng_mutation.random(run_count * selection_size) <= self._parameters.mutation_rate)
+        genes = self._rng_mutation.integers(0, dimension, mutated.size)
+        rows = (mutated // selection_size) * population_size + elitism_size + mutated % selection_size
+        self._flat(self._offsprings)[rows, genes] = self._problem_definition.domains.random_genes(genes, self._rng_mutation)
+
+    def evolve(self) -> None:
+        '''Fait évoluer toutes les exécutions jusqu'au nombre maximum d'époques.'''
+        self._initialize()
+        for i in range(self._parameters.maximum_epoch - 1): # -1 because initialization is first epoch
+            self._evolve_one()
@@ -0,0 +1,300 @@
+import multiprocessing
+import os
+import traceback
+from enum import Enum
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from gacvm import GeneticAlgorithm, History, Parameters, ProblemDefinition
+
+
+
+# Modèle en îlots : plusieurs populations (îlots) évoluent en parallèle, chacune
+# dans son propre processus, et échangent périodiquement leurs meilleurs
+# chromosomes (migration).
+#
+# Chaque îlot est un GeneticAlgorithm complet, avec ses propres paramètres et
+# stratégies. Toutes les 'migration_period' époques, chaque îlot envoie ses
+# 'migration_size' meilleurs chromosomes aux îlots voisins selon la topologie
+# (anneau ou graphe complet) ; les chromosomes reçus remplacent les pires
+# chromosomes de l'îlot (voir GeneticAlgorithm.immigrate).
+#
+# Les migrations sont synchrones et toujours faites dans le même ordre : avec un
+# germe, une exécution est reproductible peu importe la charge des processus.
+#
+# Le problème est construit dans chaque processus à partir d'une fabrique (par
+# exemple gaproblems.open_box_problem) et de ses arguments, puisque la fonction
+# de fitness d'une définition de problème n'est pas toujours sérialisable :
+#
+#   islands = IslandModel(gaproblems.open_box_problem, Parameters(), island_count=8,
+#                         problem_arguments={'width' : 10., 'height' : 5.}, seed=1)
+#   islands.evolve()
+#   print(islands.best_fitness, islands.best_solution)
+
+
+
+#   __        __         _             
+#   \ \      / /__  _ __| | _____ _ __ 
+#    \ \ /\ / / _ \| '__| |/ / _ \ '__|
+#     \ V  V / (_) | |  |   <  __/ |   
+#      \_/\_/ \___/|_|  |_|\_\___|_|   
+#                                      
+def _island_worker(connection, problem_factory : Callable[..., ProblemDefinition], problem_arguments : dict, parameters : Parameters, seed : int, migration_size : int) -> None:
+    """Boucle d'un processus d'îlot : exécute les commandes reçues du modèle jusqu'à la commande 'close'."""
+    try:
+        parameters.seed = seed
+        ga = GeneticAlgorithm(problem_factory(**problem_arguments), parameters)
+        connection.send(('ok', None)) # l'îlot est prêt
+        finished = False
+        while True:
+            command, argument = connection.recv()
+            if command == 'evolve':
+                for _ in range(argument):
+                    if finished:
+                        break
+                    ga.evolve_one()
+                    finished = ga.state == GeneticAlgorithm.State.IDLE
+                connection.send(('ok', (ga.population[:migration_size].copy(), ga.history.best_fitness, ga.current_epoch, finished)))
+            elif command == 'immigrate':
+                ga.immigrate(argument)
+                connection.send(('ok', None))
+            elif command == 'result':
+                connection.send(('ok', (ga.history, ga.population.copy(), ga.population_fitness.copy())))
+            elif command == 'close':
+                break
+    except BaseException:
+        connection.send(('error', traceback.format_exc()))
+    finally:
+        parameters.evaluator.close()
+        connection.close()
+
+
+
+#    ___     _                 _   __  __           _      _ 
+#   |_ _|___| | __ _ _ __   __| | |  \/  | ___   __| | ___| |
+#    | |/ __| |/ _` | '_ \ / _` | | |\/| |/ _ \ / _` |/ _ \ |
+#    | |\__ \ | (_| | | | | (_| | | |  | | (_) | (_| |  __/ |
+#   |___|___/_|\__,_|_| |_|\__,_| |_|  |_|\___/ \__,_|\___|_|
+#                                                            
+class IslandModel:
+    '''
+    Fait évoluer plusieurs populations d'un même problème dans des processus séparés, avec migration
+    périodique des meilleurs chromosomes entre les îlots.
+    '''
+
+    class Topology(Enum):
+        RING            = 0 # l'îlot i reçoit les chromosomes de l'îlot i - 1
+        FULLY_CONNECTED = 1 # chaque îlot reçoit les chromosomes de tous les autres îlots
+
+    def __init__(self, problem_factory : Callable[..., ProblemDefinition], parameters : Parameters | list[Parameters],
+                 island_count : int | None = None, problem_arguments : dict | None = None,
+                 migration_period : int = 10, migration_size : int = 2,
+                 topology : 'IslandModel.Topology' = Topology.RING, seed : int | None = None,
+                 start_method : str | None = None) -> None:
+        '''
+        Args:
+            problem_factory (Callable): Fonction (sérialisable) retournant la définition du problème.
+            parameters (Parameters | list of Parameters): Les paramètres de chaque îlot, ou des paramètres communs à 'island_count' îlots.
+            island_count (int, optional): Le nombre d'îlots lorsque des paramètres communs sont donnés (par défaut, le nombre de coeurs).
+            problem_arguments (dict, optional): Les arguments de la fabrique de problème.
+            migration_period (int): Le nombre d'époques entre deux migrations.
+            migration_size (int): Le nombre de chromosomes envoyés par chaque îlot à chaque migration.
+            topology (IslandModel.Topology): La topologie des migrations.
+            seed (int, optional): Germe dont sont dérivés les germes de tous les îlots (remplace le germe de leurs paramètres). Par défaut, 
+                chaque îlot garde le germe de ses propres paramètres ; avec des paramètres communs, leur germe sert de germe au modèle. 
+                Les îlots sans germe reçoivent un germe aléatoire distinct.
+            start_method (str, optional): Méthode de création des processus (voir multiprocessing.get_context).
+        '''
+        if isinstance(parameters, Parameters):
+            if seed is None:
+                seed = parameters.seed # un germe commun donnerait des îlots identiques : il sert plutôt de germe au modèle
+            parameters = [parameters] * (island_count or os.cpu_count() or 1)
+        elif island_count is not None and island_count != len(parameters):
+            raise ValueError('Invalid input parameters in IslandModel : island_count does not match the number of parameters.')
+        if len(parameters) < 1 or not all(isinstance(island_parameters, Parameters) for island_parameters in parameters):
+            raise ValueError('Invalid input parameters in IslandModel : parameters must be a Parameters object or a non empty list of Parameters objects.')
+        if migration_period < 1:
+            raise ValueError('Invalid input parameters in IslandModel : migration_period must be greater or equal than 1.')
+        if migration_size < 0:
+            raise ValueError('Invalid input parameters in IslandModel : migration_size must be greater or equal than 0.')
+        if not isinstance(topology, IslandModel.Topology):
+            raise ValueError('Invalid input parameters in IslandModel : topology must be an IslandModel.Topology value.')
+
+        self._problem_factory = problem_factory
+        self._problem_arguments = problem_arguments or {}
+        self._parameters = list(parameters)
+        self._migration_period = migration_period
+        self._migration_size = migration_size
+        self._topology = topology
+        self._seed = seed
+        self._context = multiprocessing.get_context(start_method)
+
+        self._migration_count = 0
+        self._epochs = np.zeros(self.island_count, dtype=np.int64)
+        self._best_fitnesses = np.zeros(self.island_count, dtype=np.float64)
+        self._histories = []
+        self._populations = []
+        self._population_fitnesses = []
+
+    @property
+    def island_count(self) -> int:
+        return len(self._parameters)
+
+    @property
+    def topology(self) -> 'IslandModel.Topology':
+        return self._topology
+
+    @property
+    def migration_count(self) -> int:
+        '''Le nombre de migrations effectuées.'''
+        return self._migration_count
+
+    @property
+    def epochs(self) -> NDArray:
+        '''L'époque courante de chaque îlot.'''
+        return self._epochs
+
+    @property
+    def best_fitnesses(self) -> NDArray:
+        '''La meilleure fitness de chaque îlot à la dernière migration.'''
+        return self._best_fitnesses
+
+    @property
+    def histories(self) -> list[History]:
+        '''L'historique de chaque îlot (disponible une fois l'évolution terminée).'''
+        return self._histories
+
+    @property
+    def populations(self) -> list[NDArray]:
+        '''La population finale de chaque îlot, triée par performance (disponible une fois l'évolution terminée).'''
+        return self._populations
+
+    @property
+    def population_fitnesses(self) -> list[NDArray]:
+        return self._population_fitnesses
+
+    @property
+    def best_island(self) -> int:
+        return int(np.argmax(self._best_fitnesses))
+
+    @property
+    def best_fitness(self) -> float:
+        return self._best_fitnesses[self.best_island]
+
+    @property
+    def best_solution(self) -> NDArray | None:
+        if not self._populations:
+            return None
+        return self._populations[self.best_island][0]
+
+    def _seeds(self) -> list[int]:
+        # Un germe par îlot, toujours explicite : les paramètres envoyés aux processus sont des 
+        # copies dont les générateurs aléatoires seraient autrement identiques d'un îlot à l'autre.
+        derived = [int(sequence.generate_state(1)[0]) for sequence in np.random.SeedSequence(self._seed).spawn(self.island_count)]
+        if self._seed is not None:
+            return derived
+        return [island_derived if parameters.seed is None else parameters.seed
+                for parameters, island_derived in zip(self._parameters, derived)]
+
+    def _sources(self, island : int) -> list[int]:
+        # îlots dont 'island' reçoit les chromosomes à chaque migration
+        if self.island_count == 1:
+            return []
+        if self._topology == IslandModel.Topology.RING:
+            return [(island - 1) % self.island_count]
+        return [source for source in range(self.island_count) if source != island]
+
+    def evolve(self, callback : Callable[['IslandModel'], None] | None = None) -> None:
+        '''
+        Fait évoluer tous les îlots jusqu'à ce que chacun ait atteint son nombre maximum d'époques.
+
+        Args:
+            callback (Callable, optional): Fonction appelée avec le modèle après chaque migration.
+        '''
+        connections = []
+        processes = []
+        try:
+            for parameters, seed in zip(self._parameters, self._seeds()):
+                connection, worker_connection = self._context.Pipe()
+                process = self._context.Process(target=_island_worker,
+                                                args=(worker_connection, self._problem_factory, self._problem_arguments, parameters, seed, self._migration_size),
+                                                daemon=True)
+                process.start()
+                worker_connection.close()
+                connections.append(connection)
+                processes.append(process)
+            for island, connection in enumerate(connections):
+                self._receive(island, connection)
+
+            self._migration_count = 0
+            finished = np.zeros(self.island_count, dtype=bool)
+            while not finished.all():
+                for connection in connections:
+                    connection.send(('evolve', self._migration_period))
+                emigrants = []
+                for island, connection in enumerate(connections):
+                    chromosomes, self._best_fitnesses[island], self._epochs[island], finished[island] = self._receive(island, connection)
+                    emigrants.append(chromosomes)
+
+                if self._migration_size and not finished.all():
+                    receivers = [island for island in range(self.island_count) if not finished[island] and self._sources(island)]
+                    for island in receivers:
+                        connections[island].send(('immigrate', np.concatenate([emigrants[source] for source in self._sources(island)])))
+                    for island in receivers:
+                        self._receive(island, connections[island])
+                    self._migration_count += 1
+
+                if callback is not None:
+                    callback(self)
+
+            for connection in connections:
+                connection.send(('result', None))
+            results = [self._receive(island, connection) for island, connection in enumerate(connections)]
+            self._histories = [history for history, _, _ in results]
+            self._populations = [population for _, population, _ in results]
+            self._population_fitnesses = [fitness for _, _, fitness in results]
+            self._best_fitnesses[:] = [fitness[0] for fitness in self._population_fitnesses]
+
+            for connection in connections:
+                connection.send(('close', None))
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for connection in connections:
+                connection.close()
+
+    @staticmethod
+    def _receive(island : int, connection):
+        try:
+            status, payload = connection.recv()
+        except EOFError as error:
+            raise RuntimeError(f'Island {island} process ended unexpectedly.') from error
+        if status == 'error':
+            raise RuntimeError(f'Island {island} failed :\n{payload}')
+        return payload
+
+
+
+def main():
+    import time
+
+    import gaproblems
+
+    parameters = Parameters()
+    parameters.maximum_epoch = 200
+    parameters.population_size = 200
+    islands = IslandModel(gaproblems.shape_optimizer_problem, parameters, island_count=4,
+                          problem_arguments={'shape' : 'Etoile', 'obstacles' : 50, 'seed' : 1},
+                          migration_period=10, migration_size=4, seed=1)
+    start = time.perf_counter()
+    islands.evolve(lambda model : print(f'Migration {model.migration_count} : best fitness by island {model.best_fitnesses}'))
+    print(f'Elapsed time : {time.perf_counter() - start:0.3f} s')
+    print(f'Best fitness : {islands.best_fitness} (island {islands.best_island})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+import functools
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+from gacvm import Domains, ProblemDefinition
+from physics_sim import PhysSim
+from umath import IntervalIndex, PointGrid, polygon_area
+
+
+
+# Définitions des problèmes fournis, sans aucune dépendance à Qt.
+#
+# Chaque problème est décrit par :
+#   - une fonction objective vectorisée, définie au niveau du module, qui 
+#     évalue toute une population à la fois (FitnessMode.BY_POPULATION)
+#   - une fonction 'fabrique' qui retourne le ProblemDefinition complet à 
+#     partir des données initiales du problème
+#
+# Les panneaux de l'application graphique délèguent leur fonction objective 
+# à ce module. Les fabriques permettent de résoudre les mêmes problèmes sans
+# interface graphique (voir garun.py). Puisque les fonctions objectives sont 
+# définies au niveau du module (functools.partial), elles peuvent aussi être 
+# transmises à des processus de travail (voir ProcessPoolEvaluator).
+
+
+
+#     ___                     _                                 _     _                
+#    / _ \ _ __   ___ _ __   | |__   _____  __  _ __  _ __ ___ | |__ | | ___ _ __ ___  
+#   | | | | '_ \ / _ \ '_ \  | '_ \ / _ \ \/ / | '_ \| '__/ _ \| '_ \| |/ _ \ '_ ` _ \ 
+#   | |_| | |_) |  __/ | | | | |_) | (_) >  <  | |_) | | | (_) | |_) | |  __/ | | | | |
+#    \___/| .__/ \___|_| |_| |_.__/ \___/_/\_\ | .__/|_|  \___/|_.__/|_|\___|_| |_| |_|
+#         |_|                                  |_|                                     
+def open_box_volume(population : NDArray, width : float, height : float) -> NDArray:
+    """Retourne le volume de la boîte obtenue en fonction de la taille de la découpe, pour chaque chromosome de la population.
+    
+    Si la découpe est hors de la plage de recherche ]0, min(largeur, hauteur) / 2[, la fitness est de 0.
+    """
+    maximum_cutout_size = min(width, height) / 2.
+    cutout_size = population[:, 0]
+
+    volume = (width - 2. * cutout_size) * (height - 2. * cutout_size) * cutout_size
+    return np.where((0.0 < cutout_size) & (cutout_size < maximum_cutout_size), volume, 0.0)
+
+def open_box_problem(width : float = 10., height : float = 5.) -> ProblemDefinition:
+    """Retourne la définition du problème de la boîte ouverte pour une surface rectangulaire de taille donnée."""
+    domains = Domains(np.array([[0., min(width, height) / 2.]]), ('Size of cutout',))
+    return ProblemDefinition(domains, functools.partial(open_box_volume, width=width, height=height), ProblemDefinition.FitnessMode.BY_POPULATION)
+
+
+
+#    _   _       _                                                      _                                 _     _                
+#   | | | |_ __ | | ___ __   _____      ___ __    _ __  _   _ _ __ ___ | |__   ___ _ __   _ __  _ __ ___ | |__ | | ___ _ __ ___  
+#   | | | | '_ \| |/ / '_ \ / _ \ \ /\ / / '_ \  | '_ \| | | | '_ ` _ \| '_ \ / _ \ '__| | '_ \| '__/ _ \| '_ \| |/ _ \ '_ ` _ \ 
+#   | |_| | | | |   <| | | | (_) \ V  V /| | | | | | | | |_| | | | | | | |_) |  __/ |    | |_) | | | (_) | |_) | |  __/ | | | | |
+#    \___/|_| |_|_|\_\_| |_|\___/ \_/\_/ |_| |_| |_| |_|\__,_|_| |_| |_|_.__/ \___|_|    | .__/|_|  \___/|_.__/|_|\___|_| |_| |_|
+#                                                                                        |_|                                     
+def unknown_number_distance(population : NDArray, min_value : float, unknown_value : float, max_value : float) -> NDArray:
+    """Évalue toute la population à la fois. 
+    
+    La fitness est la distance entre la valeur recherchée et chaque chromosome, inversée en 
+    fonction de la distance maximale possible puisque la fonction objective doit être maximisée.
+    Si la valeur recherchée est hors de la plage de recherche, la fitness est de 0.
+    """
+    if not (min_value <= unknown_value <= max_value):
+        return np.zeros(population.shape[0])
+
+    maximum_distance = max(abs(min_value - unknown_value), abs(max_value - unknown_value))
+    current_value_estimation = population[:, 0]
+    return np.maximum(0., maximum_distance - np.abs(unknown_value - current_value_estimation))
+
+def unknown_number_problem(min_value : float = -1., unknown_value : float = 0., max_value : float = 1.) -> ProblemDefinition:
+    """Retourne la définition du problème de recherche d'un nombre réel inconnu dans l'intervalle [min_value, max_value]."""
+    max_value = max(min_value, max_value)
+    domains = Domains(np.array([[min_value, max_value]], dtype=np.float64), ('Valeur recherchée',))
+    return ProblemDefinition(domains, functools.partial(unknown_number_distance, min_value=min_value, unknown_value=unknown_value, max_value=max_value), ProblemDefinition.FitnessMode.BY_POPULATION)
+
+
+
+#    ____        _ _ _     _   _                        _     _                
+#   | __ )  __ _| | (_)___| |_(_) ___   _ __  _ __ ___ | |__ | | ___ _ __ ___  
+#   |  _ \ / _` | | | / __| __| |/ __| | '_ \| '__/ _ \| '_ \| |/ _ \ '_ ` _ \ 
+#   | |_) | (_| | | | \__ \ |_| | (__  | |_) | | | (_) | |_) | |  __/ | | | | |
+#   |____/ \__,_|_|_|_|___/\__|_|\___| | .__/|_|  \___/|_.__/|_|\___|_| |_| |_|
+#                                      |_|                                     
+def ballistic_domains() -> Domains:
+    """Retourne les domaines du problème balistique.
+    
+    Les gènes sont : la force de propulsion, le pourcentage de la trajectoire parcourue avant la 
+    détonation, l'angle de propulsion, la force de séparation (en pourcentage de la force initiale) 
+    et l'angle de séparation.
+    """
+    return Domains(np.array([[0., 150.], [0., 100.], [0., 360.], [0., 50.], [0., 180.]]),
+                   ('Force de propulsion',
+                    'Trajectoire parcourue en pourcentage avant la détonation',
+                    'Angle de propulsion',
+                    'Force de séparation en pourcentage de la force initiale',
+                    'Angle de sepération'))
+
+def ballistic_chromosome_fitness(chromosome : NDArray, batiments : IntervalIndex, proteges : IntervalIndex, launch_position : tuple[float, float], height : float, gravity : float, final_y : float, building_height : float) -> float:
+    """Évalue un seul chromosome avec la simulation scalaire (PhysSim). 
+    
+    Il s'agit de la fonction objective de référence de QBalisticProblem : ballistic_fitness doit 
+    retourner exactement les mêmes valeurs pour toute une population.
+    """
+    force_init = chromosome[0]
+    force_split = force_init * (chromosome[3] / 100.)
+    temps_split = PhysSim.time_at_yf(force_init * math.sin(math.radians(chromosome[2])), gravity, launch_position[1], 0) * chromosome[1] / 100.
+    coordo = (launch_position[0], height - launch_position[1])
+    impacts = np.asarray(PhysSim.get_final_coordinates_from_start_data(force_init, temps_split, coordo, chromosome[2], gravity, force_split, chromosome[4], 3, final_y)[1])
+    impacts = impacts[impacts[:, 1] <= height - building_height]
+    nb_protected = np.count_nonzero(proteges.contains(impacts[:, 0]))
+    # chaque bâtiment touché ne compte qu'une seule fois
+    touched = batiments.index(impacts[:, 0])
+    nb_target = np.unique(touched[touched >= 0]).size
+    if nb_target == 0 or nb_protected > 0:
+        return 0
+    return (nb_target * 1000) + ((150 + (150 * 50 / 100)) - (force_init + force_split))
+
+def ballistic_fitness(population : NDArray, batiments : IntervalIndex, proteges : IntervalIndex, launch_position : tuple[float, float], height : float, gravity : float, final_y : float, building_height : float) -> NDArray:
+    """Évalue toute la population à la fois.
+    
+    Les trois impacts de chaque chromosome sont calculés ensemble (N x 3), puis classés d'un seul 
+    appel contre les zones protégées et les bâtiments. Le nombre de bâtiments distincts touchés 
+    est obtenu en triant les 3 index de chaque ligne : un index compte s'il est valide et différent 
+    de son prédécesseur.
+    
+    La fitness vaut le nombre de cibles touchées * 1000 plus la force économisée, ou 0 si aucune 
+    cible n'est touchée ou si une zone protégée est touchée.
+    """
+    force_init = population[:, 0]
+    force_split = force_init * (population[:, 3] / 100.)
+    temps_split = PhysSim.time_at_yf_array(force_init * np.sin(np.radians(population[:, 2])), gravity, launch_position[1], 0) * population[:, 1] / 100.
+    coordo = (launch_position[0], height - launch_position[1])
+    impacts = PhysSim.get_final_coordinates_from_start_data_array(force_init, temps_split, coordo, population[:, 2], gravity, force_split, population[:, 4], final_y)[1]
+
+    below = impacts[..., 1] <= height - building_height
+    protected = np.any(below & proteges.contains(impacts[..., 0]), axis=1)
+    touched = np.sort(np.where(below, batiments.index(impacts[..., 0]), -1), axis=1)
+    nb_target = np.count_nonzero((touched >= 0) & np.concatenate((np.ones((touched.shape[0], 1), dtype=bool), touched[:, 1:] != touched[:, :-1]), axis=1), axis=1)
+
+    fitness = (nb_target * 1000) + ((150 + (150 * 50 / 100)) - (force_init + force_split))
+    return np.where((nb_target == 0) | protected, 0., fitness)
+
+def ballistic_problem(batiments : list | IntervalIndex, proteges : list | IntervalIndex, launch_position : tuple[float, float] = (25., 25.), height : float = 250., gravity : float = -9.81, final_y : float = 0., building_height : float = 10.) -> ProblemDefinition:
+    """Retourne la définition du problème balistique.
+    
+    Les bâtiments et les zones protégées sont donnés par des listes d'intervalles [début, fin] en x 
+    (ou directement par leur IntervalIndex). La position de lancement est mesurée à partir du haut 
+    de la zone, comme dans QBalisticProblem.
+    """
+    if not isinstance(batiments, IntervalIndex):
+        batiments = IntervalIndex(batiments)
+    if not isinstance(proteges, IntervalIndex):
+        proteges = IntervalIndex(proteges)
+    fitness = functools.partial(ballistic_fitness, batiments=batiments, proteges=proteges, launch_position=tuple(launch_position), height=height, gravity=gravity, final_y=final_y, building_height=building_height)
+    return ProblemDefinition(ballistic_domains(), fitness, ProblemDefinition.FitnessMode.BY_POPULATION)
+
+
+
+#    ____  _                                    _   _           _              
+#   / ___|| |__   __ _ _ __   ___    ___  _ __ | |_(_)_ __ ___ (_)_______ _ __ 
+#   \___ \| '_ \ / _` | '_ \ / _ \  / _ \| '_ \| __| | '_ ` _ \| |_  / _ \ '__|
+#    ___) | | | | (_| | |_) |  __/ | (_) | |_) | |_| | | | | | | |/ /  __/ |   
+#   |____/|_| |_|\__,_| .__/ \___|  \___/| .__/ \__|_|_| |_| |_|_/___\___|_|   
+#                     |_|                |_|                                   
+def _centered(points : list[tuple[float, float]], center : tuple[float, float]) -> NDArray:
+    return np.array(points, dtype=np.float64) - np.array(center, dtype=np.float64)
+
+# formes de base (sommets x, y) centrées sur leur point de référence
+SHAPE_OPTIMIZER_SHAPES = {
+    'Triangle' : _centered([(0., 0.), (0.5, -1.), (1., 0.)], (0.5, -0.334)),
+    'Etoile' : _centered([(0., -0.5), (0.4, -0.4), (0.5, 0.), (0.6, -0.4), (1., -0.5), (0.6, -0.6), (0.5, -1.), (0.4, -0.6)], (0.5, -0.5)),
+    'The U' : _centered([(0., 0.), (0., 1.), (1., 1.), (1., 0.), (5 / 6, 0.), (5 / 6, 5 / 6), (1 / 6, 5 / 6), (1 / 6, 0.)], (0.5, 52 / 125)),
+}
+
+def transform_polygons(polygon : NDArray, population : NDArray) -> NDArray:
+    """Applique à 'polygon' (V x 2) la transformation de chaque chromosome (translation x, translation y, rotation en degrés, homothétie).
+    
+    Retourne un tableau N x V x 2. La transformation est la même que QTransform().translate(tx, ty).rotate(a).scale(s, s) : 
+        x' = s (cos a x - sin a y) + tx
+        y' = s (sin a x + cos a y) + ty
+    """
+    angle = np.radians(population[:, 2])
+    cos = np.cos(angle)[:, None] * population[:, 3, None]
+    sin = np.sin(angle)[:, None] * population[:, 3, None]
+    x, y = polygon[:, 0], polygon[:, 1]
+    return np.stack((cos * x - sin * y + population[:, 0, None],
+                     sin * x + cos * y + population[:, 1, None]), axis=-1)
+
+def points_in_polygon(points : NDArray, polygon : NDArray) -> NDArray:
+    """Indique si chaque point (K x 2) est à l'intérieur du polygone (V x 2), selon la règle pair-impair.
+    
+    Un rayon horizontal est lancé vers la droite de chaque point : le point est à l'intérieur si le 
+    rayon croise un nombre impair d'arêtes.
+    """
+    px, py = points[:, 0], points[:, 1]
+    inside = np.zeros(points.shape[0], dtype=bool)
+    (ax, ay) = polygon[-1]
+    for (bx, by) in polygon:
+        straddles = (ay > py) != (by > py)
+        if ay != by:
+            inside ^= straddles & (px < ax + (py - ay) * (bx - ax) / (by - ay))
+        ax, ay = bx, by
+    return inside
+
+
+class ShapeDescriptor:
+    """Forme de base du problème d'optimisation de forme et ses invariants.
+    
+    Les transformations évaluées (translation, rotation et homothétie uniforme) conservent la forme : 
+    l'aire d'une forme transformée est l'aire de base multipliée par le carré de l'homothétie et tous 
+    ses sommets sont à une distance d'au plus 'radius' x homothétie de la translation. Ces invariants 
+    sont calculés une seule fois, à la création.
+    """
+    def __init__(self, vertices : NDArray) -> None:
+        self._vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        self._area = float(polygon_area(self._vertices))
+        self._radius = float(np.max(np.hypot(self._vertices[:, 0], self._vertices[:, 1])))
+
+    @property
+    def vertices(self) -> NDArray:
+        """Les sommets de la forme de base (V x 2), autour de son point de référence."""
+        return self._vertices
+
+    @property
+    def area(self) -> float:
+        """L'aire de la forme de base."""
+        return self._area
+
+    @property
+    def radius(self) -> float:
+        """Le rayon du cercle englobant la forme de base, centré sur son point de référence."""
+        return self._radius
+
+
+def shape_optimizer_fitness(population : NDArray, shape : ShapeDescriptor, obstacles : PointGrid, width : float, height : float) -> NDArray:
+    """Évalue toute la population à la fois.
+    
+    La fitness est l'aire de la forme transformée rapportée au canevas (multipliée par 10 000), ou 0 
+    si la forme contient un obstacle ou si sa boîte englobante sort du canevas [0, width] x [0, height].
+    
+    Les formes dont le cercle englobant est entièrement hors du canevas sont rejetées sans calculer 
+    leurs sommets. Seuls les obstacles situés dans la boîte englobante de chaque forme restante sont 
+    testés : ils sont obtenus de la grille 'obstacles', puis ramenés dans le repère de la forme de base 
+    (transformation inverse) pour être testés contre ses sommets.
+    """
+    translation_x, translation_y, angle, scale = population[:, 0], population[:, 1], np.radians(population[:, 2]), population[:, 3]
+    reach = shape.radius * scale
+    outside = (translation_x + reach < 0.) | (translation_y + reach < 0.) | (translation_x - reach > width) | (translation_y - reach > height)
+
+    valid = np.zeros(population.shape[0], dtype=bool)
+    candidates = np.flatnonzero(~outside)
+    polygons = transform_polygons(shape.vertices, population[candidates])
+    minimum, maximum = polygons.min(axis=1), polygons.max(axis=1)
+    in_canvas = (minimum[:, 0] >= 0.) & (minimum[:, 1] >= 0.) & (maximum[:, 0] <= width) & (maximum[:, 1] <= height)
+    valid[candidates] = in_canvas
+
+    candidates = candidates[in_canvas] # les collisions ne sont testées que pour les formes dans le canevas
+    if len(obstacles) and candidates.size:
+        box, point = obstacles.query(minimum[in_canvas], maximum[in_canvas])
+        chromosome = candidates[box]
+        dx = obstacles.points[point, 0] - translation_x[chromosome]
+        dy = obstacles.points[point, 1] - translation_y[chromosome]
+        cos, sin = np.cos(angle[chromosome]), np.sin(angle[chromosome])
+        local = np.stack((cos * dx + sin * dy, cos * dy - sin * dx), axis=1) / scale[chromosome, None]
+        valid[chromosome[points_in_polygon(local, shape.vertices)]] = False
+    return np.where(valid, shape.area * scale ** 2 / width * height * 10000, 0.)
+
+def shape_optimizer_domains(width : float, height : float) -> Domains:
+    """Retourne les domaines du problème d'optimisation de forme pour un canevas de taille donnée."""
+    return Domains(np.array([[0., width], [0., height], [0., 360.], [1., min(width, height)]]),
+                   ('Translation en X', 'Translation en Y', 'Rotation', 'Homéothétie'))
+
+def shape_optimizer_problem(shape : str | NDArray | ShapeDescriptor = 'Triangle', obstacles : int | NDArray | PointGrid = 25, width : float = 500., height : float = 250., seed : int | None = None) -> ProblemDefinition:
+    """Retourne la définition du problème d'optimisation de forme.
+    
+    La forme est le nom d'une forme de SHAPE_OPTIMIZER_SHAPES, ses sommets (V x 2) ou son 
+    ShapeDescriptor. Les obstacles sont donnés par leurs coordonnées (M x 2), par leur grille 
+    (PointGrid) ou par leur nombre : ils sont alors tirés aléatoirement sur la grille entière du 
+    canevas à partir de 'seed'.
+    """
+    if isinstance(shape, str):
+        shape = SHAPE_OPTIMIZER_SHAPES[shape]
+    if not isinstance(shape, ShapeDescriptor):
+        shape = ShapeDescriptor(shape)
+    if isinstance(obstacles, int):
+        obstacles = np.random.default_rng(seed).integers((0, 0), (int(width), int(height)), (obstacles, 2), endpoint=True)
+    if not isinstance(obstacles, PointGrid):
+        obstacles = PointGrid(obstacles)
+    fitness = functools.partial(shape_optimizer_fitness, shape=shape, obstacles=obstacles, width=width, height=height)
+    return ProblemDefinition(shape_optimizer_domains(width, height), fitness, ProblemDefinition.FitnessMode.BY_POPULATION)
@@ -0,0 +1,185 @@
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+from gacvm import CheckpointObserver, GeneticAlgorithm, History, Observer, ProblemDefinition, Parameters, StreamingHistory
+
+
+
+# Exécution d'un algorithme génétique en ligne de commande, sans Qt.
+#
+# Le problème et les paramètres sont décrits dans un fichier de configuration
+# JSON, par exemple :
+#
+#   {
+#       "problem" : {
+#           "factory" : "gaproblems:open_box_problem",
+#           "arguments" : { "width" : 10.0, "height" : 5.0 }
+#       },
+#       "parameters" : {
+#           "maximum_epoch" : 100,
+#           "population_size" : 20,
+#           "elitism_rate" : 0.1,
+#           "selection_rate" : 0.75,
+#           "mutation_rate" : 0.25,
+#           "seed" : 1,
+#           "mutation_strategy" : "ga_strategy_multi_mutation:MultiMutationStrategy",
+#           "evaluator" : { "class" : "gacvm:ProcessPoolEvaluator", "arguments" : { "max_workers" : 8 } }
+#       },
+#       "output" : "open_box_history.npz"
+#   }
+#
+# Les objets (fabrique de problème, stratégies, évaluateur) sont désignés par
+# 'module:nom'. Une stratégie ou un évaluateur peut être donné directement par
+# son nom ou par un dictionnaire { "class" : ..., "arguments" : {...} }.
+#
+# Utilisation :
+#
+#   python garun.py config.json [--output history.npz] [--quiet]
+#                               [--stream history.npy [--memory 1000]]
+#                               [--checkpoint run.ckpt [--checkpoint-period 100] [--resume]]
+#                               [--profile]
+#
+# Avec --stream, chaque époque est écrite au fil de l'évolution dans un fichier
+# .npy (voir StreamingHistory) et seules les dernières époques sont gardées en
+# mémoire : la mémoire utilisée ne dépend plus du nombre d'époques.
+#
+# Avec --checkpoint, l'état complet de l'évolution est enregistré périodiquement
+# (voir GeneticAlgorithm.save_checkpoint). Relancée avec --resume, une exécution
+# interrompue reprend du dernier point de reprise et produit exactement les
+# mêmes résultats que si elle n'avait jamais été interrompue.
+#
+# Avec --profile, le temps passé dans chaque phase de l'évolution (sélection,
+# croisement, mutation, évaluation, ...) est mesuré et résumé à la fin.
+#
+# Seuls NumPy et gacvm (ainsi que les modules nommés dans la configuration)
+# sont importés : aucune boucle d'événements ni affichage n'est requis.
+
+_PARAMETER_VALUES = ('maximum_epoch', 'population_size', 'elitism_rate', 'selection_rate', 'mutation_rate', 'fitness_cache_size', 'seed')
+_PARAMETER_OBJECTS = ('selection_strategy', 'crossover_strategy', 'mutation_strategy', 'evaluator')
+
+
+def load_object(reference : str):
+    """Retourne l'objet désigné par 'module:nom' (une classe, une fonction, ...)."""
+    module_name, separator, attribute_name = reference.partition(':')
+    if not separator or not module_name or not attribute_name:
+        raise ValueError(f'Invalid object reference "{reference}" : expected "module:name".')
+    return getattr(importlib.import_module(module_name), attribute_name)
+
+def _instantiate(description : str | dict):
+    """Instancie un objet décrit par 'module:Classe' ou par { "class" : "module:Classe", "arguments" : {...} }."""
+    if isinstance(description, str):
+        return load_object(description)()
+    return load_object(description['class'])(**description.get('arguments', {}))
+
+def build_problem_definition(configuration : dict) -> ProblemDefinition:
+    """Construit la définition du problème à partir de la section 'problem' de la configuration."""
+    problem = configuration['problem']
+    problem_definition = load_object(problem['factory'])(**problem.get('arguments', {}))
+    if not isinstance(problem_definition, ProblemDefinition):
+        raise ValueError(f'Invalid problem factory "{problem["factory"]}" : it must return a ProblemDefinition object.')
+    return problem_definition
+
+def build_parameters(configuration : dict) -> Parameters:
+    """Construit les paramètres de l'algorithme génétique à partir de la section 'parameters' de la configuration.
+
+    Les paramètres absents conservent leur valeur par défaut.
+    """
+    values = configuration.get('parameters', {})
+    unknown = set(values) - set(_PARAMETER_VALUES) - set(_PARAMETER_OBJECTS)
+    if unknown:
+        raise ValueError(f'Invalid parameters in configuration : {", ".join(sorted(unknown))}.')
+
+    parameters = Parameters()
+    for name in _PARAMETER_OBJECTS:
+        if name in values:
+            setattr(parameters, name, _instantiate(values[name]))
+    for name in _PARAMETER_VALUES:
+        if name in values:
+            setattr(parameters, name, values[name])
+    return parameters
+
+
+class ProgressObserver(Observer):
+    """Affiche périodiquement la progression de l'évolution dans la console."""
+    def __init__(self, period : float = 1.0, stream=sys.stderr) -> None:
+        self._period = period
+        self._stream = stream
+        self._last_display = 0.
+
+    def update(self, engine):
+        now = time.perf_counter()
+        if now - self._last_display >= self._period or engine.has_evolved:
+            self._last_display = now
+            print(f'Epoch {engine.current_epoch + 1} of {engine.parameters.maximum_epoch} : best fitness {engine.history.best_fitness:0.6f}', file=self._stream)
+
+
+def run(configuration : dict, observers : list[Observer] = (), history : History | None = None, checkpoint : str | None = None, profiling : bool = False) -> GeneticAlgorithm:
+    """Résout le problème décrit par la configuration et retourne le moteur une fois l'évolution terminée.
+
+    Un historique particulier (par exemple un StreamingHistory) peut être donné au moteur. Si 
+    'checkpoint' désigne un point de reprise, l'évolution reprend à partir de celui-ci (les paramètres 
+    et l'historique du point de reprise remplacent alors ceux de la configuration).
+    """
+    ga = GeneticAlgorithm(build_problem_definition(configuration), build_parameters(configuration))
+    if history is not None:
+        ga.history = history
+    if checkpoint is not None:
+        ga.load_checkpoint(checkpoint)
+    ga.profiling = profiling
+    for observer in observers:
+        ga.add_observer(observer)
+    try:
+        ga.evolve()
+    finally:
+        ga.parameters.evaluator.close()
+    return ga
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Exécute un algorithme génétique sans interface graphique.')
+    parser.add_argument('configuration', help='fichier de configuration JSON (problème, paramètres et sortie)')
+    parser.add_argument('-o', '--output', help='fichier .npz où écrire l\'historique (remplace "output" de la configuration)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='n\'affiche pas la progression')
+    parser.add_argument('-s', '--stream', help='fichier .npy où écrire chaque époque au fil de l\'évolution (mémoire bornée)')
+    parser.add_argument('-m', '--memory', type=int, default=1000, help='nombre d\'époques gardées en mémoire avec --stream')
+    parser.add_argument('-c', '--checkpoint', help='fichier où enregistrer périodiquement un point de reprise')
+    parser.add_argument('--checkpoint-period', type=int, default=100, help='nombre d\'époques entre deux points de reprise')
+    parser.add_argument('-r', '--resume', action='store_true', help='reprend l\'évolution du point de reprise (s\'il existe)')
+    parser.add_argument('-p', '--profile', action='store_true', help='mesure et affiche le temps passé dans chaque phase de l\'évolution')
+    arguments = parser.parse_args()
+
+    with open(arguments.configuration, encoding='utf-8') as file:
+        configuration = json.load(file)
+
+    start = time.perf_counter()
+    if arguments.resume and not arguments.checkpoint:
+        parser.error('--resume requires --checkpoint')
+
+    history = StreamingHistory(arguments.stream, arguments.memory) if arguments.stream else None
+    observers = [] if arguments.quiet else [ProgressObserver()]
+    if arguments.checkpoint:
+        observers.append(CheckpointObserver(arguments.checkpoint, arguments.checkpoint_period))
+    resume_from = arguments.checkpoint if arguments.resume and os.path.exists(arguments.checkpoint) else None
+    ga = run(configuration, observers, history, resume_from, arguments.profile)
+    elapsed = time.perf_counter() - start
+
+    output = arguments.output or configuration.get('output')
+    if output:
+        ga.history.save(output)
+
+    print(f'Epochs        : {ga.history.count}')
+    print(f'Elapsed time  : {elapsed:0.3f} s')
+    print(f'Best fitness  : {ga.history.best_fitness}')
+    print(f'Best solution : {ga.history.best_solution.tolist()}')
+
+    if ga.profiling:
+        print(f'Evaluations   : {int(ga.profile.evaluations.sum())}')
+        for row in ga.profile.summary():
+            print(f'    {row["phase"]:<11} {row["strategy"]:<20} {row["total (s)"]:>10.4f} s {row["per epoch (us)"]:>12.1f} us/epoch {row["share (%)"]:>6.1f} %')
+
+if __name__ == '__main__':
+    main()
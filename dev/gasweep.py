@@ -0,0 +1,253 @@
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from gacvm import GeneticAlgorithm
+from garun import build_parameters, build_problem_definition
+
+
+
+# Recherche d'hyperparamètres (Parameters) par grille ou par tirages aléatoires,
+# exécutée dans un bassin de processus, avec élimination progressive
+# (successive halving) des configurations les moins performantes.
+#
+# Le problème et les paramètres de base sont décrits comme pour garun ; l'espace
+# de recherche donne, pour chaque paramètre à faire varier, la liste de ses
+# valeurs possibles (une stratégie est désignée par 'module:Classe') ou, pour
+# une recherche aléatoire, une loi de tirage :
+#
+#   {
+#       "problem" : { "factory" : "gaproblems:shape_optimizer_problem", "arguments" : { "seed" : 1 } },
+#       "parameters" : { "maximum_epoch" : 300 },
+#       "space" : {
+#           "population_size" : [20, 50, 100],
+#           "mutation_rate" : { "uniform" : [0.05, 0.5] },
+#           "mutation_strategy" : ["gacvm:GeneMutationStrategy", "ga_strategy_multi_mutation:MultiMutationStrategy"]
+#       },
+#       "search" : { "random" : 30 },
+#       "repeats" : 3,
+#       "halving" : { "eta" : 3, "rungs" : 3 },
+#       "threshold" : 80000000.0,
+#       "output" : "sweep.csv"
+#   }
+#
+# Avec "halving", chaque configuration est d'abord évoluée sur une fraction de
+# maximum_epoch ; seul le meilleur tiers (1 / eta) est poursuivi au palier
+# suivant, jusqu'à maximum_epoch. Une configuration poursuivie reprend de son
+# point de reprise (voir GeneticAlgorithm.save_checkpoint) : ses résultats sont
+# identiques à ceux d'une évolution complète d'un seul trait.
+#
+# Utilisation :
+#
+#   python gasweep.py sweep.json [--workers 8] [--output sweep.csv]
+#
+# Le tableau produit (au format CSV, sur la sortie standard si aucun fichier
+# n'est donné) contient une ligne par configuration : les valeurs des
+# paramètres, le dernier palier atteint, le nombre d'époques, la meilleure
+# fitness finale (moyenne et écart type sur les répétitions), le nombre
+# d'époques pour atteindre le seuil (moyenne, si toutes les répétitions
+# l'atteignent) et le temps d'exécution total.
+
+
+
+#    ____                      _       ____                       
+#   / ___|  ___  __ _ _ __ ___| |__   / ___| _ __   __ _  ___ ___ 
+#   \___ \ / _ \/ _` | '__/ __| '_ \  \___ \| '_ \ / _` |/ __/ _ \
+#    ___) |  __/ (_| | | | (__| | | |  ___) | |_) | (_| | (_|  __/
+#   |____/ \___|\__,_|_|  \___|_| |_| |____/| .__/ \__,_|\___\___|
+#                                           |_|                   
+def grid_configurations(space : dict) -> list[dict]:
+    """Retourne toutes les combinaisons des valeurs de l'espace de recherche (chaque valeur doit être une liste)."""
+    for name, values in space.items():
+        if not isinstance(values, list) or not values:
+            raise ValueError(f'Invalid search space for "{name}" : a grid search requires a non empty list of values.')
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+def random_configurations(space : dict, count : int, seed : int | None = None) -> list[dict]:
+    """
+    Tire 'count' configurations de l'espace de recherche. Chaque paramètre est décrit par :
+        - une liste : une valeur tirée uniformément parmi la liste
+        - { "uniform" : [a, b] } : un réel tiré uniformément dans [a, b[
+        - { "log_uniform" : [a, b] } : un réel dont le logarithme est tiré uniformément (a et b positifs)
+        - { "integers" : [a, b] } : un entier tiré uniformément dans [a, b]
+    """
+    rng = np.random.default_rng(seed)
+    configurations = [{} for _ in range(count)]
+    for name, law in space.items():
+        if isinstance(law, list) and law:
+            values = [law[index] for index in rng.integers(0, len(law), count)]
+        elif isinstance(law, dict) and len(law) == 1:
+            kind, (low, high) = next(iter(law.items()))
+            if kind == 'uniform':
+                values = rng.uniform(low, high, count).tolist()
+            elif kind == 'log_uniform':
+                values = np.exp(rng.uniform(math.log(low), math.log(high), count)).tolist()
+            elif kind == 'integers':
+                values = rng.integers(low, high, count, endpoint=True).tolist()
+            else:
+                raise ValueError(f'Invalid search space for "{name}" : unknown law "{kind}".')
+        else:
+            raise ValueError(f'Invalid search space for "{name}" : expected a list of values or a law such as {{"uniform" : [a, b]}}.')
+        for configuration, value in zip(configurations, values):
+            configuration[name] = value
+    return configurations
+
+
+
+#    _____     _       _ 
+#   |_   _| __(_) __ _| |
+#     | || '__| |/ _` | |
+#     | || |  | | (_| | |
+#     |_||_|  |_|\__,_|_|
+#                        
+def _run_trial(configuration : dict, budget : int, checkpoint : str, resume : bool, threshold : float | None) -> dict:
+    """
+    Évolue un essai (une configuration et un germe) jusqu'à 'budget' époques, en reprenant au besoin
+    de son point de reprise, puis enregistre un nouveau point de reprise. Exécutée dans un processus du bassin.
+    """
+    start = time.perf_counter()
+    ga = GeneticAlgorithm(build_problem_definition(configuration), build_parameters(configuration))
+    if resume:
+        ga.load_checkpoint(checkpoint)
+    try:
+        while ga.current_epoch < budget - 1 and not ga.has_evolved:
+            ga.evolve_one()
+    finally:
+        ga.parameters.evaluator.close()
+    ga.save_checkpoint(checkpoint)
+
+    best = np.append(ga.history.history[:, 0], ga.history.best_fitness) # history exclut la dernière époque
+    reached = np.flatnonzero(best >= threshold) if threshold is not None else np.empty(0)
+    return {'epochs' : ga.history.count,
+            'best fitness' : float(ga.history.best_fitness),
+            'epochs to threshold' : int(reached[0]) if reached.size else None,
+            'time' : time.perf_counter() - start}
+
+
+
+#    ____                         
+#   / ___|_      _____  ___ _ __  
+#   \___ \ \ /\ / / _ \/ _ \ '_ \ 
+#    ___) \ V  V /  __/  __/ |_) |
+#   |____/ \_/\_/ \___|\___| .__/ 
+#                          |_|    
+def halving_budgets(maximum_epoch : int, eta : int = 3, rungs : int = 3) -> list[int]:
+    """Retourne le nombre d'époques de chaque palier : maximum_epoch / eta ** (rungs - 1), ..., maximum_epoch / eta, maximum_epoch."""
+    if eta < 2 or rungs < 1:
+        raise ValueError('Invalid input parameters in halving_budgets : eta must be at least 2 and rungs at least 1.')
+    return sorted({max(2, round(maximum_epoch / eta ** rung)) for rung in range(rungs)})
+
+def sweep(configuration : dict, configurations : list[dict], repeats : int = 1, seed : int = 0,
+          eta : int = 3, rungs : int = 1, threshold : float | None = None,
+          max_workers : int | None = None, checkpoint_directory : str | None = None) -> list[dict]:
+    """
+    Évalue chaque configuration de paramètres et retourne le tableau des résultats, trié de la
+    meilleure à la pire configuration (meilleure fitness moyenne au dernier palier atteint).
+
+    Args:
+        configuration (dict): La configuration de base (problème et paramètres, comme pour garun).
+        configurations (list of dict): Les valeurs de paramètres de chaque configuration à évaluer.
+        repeats (int): Le nombre d'essais (germes seed, seed + 1, ...) de chaque configuration.
+        seed (int): Le germe du premier essai.
+        eta (int): Seule la meilleure fraction 1 / eta des configurations passe au palier suivant.
+        rungs (int): Le nombre de paliers (1 : toutes les configurations sont évoluées jusqu'au bout).
+        threshold (float, optional): Seuil de fitness pour mesurer le nombre d'époques nécessaire pour l'atteindre.
+        max_workers (int, optional): Le nombre de processus (par défaut, le nombre de coeurs).
+        checkpoint_directory (str, optional): Répertoire des points de reprise (par défaut, un répertoire temporaire).
+
+    Returns:
+        list of dict: Une ligne par configuration.
+    """
+    base_parameters = configuration.get('parameters', {})
+    budgets = halving_budgets(build_parameters(configuration).maximum_epoch, eta, rungs)
+    trials = [[dict(configuration, parameters={**base_parameters, **values, 'seed' : seed + repeat}) for repeat in range(repeats)]
+              for values in configurations]
+    results = [{'rung' : 0, 'epochs' : 0, 'scores' : [], 'reached' : [], 'time' : 0.} for _ in configurations]
+
+    with tempfile.TemporaryDirectory() as temporary_directory, ProcessPoolExecutor(max_workers) as executor:
+        directory = checkpoint_directory or temporary_directory
+        os.makedirs(directory, exist_ok=True)
+        checkpoint = lambda index, repeat : os.path.join(directory, f'trial_{index}_{repeat}.ckpt')
+
+        survivors = list(range(len(configurations)))
+        for rung, budget in enumerate(budgets):
+            futures = {(index, repeat) : executor.submit(_run_trial, trials[index][repeat], budget, checkpoint(index, repeat), rung > 0, threshold)
+                       for index in survivors for repeat in range(repeats)}
+            for index in survivors:
+                trial_results = [futures[index, repeat].result() for repeat in range(repeats)]
+                results[index].update(rung=rung + 1, epochs=trial_results[0]['epochs'],
+                                      scores=[result['best fitness'] for result in trial_results],
+                                      reached=[result['epochs to threshold'] for result in trial_results])
+                results[index]['time'] += sum(result['time'] for result in trial_results)
+
+            if rung < len(budgets) - 1:
+                survivors.sort(key=lambda index : -np.mean(results[index]['scores']))
+                survivors = survivors[:max(1, math.ceil(len(survivors) / eta))]
+
+    rows = []
+    for index, (values, result) in enumerate(zip(configurations, results)):
+        reached = result['reached']
+        rows.append({'configuration' : index,
+                     **values,
+                     'rung' : result['rung'],
+                     'epochs' : result['epochs'],
+                     'best fitness' : float(np.mean(result['scores'])),
+                     'best fitness std' : float(np.std(result['scores'])),
+                     'epochs to threshold' : float(np.mean(reached)) if reached and None not in reached else None,
+                     'time (s)' : result['time']})
+    rows.sort(key=lambda row : (-row['rung'], -row['best fitness']))
+    return rows
+
+def write_csv(rows : list[dict], stream) -> None:
+    """Écrit le tableau des résultats au format CSV dans un flux (fichier ouvert avec newline='', sys.stdout, ...)."""
+    writer = csv.DictWriter(stream, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recherche d\'hyperparamètres pour un algorithme génétique.')
+    parser.add_argument('configuration', help='fichier de configuration JSON (problème, paramètres de base, espace de recherche)')
+    parser.add_argument('-o', '--output', help='fichier .csv où écrire le tableau des résultats (remplace "output" de la configuration)')
+    parser.add_argument('-w', '--workers', type=int, help='nombre de processus (par défaut, le nombre de coeurs)')
+    parser.add_argument('--checkpoints', help='répertoire où conserver les points de reprise des essais')
+    arguments = parser.parse_args()
+
+    with open(arguments.configuration, encoding='utf-8') as file:
+        configuration = json.load(file)
+
+    space = configuration.get('space', {})
+    search = configuration.get('search', 'grid')
+    if search == 'grid':
+        configurations = grid_configurations(space)
+    elif isinstance(search, dict) and 'random' in search:
+        configurations = random_configurations(space, search['random'], configuration.get('seed', 0))
+    else:
+        raise ValueError(f'Invalid search "{search}" : expected "grid" or {{"random" : count}}.')
+    halving = configuration.get('halving', {})
+
+    rows = sweep(configuration, configurations,
+                 repeats=configuration.get('repeats', 1), seed=configuration.get('seed', 0),
+                 eta=halving.get('eta', 3), rungs=halving.get('rungs', 1), threshold=configuration.get('threshold'),
+                 max_workers=arguments.workers, checkpoint_directory=arguments.checkpoints)
+
+    output = arguments.output or configuration.get('output')
+    if output:
+        with open(output, 'w', newline='', encoding='utf-8') as stream:
+            write_csv(rows, stream)
+    else:
+        write_csv(rows, sys.stdout)
+
+if __name__ == '__main__':
+    main()
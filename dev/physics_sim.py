@@ -159,3 +159,61 @@ class PhysSim:
                                       final_objects_time_coordinates[0], speed_all_objects_after_split,
                                       final_objects_time_coordinates[1], iteration_time, nb_object_split)
 
+    # Versions vectorielles : chaque argument scalaire du calcul d'un projectile
+    # devient un tableau NumPy de N configurations de lancement. Les opérations
+    # sont effectuées dans le même ordre que les versions scalaires.
+
+    @staticmethod
+    def time_at_yf_array(viy: np.ndarray, a: float, yi: np.ndarray | float, yf: float):
+        vf2 = viy ** 2 + 2 * a * (yf - yi)
+        return (-viy - np.sqrt(vf2)) / a
+
+    @staticmethod
+    def v_split_new_projectiles_array(split_angle: np.ndarray, vi: np.ndarray):
+        # vi : (N, 2), retourne les vitesses des 3 projectiles (N, 3, 2)
+        vix, viy = vi[:, 0], vi[:, 1]
+        c = ((vix ** 2) + (viy ** 2)) ** 0.5
+        angle_origin_vector = np.arctan2(viy, vix)
+        split_angle_rad = np.radians(split_angle)
+
+        speeds = np.empty((vi.shape[0], 3, 2))
+        speeds[:, 0, 0] = vix
+        speeds[:, 0, 1] = viy
+        speeds[:, 1, 0] = c * np.cos(split_angle_rad + angle_origin_vector)
+        speeds[:, 1, 1] = c * np.sin(split_angle_rad + angle_origin_vector)
+        speeds[:, 2, 0] = c * np.cos(angle_origin_vector - split_angle_rad)
+        speeds[:, 2, 1] = c * np.sin(angle_origin_vector - split_angle_rad)
+        return speeds
+
+    @staticmethod
+    def get_final_coordinates_projectile_array(all_object_speeds: np.ndarray, g: float, coordo_ini: np.ndarray,
+                                               final_pos_y: float):
+        # all_object_speeds : (N, P, 2), coordo_ini : (N, 2)
+        # retourne les temps d'impact (N, P) et les points d'impact (N, P, 2)
+        time_at_y0 = PhysSim.time_at_yf_array(all_object_speeds[..., 1], g, coordo_ini[:, 1, None], final_pos_y)
+        all_coordo = np.empty(all_object_speeds.shape)
+        all_coordo[..., 0] = PhysSim.position(coordo_ini[:, 0, None], all_object_speeds[..., 0], 0, time_at_y0)
+        all_coordo[..., 1] = final_pos_y
+        return time_at_y0, all_coordo
+
+    @staticmethod
+    def get_final_coordinates_from_start_data_array(initial_speed: np.ndarray, time_to_split: np.ndarray,
+                                                    coordo_init: FloatTuple, initial_angle: np.ndarray, g: float,
+                                                    split_force: np.ndarray, split_angle: np.ndarray,
+                                                    final_pos_y: float):
+        # équivalent de get_final_coordinates_from_start_data pour N lancements à la fois
+        # retourne les temps d'impact (N, 3) et les points d'impact (N, 3, 2)
+        angle_rad = np.radians(initial_angle)
+        vix = initial_speed * np.cos(angle_rad)
+        viy = initial_speed * np.sin(angle_rad)
+
+        coordo_at_split = np.empty((initial_speed.shape[0], 2))
+        coordo_at_split[:, 0] = PhysSim.position(coordo_init[0], vix, 0, time_to_split)
+        coordo_at_split[:, 1] = PhysSim.position(coordo_init[1], viy, g, time_to_split)
+
+        speed_at_split = (PhysSim.final_speed_1d(vix, 0, time_to_split), PhysSim.final_speed_1d(viy, g, time_to_split))
+        speed_ref_after_split = np.stack(PhysSim.split_impulsion_finale(speed_at_split, split_force), axis=1)
+        speed_all_objects_after_split = PhysSim.v_split_new_projectiles_array(split_angle, speed_ref_after_split)
+
+        return PhysSim.get_final_coordinates_projectile_array(speed_all_objects_after_split, g, coordo_at_split,
+                                                              final_pos_y)
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 
 #    __  __       _   _             _   _ _ _ _   _           
 #   |  \/  | __ _| |_| |__    _   _| |_(_) (_) |_(_) ___  ___ 
@@ -11,3 +14,117 @@ def clamp(minimum, value, maximum):
     return max(minimum, min(value, maximum))
 
 
+
+def polygon_area(polygons):
+    '''Retourne l'aire d'un polygone (N x 2) ou de chaque polygone d'un lot (B x N x 2).
+
+    L'aire est calculée par intégration trapézoïdale autour de la forme (formule du lacet). Le 
+    résultat ne dépend pas de l'orientation des sommets.
+    '''
+    polygons = np.asarray(polygons, dtype=np.float64)
+    x, y = polygons[..., 0], polygons[..., 1]
+    x_previous, y_previous = np.roll(x, 1, axis=-1), np.roll(y, 1, axis=-1)
+    return np.abs(np.sum((x - x_previous) * (y + y_previous) / 2., axis=-1))
+
+def polygon_perimeter(polygons):
+    '''Retourne le périmètre d'un polygone (N x 2) ou de chaque polygone d'un lot (B x N x 2), arête de fermeture comprise.'''
+    polygons = np.asarray(polygons, dtype=np.float64)
+    edges = polygons - np.roll(polygons, 1, axis=-2)
+    return np.sum(np.hypot(edges[..., 0], edges[..., 1]), axis=-1)
+
+
+class IntervalIndex:
+    '''Index d'intervalles fermés [début, fin] répondant à « quel intervalle contient x » par recherche dichotomique.
+
+    Les intervalles ne doivent pas se chevaucher, sauf à leurs bornes. Les bornes sont incluses : 
+    lorsque x est sur une borne commune à deux intervalles, l'intervalle débutant en x est retourné. 
+    Les requêtes acceptent un scalaire ou un tableau de coordonnées et retournent la position de 
+    l'intervalle dans la séquence d'origine, ou -1 si x n'est dans aucun intervalle.
+    '''
+    def __init__(self, intervals):
+        intervals = np.asarray(intervals, dtype=np.float64).reshape(-1, 2)
+        self._order = np.argsort(intervals[:, 0], kind='stable')
+        self._starts = intervals[self._order, 0]
+        self._ends = intervals[self._order, 1]
+
+    def __len__(self):
+        return self._starts.size
+
+    def index(self, x):
+        '''Retourne l'index de l'intervalle contenant chaque x, ou -1.'''
+        x = np.asarray(x, dtype=np.float64)
+        if self._starts.size == 0:
+            return np.full(x.shape, -1, dtype=np.intp)
+        position = np.searchsorted(self._starts, x, side='right') - 1
+        candidate = np.maximum(position, 0)
+        inside = (position >= 0) & (x <= self._ends[candidate])
+        return np.where(inside, self._order[candidate], -1)
+
+    def contains(self, x):
+        '''Retourne True pour chaque x situé dans un intervalle.'''
+        return self.index(x) >= 0
+
+
+class PointGrid:
+    '''Index de points 2D sur une grille uniforme répondant à « quels points sont dans la boîte [minimum, maximum] ».
+
+    Les points sont triés par cellule de la grille (ligne par ligne) : les points des cellules 
+    consécutives d'une ligne sont contigus. Une requête visite une suite contiguë de points par 
+    ligne de la grille chevauchée par la boîte plutôt que tous les points. La taille de cellule par 
+    défaut donne environ deux points par cellule. Les bornes des boîtes sont incluses.
+    '''
+    def __init__(self, points, cell_size=None):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._original = points
+        self._origin = points.min(axis=0) if points.size else np.zeros(2)
+        extent = np.maximum(points.max(axis=0) - self._origin, 1.) if points.size else np.ones(2)
+        if cell_size is None:
+            cell_size = np.sqrt(extent[0] * extent[1] * 2. / max(points.shape[0], 1))
+        self._cell_size = float(cell_size)
+
+        # la forme est déduite des cellules elles-mêmes : extent // cell_size peut différer de 
+        # l'arrondi inférieur de _cell_of pour les points de la bordure supérieure
+        cells = self._cell_of(points)
+        self._shape = cells.max(axis=0) + 1 if points.size else np.ones(2, dtype=np.intp) # colonnes, lignes
+        cell_index = cells[:, 1] * self._shape[0] + cells[:, 0]
+        self._order = np.argsort(cell_index, kind='stable')
+        self._points = points[self._order]
+        self._cell_start = np.searchsorted(cell_index[self._order], np.arange(self._shape[0] * self._shape[1] + 1))
+
+    def _cell_of(self, points):
+        return np.floor((points - self._origin) / self._cell_size).astype(np.intp)
+
+    def __len__(self):
+        return self._points.shape[0]
+
+    @property
+    def points(self):
+        '''Retourne les points indexés, dans leur ordre d'origine.'''
+        return self._original
+
+    def query(self, minimum, maximum):
+        '''Retourne les paires (index de boîte, index de point) de chaque point situé dans chacune des N boîtes [minimum, maximum] (N x 2 chacun).'''
+        minimum = np.asarray(minimum, dtype=np.float64).reshape(-1, 2)
+        maximum = np.asarray(maximum, dtype=np.float64).reshape(-1, 2)
+        first, last = self._cell_of(minimum), self._cell_of(maximum)
+        empty = np.any((last < 0) | (first >= self._shape), axis=1)
+        first = np.clip(first, 0, self._shape - 1)
+        last = np.clip(last, 0, self._shape - 1)
+
+        # une suite contiguë de points par boîte et par ligne de la grille
+        rows_per_box = np.where(empty, 0, last[:, 1] - first[:, 1] + 1)
+        box = np.repeat(np.arange(minimum.shape[0]), rows_per_box)
+        row = first[box, 1] + _ranks(rows_per_box)
+        start = self._cell_start[row * self._shape[0] + first[box, 0]]
+        stop = self._cell_start[row * self._shape[0] + last[box, 0] + 1]
+
+        lengths = stop - start
+        box = np.repeat(box, lengths)
+        point = np.repeat(start, lengths) + _ranks(lengths)
+        inside = np.all((self._points[point] >= minimum[box]) & (self._points[point] <= maximum[box]), axis=1)
+        return box[inside], self._order[point[inside]]
+
+def _ranks(counts):
+    '''Retourne 0, 1, ..., count - 1 pour chaque count, concaténés.'''
+    ends = np.cumsum(counts)
+    return np.arange(ends[-1] if ends.size else 0) - np.repeat(ends - counts, counts)
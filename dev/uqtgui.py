@@ -6,11 +6,11 @@
 #                                                              
 
 
-import math
+import numpy as np
 import umath
 
 from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QPolygonF, QVector2D
+from PySide6.QtGui import QPolygonF
 from __feature__ import snake_case, true_property
 
 
@@ -38,31 +38,31 @@ from __feature__ import snake_case, true_property
 #     return abs(area)
 
 
+def polygon_to_array(polygon):
+    '''Retourne les sommets d'un QPolygonF dans un tableau NumPy (N x 2).'''
+    return np.array([(point.x(), point.y()) for point in polygon], dtype=np.float64).reshape(-1, 2)
+
 def process_perimeter(rect_or_polygon):
+    '''Retourne le périmètre d'un QRectF, d'un QPolygonF ou de polygones NumPy (N x 2 ou B x N x 2, voir umath.polygon_perimeter).'''
     if isinstance(rect_or_polygon, QRectF):
         return 2. * (rect_or_polygon.width() + rect_or_polygon.height())
     elif isinstance(rect_or_polygon, QPolygonF):
-        perimeter = 0.
-        prev_index = rect_or_polygon.size() - 1
-        for cur_index in range(rect_or_polygon.size()):
-            perimeter += QVector2D(rect_or_polygon[cur_index] - rect_or_polygon[prev_index]).length()
-            prev_index = cur_index
-        return perimeter
+        return float(umath.polygon_perimeter(polygon_to_array(rect_or_polygon)))
+    elif isinstance(rect_or_polygon, np.ndarray):
+        return umath.polygon_perimeter(rect_or_polygon)
     else:
-        raise TypeError(f'process_perimeter() expects a QRectF or a QPolygonF, not a {type(rect_or_polygon)}')
+        raise TypeError(f'process_perimeter() expects a QRectF, a QPolygonF or a NumPy array, not a {type(rect_or_polygon)}')
 
 def process_area(rect_or_polygon):
+    '''Retourne l'aire d'un QRectF, d'un QPolygonF ou de polygones NumPy (N x 2 ou B x N x 2, voir umath.polygon_area).'''
     if isinstance(rect_or_polygon, QRectF):
         return rect_or_polygon.width() * rect_or_polygon.height()
     elif isinstance(rect_or_polygon, QPolygonF):
-        area = 0.
-        prev_index = rect_or_polygon.size() - 1
-        for cur_index in range(rect_or_polygon.size()):
-            area += (rect_or_polygon[cur_index].x() - rect_or_polygon[prev_index].x()) * (rect_or_polygon[cur_index].y() + rect_or_polygon[prev_index].y()) / 2.0; # trapezoidal integration around the shape
-            prev_index = cur_index
-        return abs(area)
+        return float(umath.polygon_area(polygon_to_array(rect_or_polygon)))
+    elif isinstance(rect_or_polygon, np.ndarray):
+        return umath.polygon_area(rect_or_polygon)
     else:
-        raise TypeError(f'process_area() expects a QRectF or a QPolygonF, not a {type(rect_or_polygon)}')
+        raise TypeError(f'process_area() expects a QRectF, a QPolygonF or a NumPy array, not a {type(rect_or_polygon)}')
 
 
 